@@ -13,7 +13,9 @@
         'liveag_muk_rest',
         'liveag_consignment',
     ],
-    'data': [],
+    'data': [
+        'security/ir.model.access.csv',
+    ],
     'installable': True,
     'application': True,
     'auto_install': False,
@@ -13,12 +13,12 @@ from odoo.addons.liveag_api.tools.liveag import (
     serialize_contract_preview,
     serialize_contract_detailed,
     serialize_contract_editable,
-    serialize_reps_for_contract,
     serialize_contact_basic_info,
     serialize_contact_buyer,
     serialize_contact_seller,
     serialize_contact_rep,
 )
+from odoo.addons.liveag_api.tools.streaming import stream_format, stream_records
 
 import json
 import datetime
@@ -301,12 +301,16 @@ class LiveAgController(http.Controller):
                 ('name', 'ilike', 'Buyer')
             ])
             
-            if contact_types:
-                contacts = request.env['res.partner'].search([
-                    ('contact_type_ids', 'in', contact_types.ids)
-                ])
-                
-                for contact in contacts:
+            if not contact_types:
+                return request.make_json_response(clients)
+
+            contacts = request.env['res.partner'].search([
+                ('contact_type_ids', 'in', contact_types.ids)
+            ])
+
+            def serialize_clients(batch):
+                clients = []
+                for contact in batch:
                     client = serialize_contact_basic_info(contact)
                     
                     # Check contact types properly by iterating through them
@@ -320,8 +324,9 @@ class LiveAgController(http.Controller):
                         client.update(serialize_contact_rep(contact))
                         
                     clients.append(client)
+                return clients
             
-            return request.make_json_response(clients)
+            return stream_records(contacts, serialize_clients, fmt=stream_format())
             
         elif request.httprequest.method == 'POST':
             try:
@@ -1903,32 +1908,34 @@ class LiveAgController(http.Controller):
                     contract_list = []
                     Contract = request.env['consignment.contract']
                     
-                    if use_pagination:
-                        # Paginated response
-                        total_count = Contract.search_count(domain)
-                        contracts = Contract.search(domain, limit=per_page, offset=offset, order='create_date desc')
-                        total_pages = (total_count + per_page - 1) // per_page
-                    else:
-                        # Non-paginated response (backward compatibility)
+                    if not use_pagination:
+                        # Non-paginated response (backward compatibility), streamed in batches
                         contracts = Contract.search(domain, order='create_date desc')
+                        return stream_records(
+                            contracts,
+                            lambda batch: [serialize_contract_preview(contract) for contract in batch],
+                            fmt=stream_format(),
+                        )
+
+                    # Paginated response
+                    total_count = Contract.search_count(domain)
+                    contracts = Contract.search(domain, limit=per_page, offset=offset, order='create_date desc')
+                    total_pages = (total_count + per_page - 1) // per_page
                     
                     for contract in contracts:
                         contract_data = serialize_contract_preview(contract)
                         contract_list.append(contract_data)
                     
-                    if use_pagination:
-                        return request.make_json_response({
-                            'contracts': contract_list,
-                            'pagination': {
-                                'page': page,
-                                'per_page': per_page,
-                                'total_count': total_count,
-                                'total_pages': total_pages
-                            },
-                            'success': True
-                        })
-                    else:
-                        return request.make_json_response(contract_list)
+                    return request.make_json_response({
+                        'contracts': contract_list,
+                        'pagination': {
+                            'page': page,
+                            'per_page': per_page,
+                            'total_count': total_count,
+                            'total_pages': total_pages
+                        },
+                        'success': True
+                    })
                 except Exception as e:
                     _logger.error("Error getting contracts for admin role: %s", str(e))
                     return request.make_json_response({'error': str(e)})
@@ -1941,35 +1948,34 @@ class LiveAgController(http.Controller):
                     rep_domain = [('id', 'in', contract_ids)]
                     rep_domain = self._apply_filters_to_domain(rep_domain, filters)
                     
-                    if use_pagination:
-                        # For rep role with pagination, we need to use search with domain
-                        total_count = Contract.sudo().search_count(rep_domain)
-                        contracts = Contract.sudo().search(rep_domain, limit=per_page, offset=offset, order='create_date desc')
-                        total_pages = (total_count + per_page - 1) // per_page
-                    else:
-                        # Non-paginated response (backward compatibility)
+                    if not use_pagination:
+                        # Non-paginated response (backward compatibility), streamed in batches
                         contracts = Contract.sudo().search(rep_domain, order='create_date desc')
-                    
-                    status_options = dict(Contract._fields['state'].selection)
+                        return stream_records(
+                            contracts,
+                            lambda batch: [serialize_contract_preview(contract) for contract in batch],
+                            fmt=stream_format(),
+                        )
+
+                    # For rep role with pagination, we need to use search with domain
+                    total_count = Contract.sudo().search_count(rep_domain)
+                    contracts = Contract.sudo().search(rep_domain, limit=per_page, offset=offset, order='create_date desc')
+                    total_pages = (total_count + per_page - 1) // per_page
 
                     for contract in contracts:
-                        reps = serialize_reps_for_contract(contract)
                         contract_data = serialize_contract_preview(contract)
                         contract_list.append(contract_data)
                     
-                    if use_pagination:
-                        return request.make_json_response({
-                            'contracts': contract_list,
-                            'pagination': {
-                                'page': page,
-                                'per_page': per_page,
-                                'total_count': total_count,
-                                'total_pages': total_pages
-                            },
-                            'success': True
-                        })
-                    else:
-                        return request.make_json_response(contract_list)
+                    return request.make_json_response({
+                        'contracts': contract_list,
+                        'pagination': {
+                            'page': page,
+                            'per_page': per_page,
+                            'total_count': total_count,
+                            'total_pages': total_pages
+                        },
+                        'success': True
+                    })
                 except Exception as e:
                     _logger.error("Error getting contracts for rep role: %s", str(e))
                     return request.make_json_response({'error': str(e)})
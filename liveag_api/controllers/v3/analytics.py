@@ -1,7 +1,7 @@
 from datetime import datetime
 from calendar import monthrange
 
-from odoo import http
+from odoo import fields, http
 from odoo.http import request
 
 from odoo.addons.liveag_api.tools.http_utils import json_response, api_route
@@ -81,6 +81,102 @@ def _build_contract_domain(scope_partner_id, user, date_from=None, date_to=None)
     return domain
 
 
+PENDING_APPROVAL_STATES = ("submitted", "changed")
+READY_TO_PROOF_STATES = ("approved", "ready_for_sale")
+
+# ?breakdown= value -> consignment.contract groupby spec
+BREAKDOWN_GROUPBY = {
+    "sale_type": "sale_type",
+    "month": "create_date:month",
+    "auction": "auction_id",
+}
+
+
+def _empty_summary():
+    return {
+        "total_contracts": 0,
+        "total_head": 0,
+        "pending_approval_count": 0,
+        "ready_to_proof_count": 0,
+    }
+
+
+def _breakdown_group(breakdown, value):
+    """(key, label) of a breakdown group value as returned by _read_group."""
+    if not value:
+        return None, None
+    if breakdown == "month":
+        return value.strftime("%Y-%m"), value.strftime("%B %Y")
+    return value.id, value.display_name
+
+
+def _rep_head_by_contract(env, domain, scope_partner_id):
+    """{contract_id: heads} credited to the scoped rep, summed from the stored res.rep.rep_sold_head_count."""
+    rows = env["res.rep"]._read_group(
+        [
+            ("contract_id", "in", env["consignment.contract"]._search(domain)),
+            ("rep_id", "=", scope_partner_id),
+        ],
+        ["contract_id"],
+        ["rep_sold_head_count:sum"],
+    )
+    return {contract.id: heads or 0 for contract, heads in rows}
+
+
+def _summarize_contracts(env, domain, scope_partner_id, breakdown=None):
+    """
+    Aggregate contract counts and heads grouped by state in one read_group.
+
+    With a breakdown the same query is also grouped by sale type, month or auction.
+    Returns (summary, breakdown_groups); breakdown_groups is [] without a breakdown.
+    """
+    Contract = env["consignment.contract"]
+    groupby = ["state"]
+    if breakdown:
+        groupby.append(BREAKDOWN_GROUPBY[breakdown])
+    rows = Contract._read_group(domain, groupby, ["__count", "head1:sum", "head2:sum"])
+
+    rep_heads = None
+    contract_group = {}
+    if scope_partner_id is not None:
+        rep_heads = _rep_head_by_contract(env, domain, scope_partner_id)
+        if breakdown and rep_heads:
+            field_name = BREAKDOWN_GROUPBY[breakdown].split(":")[0]
+            for contract in Contract.browse(list(rep_heads)):
+                value = contract[field_name]
+                if breakdown == "month" and value:
+                    # _read_group buckets months in the context timezone
+                    value = fields.Datetime.context_timestamp(contract, value)
+                contract_group[contract.id] = _breakdown_group(breakdown, value)[0]
+
+    summary = _empty_summary()
+    groups = {}
+    for row in rows:
+        state, count, head1, head2 = row[0], row[-3], row[-2], row[-1]
+        targets = [summary]
+        if breakdown:
+            key, label = _breakdown_group(breakdown, row[1])
+            group = groups.setdefault(key, dict(_empty_summary(), key=key, label=label))
+            targets.append(group)
+        for target in targets:
+            target["total_contracts"] += count
+            if rep_heads is None:
+                target["total_head"] += (head1 or 0) + (head2 or 0)
+            if state in PENDING_APPROVAL_STATES:
+                target["pending_approval_count"] += count
+            if state in READY_TO_PROOF_STATES:
+                target["ready_to_proof_count"] += count
+
+    if rep_heads is not None:
+        summary["total_head"] = sum(rep_heads.values())
+        for contract_id, heads in rep_heads.items():
+            key = contract_group.get(contract_id)
+            if key in groups:
+                groups[key]["total_head"] += heads
+
+    return summary, list(groups.values())
+
+
 class AnalyticsV3Controller(http.Controller):
 
     @api_route("/api/v3/analytics/summary", methods=["GET"])
@@ -123,36 +219,27 @@ class AnalyticsV3Controller(http.Controller):
                 raw_from = date_from.isoformat()
                 raw_to = date_to.isoformat()
 
+            breakdown = request.params.get("breakdown") or None
+            if breakdown is not None and breakdown not in BREAKDOWN_GROUPBY:
+                return json_response(
+                    {
+                        "error": "invalid_request",
+                        "error_description": "breakdown must be one of: %s" % ", ".join(BREAKDOWN_GROUPBY),
+                    },
+                    status=400,
+                )
+
             domain = _build_contract_domain(scope_partner_id, request.api_user, date_from, date_to)
-            contracts = env["consignment.contract"].search(domain)
-
-            total_contracts = len(contracts)
-            if scope_partner_id is None:
-                total_head = sum((c.head1 or 0) + (c.head2 or 0) for c in contracts)
-            else:
-                rep_lines = env["res.rep"].search([
-                    ("contract_id", "in", contracts.ids),
-                    ("rep_id", "=", scope_partner_id),
-                    ("active", "=", True),
-                ])
-                total_head = sum(rep.rep_sold_head_count for rep in rep_lines)
-            pending_approval_states = ("submitted", "changed")
-            ready_to_proof_states = ("approved", "ready_for_sale")
-            pending_approval_count = sum(1 for c in contracts if c.state in pending_approval_states)
-            ready_to_proof_count = sum(1 for c in contracts if c.state in ready_to_proof_states)
+            data, groups = _summarize_contracts(env, domain, scope_partner_id, breakdown)
 
             meta = {
                 "scope": "rep" if scope_partner_id else "company",
                 "partner_id": scope_partner_id,
                 "date_range": {"from": raw_from, "to": raw_to},
             }
-
-            data = {
-                "total_contracts": total_contracts,
-                "total_head": total_head,
-                "pending_approval_count": pending_approval_count,
-                "ready_to_proof_count": ready_to_proof_count,
-            }
+            if breakdown:
+                meta["breakdown"] = breakdown
+                data["breakdown"] = groups
 
             return json_response({"data": data, "meta": meta, "success": True}, status=200)
         except Exception as e:
@@ -12,7 +12,7 @@ from odoo.addons.liveag_api.controllers.v3.webhooks import (
     _clerk_payload_user_data,
     _sync_clerk_user_to_odoo,
 )
-from odoo.addons.liveag_api.tools.clerk_jwt import verify_clerk_jwt
+from odoo.addons.liveag_api.tools.clerk_jwt import clerk_config, verify_clerk_jwt
 from odoo.addons.liveag_api.tools.http_utils import json_response, api_route
 
 _logger = logging.getLogger(__name__)
@@ -106,12 +106,9 @@ class AuthController(http.Controller):
             )
         clerk_jwt = auth.split(" ", 1)[1].strip()
 
-        ICP = request.env["ir.config_parameter"].sudo()
-        issuer = ICP.get_param("clerk.issuer")
-        jwks_url = ICP.get_param("clerk.jwks_url")
-        audience = ICP.get_param("clerk.audience") or None
+        config = clerk_config(request.env)
 
-        if not issuer or not jwks_url:
+        if not config["issuer"] or not (config["jwks_url"] or config["jwks_file"]):
             _logger.error("Clerk config missing: clerk.issuer / clerk.jwks_url")
             return json_response(
                 {"error": "server_error", "error_description": "Clerk config not set"},
@@ -119,7 +116,7 @@ class AuthController(http.Controller):
             )
 
         try:
-            claims = verify_clerk_jwt(clerk_jwt, jwks_url=jwks_url, issuer=issuer, audience=audience)
+            claims = verify_clerk_jwt(clerk_jwt, **config)
         except Exception as e:
             err_str = str(e)
             _logger.warning("Clerk JWT invalid on request-access: %s", err_str)
@@ -163,12 +160,9 @@ class AuthController(http.Controller):
             )
         clerk_jwt = auth.split(" ", 1)[1].strip()
 
-        ICP = request.env["ir.config_parameter"].sudo()
-        issuer = ICP.get_param("clerk.issuer")
-        jwks_url = ICP.get_param("clerk.jwks_url")
-        audience = ICP.get_param("clerk.audience") or None
+        config = clerk_config(request.env)
 
-        if not issuer or not jwks_url:
+        if not config["issuer"] or not (config["jwks_url"] or config["jwks_file"]):
             _logger.error("Clerk config missing: clerk.issuer / clerk.jwks_url")
             return json_response(
                 {"error": "server_error", "error_description": "Clerk config not set"},
@@ -176,7 +170,7 @@ class AuthController(http.Controller):
             )
 
         try:
-            claims = verify_clerk_jwt(clerk_jwt, jwks_url=jwks_url, issuer=issuer, audience=audience)
+            claims = verify_clerk_jwt(clerk_jwt, **config)
         except Exception as e:
             err_str = str(e)
             _logger.warning("Clerk JWT invalid: %s", err_str)
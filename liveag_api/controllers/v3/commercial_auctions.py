@@ -13,6 +13,7 @@ from odoo.addons.liveag_api.tools.api_decorators import (
     with_pagination,
     with_query_filters,
 )
+from odoo.addons.liveag_api.tools.pagination import InvalidCursor, search_page
 
 import logging
 _logger = logging.getLogger(__name__)
@@ -22,7 +23,7 @@ class AuctionsV3Controller(http.Controller, AuctionsFiltersMixin):
 
     @api_route("/api/v3/auctions", methods=["GET", "POST"])
     @odoo_token_required("api")
-    @with_pagination()
+    @with_pagination(allow_cursor=True)
     @with_query_filters(AUCTION_FILTER_SPEC)
     def handle_auctions_v3(self, **kw):
         env = request.api_env
@@ -42,17 +43,11 @@ class AuctionsV3Controller(http.Controller, AuctionsFiltersMixin):
             Auction = env["sale.auction"]
 
             try:
+                order = "sale_date_begin desc, id desc"
                 if pag["use"]:
-                    total_count = Auction.search_count(domain)
-                    auctions = Auction.search(
-                        domain,
-                        limit=pag["limit"],
-                        offset=pag["offset"],
-                        order="sale_date_begin desc, id desc",
-                    )
-                    total_pages = (total_count + pag["per_page"] - 1) // pag["per_page"]
+                    auctions, page_meta = search_page(Auction, domain, order, pag)
                 else:
-                    auctions = Auction.search(domain, order="sale_date_begin desc, id desc")
+                    auctions = Auction.search(domain, order=order)
 
                 auction_list = [serialize_auction_preview(a) for a in auctions]
 
@@ -60,12 +55,7 @@ class AuctionsV3Controller(http.Controller, AuctionsFiltersMixin):
                     return json_response(
                         {
                             "data": auction_list,
-                            "pagination": {
-                                "page": pag["page"],
-                                "per_page": pag["per_page"],
-                                "total_count": total_count,
-                                "total_pages": total_pages,
-                            },
+                            "pagination": page_meta,
                             "success": True,
                         },
                         status=200,
@@ -73,6 +63,8 @@ class AuctionsV3Controller(http.Controller, AuctionsFiltersMixin):
 
                 return json_response(auction_list, status=200)
 
+            except InvalidCursor as e:
+                return json_response({"error": "invalid_request", "error_description": str(e)}, status=400)
             except Exception as e:
                 _logger.exception("Error getting auctions (v3)")
                 return json_response({"error": "server_error", "error_description": str(e)}, status=500)
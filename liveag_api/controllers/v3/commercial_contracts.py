@@ -29,12 +29,13 @@ CONTRACT_SORT_FIELD_MAP = {
     "kind": "kind1_name",
     "contract_id": "id",
 }
-from odoo.addons.liveag_consignment.models.consignment_contract import DIRECTION_LIST
 from odoo.addons.liveag_api.tools.liveag import (
     serialize_contract_preview,
     serialize_contract_detailed,
     serialize_contract_editable,
     serialize_contract_for_list,
+    serialize_contracts_for_list,
+    InvalidFields,
 )
 
 # Allowed values for view= query param on GET contract(s). Default: preview.
@@ -42,10 +43,15 @@ CONTRACT_VIEW_VALUES = ("list", "preview", "detailed", "editable")
 from odoo.addons.liveag_api.tools.http_utils import json_response, api_route
 from odoo.addons.liveag_api.tools.api_decorators import (
     odoo_token_required,
+    with_fields,
     with_pagination,
     with_query_filters,
     with_sort,
 )
+from odoo.addons.liveag_api.tools.pagination import InvalidCursor, search_page
+from odoo.addons.liveag_api.tools.changes import ExpiredWatermark, InvalidWatermark, contract_changes
+from odoo.addons.liveag_api.tools.metadata import metadata_response
+from odoo.addons.liveag_api.tools.streaming import stream_format, stream_records
 
 import logging
 
@@ -65,13 +71,18 @@ _BLOCKED_WRITE_FIELDS = frozenset(
 )
 
 
+# Upper bound for one /api/v3/contracts/batch request
+BATCH_MAX_ITEMS = 500
+
+
 class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
 
     @api_route("/api/v3/contracts", methods=["GET", "POST", "PUT"])
     @odoo_token_required("api")
-    @with_pagination()
+    @with_pagination(allow_cursor=True)
     @with_query_filters(CONTRACT_FILTER_SPEC)
     @with_sort(CONTRACT_SORT_FIELDS, default_field="created_on", default_order="desc")
+    @with_fields()
     def handle_contracts_v3(self, **kw):
         env = request.api_env
 
@@ -92,37 +103,31 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             Contract = env["consignment.contract"]
 
             try:
-                if pag["use"]:
-                    total_count = Contract.search_count(domain)
-                    contracts = Contract.search(
-                        domain,
-                        limit=pag["limit"],
-                        offset=pag["offset"],
-                        order=order_clause,
-                    )
-                    total_pages = (total_count + pag["per_page"] - 1) // pag["per_page"]
-                else:
+                if not pag["use"]:
+                    # Unpaginated: stream the full list in batches
+                    sparse_fields = request.sparse_fields
                     contracts = Contract.search(domain, order=order_clause)
-
-                contract_list = [serialize_contract_for_list(c) for c in contracts]
-
-                if pag["use"]:
-                    return json_response(
-                        {
-                            "data": contract_list,
-                            "pagination": {
-                                "page": pag["page"],
-                                "per_page": pag["per_page"],
-                                "total_count": total_count,
-                                "total_pages": total_pages,
-                            },
-                            "success": True,
-                        },
-                        status=200,
+                    return stream_records(
+                        contracts,
+                        lambda batch: serialize_contracts_for_list(batch, fields=sparse_fields),
+                        fmt=stream_format(),
                     )
 
-                return json_response(contract_list, status=200)
+                contracts, page_meta = search_page(Contract, domain, order_clause, pag)
+                contract_list = serialize_contracts_for_list(contracts, fields=request.sparse_fields)
+                return json_response(
+                    {
+                        "data": contract_list,
+                        "pagination": page_meta,
+                        "success": True,
+                    },
+                    status=200,
+                )
 
+            except (InvalidCursor, InvalidFields) as e:
+                return json_response(
+                    {"error": "invalid_request", "error_description": str(e)}, status=400
+                )
             except Exception as e:
                 _logger.exception("Error getting contracts (v3)")
                 return json_response(
@@ -258,9 +263,283 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             status=405,
         )
 
+    # ---------- Batch upsert ----------
+    @api_route("/api/v3/contracts/batch", methods=["POST"])
+    @odoo_token_required("api")
+    def handle_contracts_batch(self, **kw):
+        """
+        Create or update many contracts in one transaction.
+
+        Body: {"contracts": [{...}, ...]}; items with an "id" are updated, the
+        others created. Each item runs in its own savepoint, so a failing item
+        is reported and skipped without undoing the others. The activity and
+        catalog-change logs of an item are inserted with one create per model
+        inside that item's savepoint, so a contract is never saved without them.
+        """
+        user = request.api_user
+        if not user.has_group(
+            "liveag_consignment.group_consignment_manager"
+        ) and not user.has_group("liveag_consignment.group_consignment_rep"):
+            return json_response(
+                {
+                    "error": "insufficient_scope",
+                    "error_description": "Only Manager or Rep can create or update contracts",
+                },
+                status=403,
+            )
+
+        try:
+            body = request.httprequest.get_data(as_text=True) or ""
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            payload = None
+        items = payload.get("contracts") if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            return json_response(
+                {
+                    "error": "invalid_request",
+                    "error_description": "Body must be {\"contracts\": [...]} with at least one item",
+                },
+                status=400,
+            )
+        if len(items) > BATCH_MAX_ITEMS:
+            return json_response(
+                {
+                    "error": "invalid_request",
+                    "error_description": f"At most {BATCH_MAX_ITEMS} contracts per batch",
+                },
+                status=400,
+            )
+
+        env = request.api_env
+        results = []
+        try:
+            for index, item in enumerate(items):
+                results.append(self._upsert_batch_item(env, index, item))
+        except Exception as e:
+            _logger.exception("Error in contract batch (v3)")
+            # Nothing of a half-applied batch is kept
+            env.cr.rollback()
+            return json_response(
+                {"error": "server_error", "error_description": str(e)}, status=500
+            )
+
+        failed = sum(1 for result in results if result["status"] == "error")
+        return json_response(
+            {
+                "data": results,
+                "summary": {"total": len(results), "succeeded": len(results) - failed, "failed": failed},
+                "success": not failed,
+            },
+            status=200,
+        )
+
+    def _upsert_batch_item(self, env, index, item):
+        """Apply one batch item inside a savepoint; returns its result entry."""
+        if not isinstance(item, dict) or not item:
+            return {
+                "index": index,
+                "status": "error",
+                "error": {"error": "invalid_request", "error_description": "Item must be a non-empty object"},
+            }
+        contract_id = item.get("id")
+        vals = {k: v for k, v in item.items() if k not in _BLOCKED_WRITE_FIELDS and k != "rep_ids"}
+        item_buffer = env["consignment.contract"]._new_change_log_buffer()
+        Contract = env["consignment.contract"].with_context(change_log_buffer=item_buffer)
+        try:
+            with env.cr.savepoint():
+                if contract_id:
+                    contract = Contract.browse(int(contract_id))
+                    if not contract.exists():
+                        return {
+                            "index": index,
+                            "id": contract.id,
+                            "status": "error",
+                            "error": {"error": "not_found", "error_description": "Contract not found"},
+                        }
+                    if vals:
+                        contract.write(vals)
+                    status = "updated"
+                else:
+                    contract = Contract.create(vals)
+                    status = "created"
+                Contract._flush_change_logs(item_buffer)
+        except (TypeError, ValueError, AccessError, UserError, ValidationError) as e:
+            return {
+                "index": index,
+                "id": contract_id or None,
+                "status": "error",
+                "error": {"error": "invalid_request", "error_description": str(e)},
+            }
+        except Exception as e:
+            _logger.exception("Error in contract batch item %s (v3)", index)
+            return {
+                "index": index,
+                "id": contract_id or None,
+                "status": "error",
+                "error": {"error": "server_error", "error_description": str(e)},
+            }
+        return {"index": index, "id": contract.id, "status": status}
+
+    # ---------- Catalog change review ----------
+    @api_route("/api/v3/contracts/catalog-changes/<string:decision>", methods=["POST"])
+    @odoo_token_required("api")
+    def handle_catalog_changes_review(self, decision, **kw):
+        """
+        Approve or reject many catalog changes at once (decision: approve|reject).
+
+        Body: {"ids": [...]} for given changes and/or {"contract_ids": [...]} for
+        all pending changes of those contracts. Approved values are applied with
+        one write per contract; when a contract's values cannot be applied, its
+        changes stay pending and are reported as errors.
+        """
+        if decision not in ("approve", "reject"):
+            return json_response(
+                {"error": "not_found", "error_description": "Unknown decision, use approve or reject"},
+                status=404,
+            )
+        user = request.api_user
+        if not user.has_group("liveag_consignment.group_consignment_manager"):
+            return json_response(
+                {
+                    "error": "insufficient_scope",
+                    "error_description": "Only Manager can review catalog changes",
+                },
+                status=403,
+            )
+
+        try:
+            body = request.httprequest.get_data(as_text=True) or ""
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            payload = {}
+        change_ids = payload.get("ids") or []
+        contract_ids = payload.get("contract_ids") or []
+        if (
+            not isinstance(change_ids, list)
+            or not isinstance(contract_ids, list)
+            or not (change_ids or contract_ids)
+            or not all(isinstance(i, int) for i in change_ids + contract_ids)
+        ):
+            return json_response(
+                {
+                    "error": "invalid_request",
+                    "error_description": "Body must be {\"ids\": [...]} and/or {\"contract_ids\": [...]} with integer ids",
+                },
+                status=400,
+            )
+        if len(change_ids) > BATCH_MAX_ITEMS or len(contract_ids) > BATCH_MAX_ITEMS:
+            return json_response(
+                {
+                    "error": "invalid_request",
+                    "error_description": f"At most {BATCH_MAX_ITEMS} ids per request",
+                },
+                status=400,
+            )
+
+        env = request.api_env
+        CatalogChange = env["catalog.change"]
+        try:
+            changes = CatalogChange.browse(change_ids).exists()
+            if contract_ids:
+                changes |= env["consignment.contract"].browse(contract_ids)._get_pending_changes()
+            reviewable = changes.filtered(lambda c: c.state in ("draft", "pending"))
+            if decision == "approve":
+                CatalogChange._check_approver()
+                errors = reviewable._approve()
+            else:
+                reviewable._reject()
+                errors = {}
+        except ValidationError as e:
+            return json_response(
+                {"error": "insufficient_scope", "error_description": str(e)}, status=403
+            )
+        except Exception as e:
+            _logger.exception("Error reviewing catalog changes (v3)")
+            env.cr.rollback()
+            return json_response(
+                {"error": "server_error", "error_description": str(e)}, status=500
+            )
+
+        done = "approved" if decision == "approve" else "rejected"
+        results = [
+            {"id": change_id, "status": "error", "error": {"error": "not_found", "error_description": "Catalog change not found"}}
+            for change_id in dict.fromkeys(change_ids) if change_id not in changes.ids
+        ]
+        for change in changes:
+            result = {"id": change.id, "contract_id": change.contract_id.id}
+            if change.id in errors:
+                result.update(status="error", error={"error": "invalid_request", "error_description": errors[change.id]})
+            elif change in reviewable:
+                result["status"] = done
+            else:
+                result["status"] = "skipped"
+                result["state"] = change.state
+            results.append(result)
+        failed = sum(1 for result in results if result["status"] == "error")
+        return json_response(
+            {
+                "data": results,
+                "summary": {
+                    "total": len(results),
+                    done: sum(1 for result in results if result["status"] == done),
+                    "skipped": sum(1 for result in results if result["status"] == "skipped"),
+                    "failed": failed,
+                },
+                "success": not failed,
+            },
+            status=200,
+        )
+
+    # ---------- Change feed ----------
+    @api_route("/api/v3/contracts/changes", methods=["GET"])
+    @odoo_token_required("api")
+    @with_pagination(default_per_page=100, max_per_page=500)
+    @with_fields()
+    def handle_contracts_changes(self, **kw):
+        """
+        Contracts created, updated or deleted since ?since=<watermark>.
+
+        Omit since for the first sync. Each response carries the watermark to
+        send next; keep calling while has_more is true. Deleted, archived,
+        canceled and merged contracts come back as op "delete" tombstones.
+        """
+        try:
+            items, watermark, has_more = contract_changes(
+                request.api_env,
+                request.params.get("since"),
+                request.pagination["limit"],
+                sparse_fields=request.sparse_fields,
+            )
+            return json_response(
+                {
+                    "data": items,
+                    "watermark": watermark,
+                    "has_more": has_more,
+                    "success": True,
+                },
+                status=200,
+            )
+        except (InvalidWatermark, InvalidFields) as e:
+            return json_response(
+                {"error": "invalid_request", "error_description": str(e)}, status=400
+            )
+        except ExpiredWatermark as e:
+            return json_response(
+                {"error": "watermark_expired", "error_description": str(e)}, status=410
+            )
+        except Exception as e:
+            _logger.exception("Error getting contract changes (v3)")
+            return json_response(
+                {"error": "server_error", "error_description": str(e)}, status=500
+            )
+
     # ---------- Contracts by ID ----------
     @api_route("/api/v3/contracts/<int:contract_id>", methods=["GET", "PUT"])
     @odoo_token_required("api")
+    @with_fields()
     def handle_contracts_by_id(self, contract_id, **kw):
         # ---------- GET ----------
         if request.httprequest.method == "GET":
@@ -287,15 +566,20 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
                         },
                         status=404,
                     )
+                fields = request.sparse_fields
                 if view == "list":
-                    data = serialize_contract_for_list(contract)
+                    data = serialize_contract_for_list(contract, fields=fields)
                 elif view == "detailed":
-                    data = serialize_contract_detailed(contract)
+                    data = serialize_contract_detailed(contract, fields=fields)
                 elif view == "editable":
-                    data = serialize_contract_editable(contract)
+                    data = serialize_contract_editable(contract, fields=fields)
                 else:
-                    data = serialize_contract_preview(contract)
+                    data = serialize_contract_preview(contract, fields=fields)
                 return json_response({"data": data, "success": True}, status=200)
+            except InvalidFields as e:
+                return json_response(
+                    {"error": "invalid_request", "error_description": str(e)}, status=400
+                )
             except Exception as e:
                 _logger.exception("Error getting contract by ID (v3)")
                 return json_response(
@@ -557,10 +841,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            Contract = request.api_env["consignment.contract"]
-            selection = Contract._fields["state"].selection
-            statuses = [{"value": value, "label": label} for value, label in selection]
-            return json_response({"data": statuses, "success": True}, status=200)
+            return metadata_response(request.api_env, "status")
         except Exception as e:
             _logger.exception("Error getting contract statuses (v3)")
             return json_response(
@@ -581,12 +862,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            sale_types = env["sale.type"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            sale_type_list = [{"value": st.id, "label": st.name} for st in sale_types]
-            return json_response({"data": sale_type_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "sale_type")
         except Exception as e:
             _logger.exception("Error getting contract sale types (v3)")
             return json_response(
@@ -607,12 +883,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            kinds = env["kind.list"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            kind_list = [{"value": k.id, "label": k.name, "sex": k.sex} for k in kinds]
-            return json_response({"data": kind_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "kind")
         except Exception as e:
             _logger.exception("Error getting contract kinds (v3)")
             return json_response(
@@ -633,16 +904,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            contract_types = env["contract.type"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            contract_type_list = [
-                {"value": ct.id, "label": ct.name} for ct in contract_types
-            ]
-            return json_response(
-                {"data": contract_type_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "contract_type")
         except Exception as e:
             _logger.exception("Error getting contract contract types (v3)")
             return json_response(
@@ -663,12 +925,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            origins = env["origin.list"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            origin_list = [{"value": o.id, "label": o.name} for o in origins]
-            return json_response({"data": origin_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "origin")
         except Exception as e:
             _logger.exception("Error getting contract origins (v3)")
             return json_response(
@@ -689,12 +946,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            frame_sizes = env["frame.size"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            frame_size_list = [{"value": fs.id, "label": fs.name} for fs in frame_sizes]
-            return json_response({"data": frame_size_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "frame_size")
         except Exception as e:
             _logger.exception("Error getting contract frame sizes (v3)")
             return json_response(
@@ -715,12 +967,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            flesh_types = env["flesh.type"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            flesh_type_list = [{"value": ft.id, "label": ft.name} for ft in flesh_types]
-            return json_response({"data": flesh_type_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "flesh_type")
         except Exception as e:
             _logger.exception("Error getting contract flesh types (v3)")
             return json_response(
@@ -741,16 +988,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            weight_variances = env["weight.variance"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            weight_variance_list = [
-                {"value": wv.id, "label": wv.name} for wv in weight_variances
-            ]
-            return json_response(
-                {"data": weight_variance_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "weight_variance")
         except Exception as e:
             _logger.exception("Error getting contract weight variances (v3)")
             return json_response(
@@ -771,12 +1009,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            horns = env["horns.list"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            horns_list = [{"value": h.id, "label": h.name} for h in horns]
-            return json_response({"data": horns_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "horns")
         except Exception as e:
             _logger.exception("Error getting contract horns (v3)")
             return json_response(
@@ -797,16 +1030,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            implanted_types = env["implanted.list"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            implanted_type_list = [
-                {"value": it.id, "label": it.name} for it in implanted_types
-            ]
-            return json_response(
-                {"data": implanted_type_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "implanted_type")
         except Exception as e:
             _logger.exception("Error getting contract implanted types (v3)")
             return json_response(
@@ -827,16 +1051,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            castration_types = env["castration.list"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            castration_type_list = [
-                {"value": ct.id, "label": ct.name} for ct in castration_types
-            ]
-            return json_response(
-                {"data": castration_type_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "castration_type")
         except Exception as e:
             _logger.exception("Error getting contract castration types (v3)")
             return json_response(
@@ -857,16 +1072,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            bangs_vaccinations = env["bangs.vaccinated"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            bangs_vaccination_list = [
-                {"value": bv.id, "label": bv.name} for bv in bangs_vaccinations
-            ]
-            return json_response(
-                {"data": bangs_vaccination_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "bangs_vaccination")
         except Exception as e:
             _logger.exception("Error getting contract bangs vaccinations (v3)")
             return json_response(
@@ -887,16 +1093,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            special_sections = env["special.section"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            special_section_list = [
-                {"value": ss.id, "label": ss.name} for ss in special_sections
-            ]
-            return json_response(
-                {"data": special_section_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "special_section")
         except Exception as e:
             _logger.exception("Error getting contract special sections (v3)")
             return json_response(
@@ -917,16 +1114,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            genetic_merits = env["genetic.merit"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            genetic_merit_list = [
-                {"value": gm.id, "label": gm.name} for gm in genetic_merits
-            ]
-            return json_response(
-                {"data": genetic_merit_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "genetic_merit")
         except Exception as e:
             _logger.exception("Error getting contract genetic merits (v3)")
             return json_response(
@@ -947,17 +1135,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            premium_genetics_programs = env["premium.genetics.program"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            premium_genetics_program_list = [
-                {"value": pgp.id, "label": pgp.name}
-                for pgp in premium_genetics_programs
-            ]
-            return json_response(
-                {"data": premium_genetics_program_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "premium_genetics_program")
         except Exception as e:
             _logger.exception("Error getting contract premium genetics programs (v3)")
             return json_response(
@@ -978,16 +1156,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            van_programs = env["van.program"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            van_program_list = [
-                {"value": vp.id, "label": vp.name} for vp in van_programs
-            ]
-            return json_response(
-                {"data": van_program_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "van_program")
         except Exception as e:
             _logger.exception("Error getting contract van programs (v3)")
             return json_response(
@@ -1008,16 +1177,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            source_age_programs = env["third.party.age"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            source_age_program_list = [
-                {"value": sa.id, "label": sa.name} for sa in source_age_programs
-            ]
-            return json_response(
-                {"data": source_age_program_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "source_age_program")
         except Exception as e:
             _logger.exception("Error getting contract source age programs (v3)")
             return json_response(
@@ -1038,16 +1198,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            vac_programs = env["vac.program"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            vac_program_list = [
-                {"value": vp.id, "label": vp.name} for vp in vac_programs
-            ]
-            return json_response(
-                {"data": vac_program_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "vac_program")
         except Exception as e:
             _logger.exception("Error getting contract vac programs (v3)")
             return json_response(
@@ -1068,16 +1219,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            location_types = env["location.type"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            location_type_list = [
-                {"value": lt.id, "label": lt.name} for lt in location_types
-            ]
-            return json_response(
-                {"data": location_type_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "location_type")
         except Exception as e:
             _logger.exception("Error getting contract location types (v3)")
             return json_response(
@@ -1098,16 +1240,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            delivery_options = env["whose.option"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            delivery_option_list = [
-                {"value": do.id, "label": do.name} for do in delivery_options
-            ]
-            return json_response(
-                {"data": delivery_option_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "delivery_option")
         except Exception as e:
             _logger.exception("Error getting contract delivery options (v3)")
             return json_response(
@@ -1128,23 +1261,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            slide_types = env["slide.type"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            slide_type_list = [
-                {
-                    "value": st.id,
-                    "label": st.label,
-                    "sell_by_head": st.sell_by_head,
-                    "above": st.above,
-                    "under": st.under,
-                    "both": st.both,
-                    "description": st.description,
-                }
-                for st in slide_types
-            ]
-            return json_response({"data": slide_type_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "slide_type")
         except Exception as e:
             _logger.exception("Error getting contract slide types (v3)")
             return json_response(
@@ -1165,16 +1282,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            weight_stops = env["weight.stop"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            weight_stop_list = [
-                {"value": ws.id, "label": ws.name} for ws in weight_stops
-            ]
-            return json_response(
-                {"data": weight_stop_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "weight_stop")
         except Exception as e:
             _logger.exception("Error getting contract weight stops (v3)")
             return json_response(
@@ -1195,16 +1303,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            env = request.api_env
-            gap_programs = env["gap.program"].search(
-                [("active", "=", True)], order="sequence, id"
-            )
-            gap_program_list = [
-                {"value": gp.id, "label": gp.name} for gp in gap_programs
-            ]
-            return json_response(
-                {"data": gap_program_list, "success": True}, status=200
-            )
+            return metadata_response(request.api_env, "gap_program")
         except Exception as e:
             _logger.exception("Error getting contract gap programs (v3)")
             return json_response(
@@ -1225,10 +1324,7 @@ class ContractsV3Controller(http.Controller, ContractsFiltersMixin):
             )
 
         try:
-            direction_list = [
-                {"value": val, "label": label} for val, label in DIRECTION_LIST
-            ]
-            return json_response({"data": direction_list, "success": True}, status=200)
+            return metadata_response(request.api_env, "directions")
         except Exception as e:
             _logger.exception("Error getting contract directions (v3)")
             return json_response(
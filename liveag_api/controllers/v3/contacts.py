@@ -8,18 +8,22 @@ from odoo.addons.liveag_api.controllers._mixins.auction_filters import (
 )
 from odoo.addons.liveag_api.tools.liveag import (
 	serialize_contact_basic_info,
-	serialize_contact_seller,
-	serialize_contact_rep,
+	serialize_seller,
+	serialize_rep,
 	serialize_payment_address,
 	serialize_lienholder,
+	InvalidFields,
 )
 from odoo.addons.liveag_api.tools.http_utils import json_response, api_route
 from odoo.addons.liveag_api.tools.api_decorators import (
     odoo_token_required,
+    with_fields,
     with_pagination,
     with_query_filters,
 )
+from odoo.addons.liveag_api.tools.pagination import InvalidCursor, search_page
 from odoo.addons.liveag_api.tools.roles import user_has_role
+from odoo.addons.liveag_api.tools.streaming import stream_format, stream_records
 
 import logging
 _logger = logging.getLogger(__name__)
@@ -28,7 +32,8 @@ _logger = logging.getLogger(__name__)
 class ContactsV3Controller(http.Controller):
   @api_route("/api/v3/contacts", methods=["GET"])
   @odoo_token_required("api")
-  @with_pagination()
+  @with_pagination(allow_cursor=True)
+  @with_fields()
   def handle_contacts_v3(self, **kw):
       env = request.api_env
 
@@ -40,37 +45,30 @@ class ContactsV3Controller(http.Controller):
           Contact = env["res.partner"]
 
           try:
-              if pag["use"]:
-                  total_count = Contact.search_count(domain)
-                  contacts = Contact.search(
-                      domain,
-                      limit=pag["limit"],
-                      offset=pag["offset"],
-                      order="name asc, id desc",
-                  )
-                  total_pages = (total_count + pag["per_page"] - 1) // pag["per_page"]
-              else:
-                  contacts = Contact.search(domain, order="name asc, id desc")
-
-              contact_list = [serialize_contact_basic_info(c) for c in contacts]
-
-              if pag["use"]:
-                  return json_response(
-                      {
-                          "data": contact_list,
-                          "pagination": {
-                              "page": pag["page"],
-                              "per_page": pag["per_page"],
-                              "total_count": total_count,
-                              "total_pages": total_pages,
-                          },
-                          "success": True,
-                      },
-                      status=200,
+              order = "name asc, id desc"
+              sparse_fields = request.sparse_fields
+              if not pag["use"]:
+                  # Unpaginated: stream the full list in batches
+                  contacts = Contact.search(domain, order=order)
+                  return stream_records(
+                      contacts,
+                      lambda batch: [serialize_contact_basic_info(c, fields=sparse_fields) for c in batch],
+                      fmt=stream_format(),
                   )
 
-              return json_response(contact_list, status=200)
+              contacts, page_meta = search_page(Contact, domain, order, pag)
+              contact_list = [serialize_contact_basic_info(c, fields=sparse_fields) for c in contacts]
+              return json_response(
+                  {
+                      "data": contact_list,
+                      "pagination": page_meta,
+                      "success": True,
+                  },
+                  status=200,
+              )
 
+          except (InvalidCursor, InvalidFields) as e:
+              return json_response({"error": "invalid_request", "error_description": str(e)}, status=400)
           except Exception as e:
               _logger.exception("Error getting contacts (v3)")
               return json_response({"error": "server_error", "error_description": str(e)}, status=500)
@@ -105,6 +103,7 @@ class ContactsV3Controller(http.Controller):
   @api_route("/api/v3/contacts/sellers", methods=["GET"])
   @odoo_token_required("api")
   @with_pagination()
+  @with_fields()
   def handle_sellers_v3(self, **kw):
       env = request.api_env
       if request.httprequest.method == "GET":
@@ -128,11 +127,10 @@ class ContactsV3Controller(http.Controller):
               order="name asc, id desc",
             )
           
-          seller_list = []
-          for seller in sellers:
-            seller_info = serialize_contact_basic_info(seller)
-            seller_info.update(serialize_contact_seller(seller))
-            seller_list.append(seller_info)
+          try:
+            seller_list = [serialize_seller(seller, fields=request.sparse_fields) for seller in sellers]
+          except InvalidFields as e:
+            return json_response({"error": "invalid_request", "error_description": str(e)}, status=400)
             
           if pag["use"]:
               total_pages = (total_count + pag["per_page"] - 1) // pag["per_page"]
@@ -153,6 +151,7 @@ class ContactsV3Controller(http.Controller):
   # ---------- Seller by ID ----------
   @api_route("/api/v3/contacts/sellers/<int:seller_id>", methods=["GET"])
   @odoo_token_required("api")
+  @with_fields()
   def handle_sellers_by_id_v3(self, seller_id, **kw):
       env = request.api_env
       if request.httprequest.method == "GET":
@@ -171,8 +170,10 @@ class ContactsV3Controller(http.Controller):
           if not seller:
               return json_response({"error": "not_found", "error_description": "Seller not found"}, status=404)
           
-          seller_info = serialize_contact_basic_info(seller)
-          seller_info.update(serialize_contact_seller(seller))
+          try:
+            seller_info = serialize_seller(seller, fields=request.sparse_fields)
+          except InvalidFields as e:
+            return json_response({"error": "invalid_request", "error_description": str(e)}, status=400)
           return json_response({"data": seller_info, "success": True}, status=200)
 
       return json_response({"error": "method_not_allowed", "error_description": "Method not allowed"}, status=405)
@@ -249,6 +250,7 @@ class ContactsV3Controller(http.Controller):
   @api_route("/api/v3/contacts/reps", methods=["GET"])
   @odoo_token_required("api")
   @with_pagination()
+  @with_fields()
   def handle_reps_v3(self, **kw):
       env = request.api_env
       if request.httprequest.method == "GET":
@@ -266,11 +268,10 @@ class ContactsV3Controller(http.Controller):
               order="name asc, id desc",
             )
           
-          rep_list = []
-          for rep in reps:
-            rep_info = serialize_contact_basic_info(rep)
-            rep_info.update(serialize_contact_rep(rep))
-            rep_list.append(rep_info)
+          try:
+            rep_list = [serialize_rep(rep, fields=request.sparse_fields) for rep in reps]
+          except InvalidFields as e:
+            return json_response({"error": "invalid_request", "error_description": str(e)}, status=400)
             
           if pag["use"]:
               total_pages = (total_count + pag["per_page"] - 1) // pag["per_page"]
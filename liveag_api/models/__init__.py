@@ -0,0 +1,5 @@
+from . import auth_token
+from . import clerk_config
+from . import consignment_contract
+from . import metadata_cache
+from . import tombstone
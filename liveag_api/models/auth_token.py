@@ -0,0 +1,48 @@
+from odoo import models
+from odoo.tools import SQL
+
+# Bumped whenever a token changes; read by every token lookup (see tools.liveag_auth)
+TOKEN_CACHE_SEQUENCE = "liveag_api_token_cache_seq"
+
+
+class LiveAgAuthToken(models.Model):
+    """Invalidates the API token cache of every worker when a token is changed or removed."""
+    _inherit = "liveag.auth.token"
+
+    def init(self):
+        super().init()
+        self.env.cr.execute(SQL("CREATE SEQUENCE IF NOT EXISTS %s", SQL.identifier(TOKEN_CACHE_SEQUENCE)))
+
+    def _get_token_cache_generation(self):
+        """Current token cache generation; cached tokens of an older one are reloaded."""
+        self.env.cr.execute(SQL("SELECT last_value FROM %s", SQL.identifier(TOKEN_CACHE_SEQUENCE)))
+        return self.env.cr.fetchone()[0]
+
+    def _invalidate_token_cache(self):
+        # Sequences are not transactional: bump now for this transaction, and
+        # again once committed, so a request of any worker that read the old
+        # row meanwhile is outdated as well. Other cached data is left alone.
+        cr = self.env.cr
+        bump = SQL("SELECT nextval(%s)", TOKEN_CACHE_SEQUENCE)
+        cr.execute(bump)
+        cr.postcommit.add(lambda: cr.execute(bump))
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._invalidate_token_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self._invalidate_token_cache()
+        return res
+
+
+class ResUsers(models.Model):
+    """Tokens of deleted users go through ondelete='cascade', bypassing the token unlink."""
+    _inherit = "res.users"
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["liveag.auth.token"]._invalidate_token_cache()
+        return res
@@ -0,0 +1,24 @@
+from odoo import api, models, tools
+
+
+class LiveAgApiClerk(models.AbstractModel):
+    _name = "liveag.api.clerk"
+    _description = "LiveAg API Clerk Configuration"
+
+    @api.model
+    @tools.ormcache()
+    def _get_clerk_config(self):
+        """
+        Cached (jwks_url, issuer, audience, jwks_file) snapshot of the clerk.* parameters.
+
+        ir.config_parameter clears the registry cache on every change, so the
+        snapshot never outlives an edit. clerk.jwks_file, when set, is a local
+        JWKS JSON file used instead of fetching clerk.jwks_url.
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        return (
+            ICP.get_param("clerk.jwks_url") or None,
+            ICP.get_param("clerk.issuer") or None,
+            ICP.get_param("clerk.audience") or None,
+            ICP.get_param("clerk.jwks_file") or None,
+        )
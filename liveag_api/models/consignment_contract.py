@@ -0,0 +1,12 @@
+from odoo import models
+
+
+class ConsignmentContract(models.Model):
+    """Keeps the contract change feed (/api/v3/contracts/changes) cheap and complete."""
+    _inherit = "consignment.contract"
+
+    _write_date_id_idx = models.Index("(write_date, id)")
+
+    def unlink(self):
+        self.env["liveag.api.tombstone"]._record_deletion(self)
+        return super().unlink()
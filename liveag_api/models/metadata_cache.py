@@ -0,0 +1,167 @@
+from odoo import api, models, tools
+
+from odoo.addons.liveag_api.tools.metadata import build_metadata, build_metadata_bundle
+
+
+class LiveAgApiMetadata(models.AbstractModel):
+    _name = "liveag.api.metadata"
+    _description = "LiveAg API Metadata Cache"
+
+    @api.model
+    @tools.ormcache("key", "params", "self.env.lang")
+    def _get_metadata(self, key, params=()):
+        """Cached (body, etag) for a v3 metadata list, per language."""
+        return build_metadata(self.sudo().env, key, params)
+
+    @api.model
+    @tools.ormcache("keys", "base_url", "country_code", "self.env.lang")
+    def _get_metadata_bundle(self, keys, base_url, country_code):
+        """Cached (body, gzipped_body, version) for /api/v3/metadata/bundle, per language."""
+        return build_metadata_bundle(self.sudo().env, keys, base_url, country_code)
+
+
+class LiveAgApiMetadataMixin(models.AbstractModel):
+    """Clears the metadata cache whenever a lookup record changes."""
+    _name = "liveag.api.metadata.mixin"
+    _description = "LiveAg API Metadata Cache Invalidation"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+
+class SaleType(models.Model):
+    _name = "sale.type"
+    _inherit = ["sale.type", "liveag.api.metadata.mixin"]
+
+
+class KindList(models.Model):
+    _name = "kind.list"
+    _inherit = ["kind.list", "liveag.api.metadata.mixin"]
+
+
+class ContractType(models.Model):
+    _name = "contract.type"
+    _inherit = ["contract.type", "liveag.api.metadata.mixin"]
+
+
+class OriginList(models.Model):
+    _name = "origin.list"
+    _inherit = ["origin.list", "liveag.api.metadata.mixin"]
+
+
+class FrameSize(models.Model):
+    _name = "frame.size"
+    _inherit = ["frame.size", "liveag.api.metadata.mixin"]
+
+
+class FleshType(models.Model):
+    _name = "flesh.type"
+    _inherit = ["flesh.type", "liveag.api.metadata.mixin"]
+
+
+class WeightVariance(models.Model):
+    _name = "weight.variance"
+    _inherit = ["weight.variance", "liveag.api.metadata.mixin"]
+
+
+class HornsList(models.Model):
+    _name = "horns.list"
+    _inherit = ["horns.list", "liveag.api.metadata.mixin"]
+
+
+class ImplantedList(models.Model):
+    _name = "implanted.list"
+    _inherit = ["implanted.list", "liveag.api.metadata.mixin"]
+
+
+class CastrationList(models.Model):
+    _name = "castration.list"
+    _inherit = ["castration.list", "liveag.api.metadata.mixin"]
+
+
+class BangsVaccinated(models.Model):
+    _name = "bangs.vaccinated"
+    _inherit = ["bangs.vaccinated", "liveag.api.metadata.mixin"]
+
+
+class SpecialSection(models.Model):
+    _name = "special.section"
+    _inherit = ["special.section", "liveag.api.metadata.mixin"]
+
+
+class GeneticMerit(models.Model):
+    _name = "genetic.merit"
+    _inherit = ["genetic.merit", "liveag.api.metadata.mixin"]
+
+
+class PremiumGeneticsProgram(models.Model):
+    _name = "premium.genetics.program"
+    _inherit = ["premium.genetics.program", "liveag.api.metadata.mixin"]
+
+
+class VanProgram(models.Model):
+    _name = "van.program"
+    _inherit = ["van.program", "liveag.api.metadata.mixin"]
+
+
+class ThirdPartyAge(models.Model):
+    _name = "third.party.age"
+    _inherit = ["third.party.age", "liveag.api.metadata.mixin"]
+
+
+class VacProgram(models.Model):
+    _name = "vac.program"
+    _inherit = ["vac.program", "liveag.api.metadata.mixin"]
+
+
+class LocationType(models.Model):
+    _name = "location.type"
+    _inherit = ["location.type", "liveag.api.metadata.mixin"]
+
+
+class WhoseOption(models.Model):
+    _name = "whose.option"
+    _inherit = ["whose.option", "liveag.api.metadata.mixin"]
+
+
+class SlideType(models.Model):
+    _name = "slide.type"
+    _inherit = ["slide.type", "liveag.api.metadata.mixin"]
+
+
+class WeightStop(models.Model):
+    _name = "weight.stop"
+    _inherit = ["weight.stop", "liveag.api.metadata.mixin"]
+
+
+class GapProgram(models.Model):
+    _name = "gap.program"
+    _inherit = ["gap.program", "liveag.api.metadata.mixin"]
+
+
+class ResRegion(models.Model):
+    _name = "res.region"
+    _inherit = ["res.region", "liveag.api.metadata.mixin"]
+
+
+class ResCountry(models.Model):
+    _name = "res.country"
+    _inherit = ["res.country", "liveag.api.metadata.mixin"]
+
+
+class ResCountryState(models.Model):
+    _name = "res.country.state"
+    _inherit = ["res.country.state", "liveag.api.metadata.mixin"]
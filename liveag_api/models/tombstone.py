@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+from odoo.addons.liveag_api.tools.changes import TOMBSTONE_RETENTION_DAYS
+
+
+class LiveAgApiTombstone(models.Model):
+    """Ids of hard-deleted records, replayed as deletions by the change feeds."""
+    _name = "liveag.api.tombstone"
+    _description = "LiveAg API Deleted Record"
+    _order = "create_date, id"
+
+    res_model = fields.Char(string="Model", required=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+
+    _res_model_create_date_idx = models.Index("(res_model, create_date, id)")
+
+    @api.model
+    def _record_deletion(self, records):
+        """Store a tombstone for each record about to be unlinked."""
+        if records:
+            self.sudo().create([{"res_model": records._name, "res_id": rid} for rid in records.ids])
+
+    @api.autovacuum
+    def _gc_tombstones(self):
+        limit_date = fields.Datetime.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        self.sudo().search([("create_date", "<", limit_date)]).unlink()
@@ -0,0 +1,46 @@
+from odoo.tests import common
+
+from odoo.addons.liveag_api.tools.pagination import search_page
+
+
+class PaginationTestCase(common.TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Keyset Pagination {index}'} for index in range(5)
+        ])
+        cls.env.flush_all()
+        # All in one second, some sharing the exact same timestamp
+        for partner, create_date in zip(cls.partners, [
+            '2026-01-05 10:00:00.000100',
+            '2026-01-05 10:00:00.000200',
+            '2026-01-05 10:00:00.000200',
+            '2026-01-05 10:00:00.000300',
+            '2026-01-05 10:00:00.000300',
+        ]):
+            cls.env.cr.execute(
+                "UPDATE res_partner SET create_date = %s WHERE id = %s", (create_date, partner.id)
+            )
+        cls.env.invalidate_all()
+        cls.domain = [('id', 'in', cls.partners.ids)]
+
+    def _page_through(self, order):
+        pagination = {'mode': 'cursor', 'limit': 2, 'per_page': 2, 'cursor': None}
+        ids = []
+        for _page in range(len(self.partners) + 1):
+            records, meta = search_page(self.env['res.partner'], self.domain, order, pagination)
+            ids += records.ids
+            if not meta['has_more']:
+                break
+            pagination['cursor'] = meta['next_cursor']
+        return ids
+
+    def test_cursor_same_second_desc(self):
+        expected = self.env['res.partner'].search(self.domain, order='create_date desc, id desc').ids
+        self.assertEqual(self._page_through('create_date desc'), expected)
+
+    def test_cursor_same_second_asc(self):
+        expected = self.env['res.partner'].search(self.domain, order='create_date asc, id asc').ids
+        self.assertEqual(self._page_through('create_date asc'), expected)
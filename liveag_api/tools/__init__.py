@@ -4,4 +4,8 @@ from . import clerk_jwt
 from . import liveag_auth
 from . import http_utils
 from . import roles
-from . import api_decorators
\ No newline at end of file
+from . import pagination
+from . import api_decorators
+from . import metadata
+from . import streaming
+from . import changes
@@ -4,7 +4,7 @@ from functools import wraps
 from odoo.http import request
 from odoo.addons.liveag_api.tools.http_utils import json_response
 from odoo.addons.liveag_api.tools.clerk_jwt import authenticate_clerk_jwt
-from odoo.addons.liveag_api.tools.liveag_auth import authenticate_liveag_token
+from odoo.addons.liveag_api.tools.liveag_auth import _extract_bearer_token, authenticate_liveag_token
 
 _logger = logging.getLogger(__name__)
 
@@ -43,15 +43,17 @@ def odoo_token_required(scope: str | None = None):
                 return json_response(err, status=401)
 
             request.api_env = env_as_user
-            request.api_user = token_rec.user_id.sudo()
+            # env_as_user.uid comes from the token cache; no token re-read needed
+            request.api_user = env_as_user.user.sudo()
             request.api_token = token_rec
             request.update_env(user=request.api_user.id)
 
+            token_str = _extract_bearer_token()
             _logger.info(
                 "API request: method=%s path=%s token=%s... uid=%s login=%s",
                 request.httprequest.method,
                 request.httprequest.path,
-                (token_rec.token or "")[:16] + "..." if token_rec.token else "(none)",
+                token_str[:16] if token_str else "(none)",
                 request.api_user.id,
                 request.api_user.login or "(none)",
             )
@@ -60,22 +62,42 @@ def odoo_token_required(scope: str | None = None):
         return wrapper
     return decorator
 
-def with_pagination(default_per_page=25, max_per_page=100):
+def with_pagination(default_per_page=25, max_per_page=100, allow_cursor=False):
     """
     Adds request.pagination = {
         "use": bool,
+        "mode": "offset" | "cursor",
         "page": int,
         "per_page": int,
         "limit": int,
         "offset": int,
+        "cursor": str | None,  # opaque token from a previous next_cursor
+        "with_count": bool,
     }
+    With allow_cursor=True a `cursor` param (empty for the first page) switches to
+    keyset mode; see tools.pagination.search_page. `count=0|1` toggles the total
+    count, which defaults to on for offset mode and off for cursor mode.
     """
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             page = request.params.get("page")
             per_page = request.params.get("per_page")
-            use = page is not None or per_page is not None
+            cursor = request.params.get("cursor") if allow_cursor else None
+            mode = "cursor" if cursor is not None else "offset"
+            use = page is not None or per_page is not None or cursor is not None
+
+            if mode == "cursor" and page is not None:
+                return json_response(
+                    {"error": "invalid_request", "error_description": "page and cursor cannot be combined"},
+                    status=400,
+                )
+
+            raw_count = request.params.get("count")
+            if raw_count is None:
+                with_count = mode == "offset"
+            else:
+                with_count = str(raw_count).strip().lower() in ("1", "true", "yes")
 
             try:
                 page_i = int(page) if page is not None else 1
@@ -100,10 +122,13 @@ def with_pagination(default_per_page=25, max_per_page=100):
 
             request.pagination = {
                 "use": use,
+                "mode": mode,
                 "page": page_i,
                 "per_page": per_page_i,
                 "limit": per_page_i,
                 "offset": (page_i - 1) * per_page_i,
+                "cursor": (cursor or "").strip() or None,
+                "with_count": with_count,
             }
 
             return fn(*args, **kwargs)
@@ -223,4 +248,20 @@ def with_sort(allowed_fields, default_field=None, default_order="desc", sort_par
             }
             return fn(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def with_fields(param="fields"):
+    """
+    Parse a sparse fieldset query param (comma-separated top-level keys); set
+    request.sparse_fields = frozenset of keys, or None when the param is absent
+    (full payload). Unknown keys are rejected by the serializer (InvalidFields).
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            raw = request.params.get(param)
+            parts = [p.strip() for p in str(raw).split(",") if p.strip()] if raw is not None else []
+            request.sparse_fields = frozenset(parts) if parts else None
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,162 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from odoo import fields
+from odoo.tools import SQL
+
+from odoo.addons.liveag_api.tools.liveag import serialize_contracts_for_list
+
+# write_date is the start time of the writing transaction, so rows can commit
+# with a timestamp behind a watermark clients already hold. The feed only
+# reaches up to the start of the oldest transaction still open on the
+# database (see _feed_horizon), and at most up to now - lag as a margin for
+# transactions that are just starting.
+CHANGE_FEED_LAG = timedelta(seconds=10)
+# Tombstones are kept this long; older watermarks must resync from scratch.
+TOMBSTONE_RETENTION_DAYS = 90
+# Contract states the feed reports as deletions.
+TOMBSTONE_STATES = ("canceled", "merged")
+
+
+class InvalidWatermark(ValueError):
+    """Raised when a change-feed watermark is malformed."""
+
+
+class ExpiredWatermark(ValueError):
+    """Raised when a watermark is older than the tombstone retention window."""
+
+
+def encode_watermark(state):
+    """Opaque watermark for {"t": horizon, "c": [ts, id], "d": [ts, id]}."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_watermark(token):
+    """
+    Parse a watermark from a previous response into
+    {"t": datetime, "c": (datetime, id), "d": (datetime, id)}.
+    An empty token starts the feed from the beginning.
+    """
+    if not token:
+        return {"t": None, "c": None, "d": None}
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        state = {"t": datetime.fromisoformat(payload["t"])}
+        for key in ("c", "d"):
+            position = payload.get(key)
+            state[key] = (datetime.fromisoformat(position[0]), int(position[1])) if position else None
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise InvalidWatermark("Invalid since parameter")
+    return state
+
+
+def _position(position):
+    return [position[0].isoformat(), position[1]] if position else None
+
+
+def _keyset_rows(Model, domain, time_field, position, horizon, limit):
+    """
+    [(id, timestamp)] of Model rows changed after position, up to horizon,
+    ordered by (time_field, id).
+
+    Compares full-precision database timestamps in SQL: the ORM rounds datetimes
+    to the second, which would repeat or skip rows sharing a second.
+    """
+    query = Model._search(domain + [(time_field, "<=", horizon)], order=f"{time_field}, id", limit=limit)
+    column = SQL.identifier(Model._table, time_field)
+    if position:
+        query.add_where(SQL("(%s, %s) > (%s, %s)", column, SQL.identifier(Model._table, "id"), position[0], position[1]))
+    Model.env.cr.execute(query.select(SQL.identifier(Model._table, "id"), column))
+    return Model.env.cr.fetchall()
+
+
+def _feed_horizon(env):
+    """
+    Latest timestamp the feed may report: no transaction still running can
+    commit rows stamped at or before it. Other sessions only, the request's
+    own transaction has not written anything the feed reads.
+    """
+    env.cr.execute(SQL(
+        """
+        SELECT LEAST(
+            (now() AT TIME ZONE 'UTC') - %s,
+            (SELECT min(xact_start) AT TIME ZONE 'UTC'
+               FROM pg_stat_activity
+              WHERE datname = current_database()
+                AND pid != pg_backend_pid()
+                AND xact_start IS NOT NULL)
+        )
+        """,
+        CHANGE_FEED_LAG,
+    ))
+    return env.cr.fetchone()[0]
+
+
+def contract_changes(env, since, limit, sparse_fields=None):
+    """
+    One page of the contract change feed after the since watermark.
+
+    Merges contract writes (by write_date) and hard-delete tombstones (by
+    create_date) in time order. Archived, canceled and merged contracts are
+    reported as deletions. Contracts are read through env, so record rules
+    apply; tombstones only expose ids.
+
+    Returns (items, watermark, has_more). Raises InvalidWatermark or
+    ExpiredWatermark for an unusable since value.
+    """
+    state = decode_watermark(since)
+    now = fields.Datetime.now()
+    if state["t"] and state["t"] < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+        raise ExpiredWatermark("Watermark is older than %s days; resync the full list" % TOMBSTONE_RETENTION_DAYS)
+    horizon = _feed_horizon(env)
+
+    Contract = env["consignment.contract"].with_context(active_test=False)
+    Tombstone = env["liveag.api.tombstone"].sudo()
+    events = [
+        (ts, 0, rid) for rid, ts in _keyset_rows(Contract, [], "write_date", state["c"], horizon, limit + 1)
+    ] + [
+        (ts, 1, rid) for rid, ts in _keyset_rows(
+            Tombstone, [("res_model", "=", "consignment.contract")], "create_date", state["d"], horizon, limit + 1
+        )
+    ]
+    events.sort()
+    has_more = len(events) > limit
+    events = events[:limit]
+
+    contracts = Contract.browse([rid for _ts, source, rid in events if source == 0])
+    contracts.fetch(["active", "state", "create_date"])
+    tombstones = Tombstone.browse([rid for _ts, source, rid in events if source == 1])
+    tombstones.fetch(["res_id"])
+    live = contracts.filtered(lambda c: c.active and c.state not in TOMBSTONE_STATES)
+    payloads = dict(zip(live.ids, serialize_contracts_for_list(live, fields=sparse_fields)))
+    since_time = state["c"][0] if state["c"] else None
+
+    items = []
+    for ts, source, rid in events:
+        if source == 1:
+            items.append({"id": Tombstone.browse(rid).res_id, "op": "delete", "reason": "deleted", "changed_at": ts})
+            continue
+        contract = Contract.browse(rid)
+        if rid not in payloads:
+            reason = "archived" if not contract.active else contract.state
+            items.append({"id": rid, "op": "delete", "reason": reason, "changed_at": ts})
+            continue
+        created = since_time is None or contract.create_date > since_time.replace(microsecond=0)
+        items.append({
+            "id": rid,
+            "op": "create" if created else "update",
+            "changed_at": ts,
+            "data": payloads[rid],
+        })
+
+    for key, source in (("c", 0), ("d", 1)):
+        last = [(ts, rid) for ts, src, rid in events if src == source]
+        if last:
+            state[key] = last[-1]
+    # A page that ends early has seen everything up to the horizon
+    state["t"] = events[-1][0] if has_more else horizon
+    watermark = encode_watermark({"t": state["t"].isoformat(), "c": _position(state["c"]), "d": _position(state["d"])})
+    return items, watermark, has_more
@@ -1,18 +1,31 @@
 from functools import wraps
 from odoo import fields
 from odoo.http import request
+import hashlib
+import json
 import logging
+import threading
 import time
 import jwt
-from jwt import PyJWKClient
+from jwt import PyJWKClient, PyJWKSet
 
 from odoo.addons.liveag_api.tools.http_utils import json_response
+from odoo.addons.liveag_api.tools.liveag_auth import LocalTokenCache
 
 _logger = logging.getLogger(__name__)
 
-# Very small in-process cache; good enough for most Odoo deployments.
+# Very small in-process caches; good enough for most Odoo deployments.
 # If you're running multiple workers, each worker will have its own cache.
-_JWKS_CACHE = {}  # jwks_url -> (PyJWKClient, expires_at_epoch)
+_JWKS_CACHE = {}  # (jwks_url, jwks_file) -> JWKSKeys
+
+# Verified claims live until the token's exp; the user mapping is re-resolved
+# every minute so archived/remapped users lose access quickly.
+_CLAIMS_CACHE = LocalTokenCache(max_size=4096, ttl=24 * 3600)
+_USER_CACHE = LocalTokenCache(max_size=4096, ttl=60)
+
+JWKS_REFRESH_SECONDS = 3600
+# Minimum delay between synchronous refetches for an unknown kid (key rotation)
+JWKS_REFETCH_SECONDS = 60
 
 # Clerk (or its CDN) may return 403 for requests with default Python User-Agent.
 JWKS_HEADERS = {
@@ -20,25 +33,97 @@ JWKS_HEADERS = {
     "Accept": "application/json",
 }
 
-def _get_jwk_client(jwks_url: str, ttl_seconds: int = 3600) -> PyJWKClient:
-    now = int(time.time())
-    cached = _JWKS_CACHE.get(jwks_url)
-    if cached and cached[1] > now:
-        return cached[0]
-    client = PyJWKClient(jwks_url, headers=JWKS_HEADERS)
-    _JWKS_CACHE[jwks_url] = (client, now + ttl_seconds)
-    return client
 
-def verify_clerk_jwt(token: str, *, jwks_url: str, issuer: str, audience: str | None = None) -> dict:
+class JWKSKeys:
+    """
+    Signing keys of one JWKS source, by kid.
+
+    Keys are loaded on first use, then refreshed in a background thread once
+    they are older than JWKS_REFRESH_SECONDS so fetches stay off the request
+    path. An unknown kid forces a synchronous refetch (rate limited). A local
+    JWKS file can replace the URL for air-gapped setups.
+    """
+
+    def __init__(self, jwks_url=None, jwks_file=None):
+        self.jwks_url = jwks_url
+        self.jwks_file = jwks_file
+        self._keys = {}
+        self._fetched_at = 0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self.jwks_file:
+            with open(self.jwks_file) as jwks_file:
+                jwk_set = PyJWKSet.from_dict(json.load(jwks_file))
+        else:
+            jwk_set = PyJWKClient(self.jwks_url, headers=JWKS_HEADERS).get_jwk_set()
+        keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys}
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = time.time()
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                self._load()
+            except Exception:
+                _logger.exception("Background JWKS refresh failed for %s", self.jwks_file or self.jwks_url)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=refresh, name="clerk.jwks", daemon=True).start()
+
+    def get_signing_key(self, kid):
+        age = time.time() - self._fetched_at
+        if not self._keys or (kid not in self._keys and age > JWKS_REFETCH_SECONDS):
+            self._load()
+        elif age > JWKS_REFRESH_SECONDS:
+            self._refresh_in_background()
+        keys = self._keys
+        if kid is None and len(keys) == 1:
+            return next(iter(keys.values()))
+        if kid not in keys:
+            raise jwt.InvalidTokenError(f"Unable to find a signing key that matches: {kid}")
+        return keys[kid]
+
+
+def _get_jwks(jwks_url: str | None, jwks_file: str | None = None) -> JWKSKeys:
+    source = (jwks_url, jwks_file)
+    jwks = _JWKS_CACHE.get(source)
+    if jwks is None:
+        jwks = _JWKS_CACHE.setdefault(source, JWKSKeys(jwks_url, jwks_file))
+    return jwks
+
+
+def clerk_config(env) -> dict:
+    """Clerk settings from ir.config_parameter, cached until a parameter changes."""
+    jwks_url, issuer, audience, jwks_file = env["liveag.api.clerk"]._get_clerk_config()
+    return {"jwks_url": jwks_url, "issuer": issuer, "audience": audience, "jwks_file": jwks_file}
+
+
+def verify_clerk_jwt(token: str, *, jwks_url: str | None, issuer: str, audience: str | None = None,
+                     jwks_file: str | None = None) -> dict:
     """
-    Verifies RS256 Clerk JWT using JWKS.
+    Verifies RS256 Clerk JWT using JWKS (from jwks_url, or jwks_file if given).
 
     Requires standard claims exp/iat/iss/sub.
     If audience is provided, verifies aud as well.
     Returns decoded claims dict if valid; raises on failure.
+    Verified claims are cached by token hash until the token expires.
     """
-    jwk_client = _get_jwk_client(jwks_url)
-    signing_key = jwk_client.get_signing_key_from_jwt(token).key
+    cache_key = (hashlib.sha256(token.encode()).hexdigest(), issuer, audience)
+    claims = _CLAIMS_CACHE.get(cache_key)
+    if claims is not None:
+        return dict(claims)
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    signing_key = _get_jwks(jwks_url, jwks_file).get_signing_key(kid)
 
     options = {
         "require": ["exp", "iat", "iss", "sub"],
@@ -53,6 +138,7 @@ def verify_clerk_jwt(token: str, *, jwks_url: str, issuer: str, audience: str |
         audience=audience,
         options=options,
     )
+    _CLAIMS_CACHE.set(cache_key, dict(decoded), decoded["exp"])
     return decoded
 
 def _extract_bearer_token():
@@ -75,13 +161,10 @@ def authenticate_clerk_jwt(required_scope: str | None = None):
             "error_description": "Missing Authorization: Bearer token",
         }
 
-    # Pull config from ir.config_parameter (recommended)
-    ICP = request.env["ir.config_parameter"].sudo()
-    jwks_url = ICP.get_param("clerk.jwks_url")
-    issuer   = ICP.get_param("clerk.issuer")
-    audience = ICP.get_param("clerk.audience")  # optional, can be empty
+    # Config from ir.config_parameter, snapshotted until a parameter changes
+    config = clerk_config(request.env)
 
-    if not jwks_url or not issuer:
+    if not (config["jwks_url"] or config["jwks_file"]) or not config["issuer"]:
         _logger.error("Clerk JWT config missing (jwks_url/issuer)")
         return None, None, None, {
             "error": "server_error",
@@ -89,12 +172,7 @@ def authenticate_clerk_jwt(required_scope: str | None = None):
         }
 
     try:
-        claims = verify_clerk_jwt(
-            token_str,
-            jwks_url=jwks_url,
-            issuer=issuer,
-            audience=audience or None,
-        )
+        claims = verify_clerk_jwt(token_str, **config)
     except Exception:
         _logger.exception("Clerk JWT verification failed")
         return None, None, None, {
@@ -120,8 +198,10 @@ def authenticate_clerk_jwt(required_scope: str | None = None):
 
     Users = request.env["res.users"].sudo()
 
-    user = None
-    if clerk_sub:
+    user_key = (request.env.cr.dbname, clerk_sub, email)
+    user_id = _USER_CACHE.get(user_key)
+    user = Users.browse(user_id) if user_id else None
+    if not user and clerk_sub:
         # if you add a custom field clerk_user_id on res.users:
         user = Users.search([("clerk_user_id", "=", clerk_sub)], limit=1)
 
@@ -129,6 +209,9 @@ def authenticate_clerk_jwt(required_scope: str | None = None):
         # fallback: match by email
         user = Users.search([("login", "=", email)], limit=1) or Users.search([("email", "=", email)], limit=1)
 
+    if user and not user_id:
+        _USER_CACHE.set(user_key, user.id)
+
     if not user:
         return None, None, None, {
             "error": "invalid_token",
@@ -5,6 +5,25 @@ from urllib.parse import urlencode
 from urllib.parse import urlparse, urlunparse, parse_qs
 from datetime import date, datetime
 
+class InvalidFields(ValueError):
+    """Raised when a fields= selection names keys the payload does not have."""
+
+def select_fields(spec, fields=None):
+    """
+    Build a payload from {key: callable}, evaluating only the selected keys.
+
+    fields: optional iterable of top-level keys (sparse fieldset); `id` is always kept.
+    Keys that are not selected are never computed, so their reads are skipped too.
+    """
+    if fields is None:
+        return {key: compute() for key, compute in spec.items()}
+    unknown = set(fields) - set(spec)
+    if unknown:
+        raise InvalidFields(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(spec)}"
+        )
+    return {key: compute() for key, compute in spec.items() if key == 'id' or key in fields}
+
 def _iso(v):
     if isinstance(v, (datetime, date)):
         return v.isoformat()
@@ -45,119 +64,217 @@ def serialize_reps_for_contract(contract):
 		})
 	return rep_info
 
-def basic_reps_for_contract(contract):
+# Catalog-change states that flag a field as changed in API payloads.
+CATALOG_CHANGE_FLAG_STATES = ('pending', 'approved')
+
+# Columns read by serialize_contract_for_list; fetched up front for a whole page.
+CONTRACT_LIST_FIELDS = [
+    'lot_number', 'sale_type', 'state', 'seller_id', 'create_date', 'auction_id',
+    'contract_type', 'head1', 'kind1', 'weight1', 'head2', 'kind2', 'weight2',
+    'delivery_date_start', 'delivery_date_end', 'rep_ids',
+]
+
+def catalog_change_index(contracts, states=CATALOG_CHANGE_FLAG_STATES):
+    """
+    Load catalog changes for a recordset with one query.
+
+    Returns {contract_id: set(field_name)} for catalog changes in the given states.
+    Contracts without changes are absent from the dict.
+    """
+    index = contracts._get_catalog_change_index(states)
+    return {contract_id: set(changes) for contract_id, changes in index.items()}
+
+def _field_changed(contract, field_names, changed_fields=None):
+    """has_field_catalog_change, answered from a prefetched set when one is given."""
+    if changed_fields is None:
+        return contract.has_field_catalog_change(field_names)
+    if isinstance(field_names, str):
+        return field_names in changed_fields
+    return any(name in changed_fields for name in field_names)
+
+def _catalog_changed(contract):
+    """
+    changed(field_names) for one contract, like has_field_catalog_change.
+    The changed field names are collected once, on first use, from
+    catalog_changes_ids (prefetched for every contract of the recordset).
+    """
+    loaded = {}
+    def changed(field_names):
+        if 'fields' not in loaded:
+            loaded['fields'] = {
+                change.field_name for change in contract.catalog_changes_ids
+                if change.state in CATALOG_CHANGE_FLAG_STATES
+            }
+        return _field_changed(contract, field_names, loaded['fields'])
+    return changed
+
+def _memoized(memo, key, compute):
+    if memo is None:
+        return compute()
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+def basic_reps_for_contract(contract, memo=None):
 	reps = list(contract.rep_ids)
 	reps.sort(key=lambda x: x.consigning_rep or x.percentage_commission, reverse=True)
 	rep_names = []
 	for rep in reps:
-		rep_names.append({'name': rep.rep_id.name, 'phone': contract.format_phone(rep.rep_id.phone) or None, 'consigning_rep': rep.consigning_rep})
+		phone = rep.rep_id.phone
+		formatted = _memoized(memo, ('phone', phone), lambda: contract.format_phone(phone))
+		rep_names.append({'name': rep.rep_id.name, 'phone': formatted or None, 'consigning_rep': rep.consigning_rep})
 	return rep_names
 
-def serialize_contract_for_list(contract):
-    delivery_range = contract.format_delivery_date_range(contract.delivery_date_start, contract.delivery_date_end)
-    auction = serialize_auction_preview(contract.auction_id)
-    return {
-        'id': contract.id,
-        'lot_number': contract.lot_number or None,
-        'sale_type': contract.sale_type.name if contract.sale_type else None,
-        'status': dict(contract._fields['state'].selection).get(contract.state, 'Unknown').lower(),
-        'seller': {'id': contract.seller_id.id, 'name': contract.seller_id.name} if contract.seller_id else None,
-        'created_on': contract.create_date,
-        'auction': auction,
-        'contract_type': {
+def _delivery_range(contract, memo=None):
+    start, end = contract.delivery_date_start, contract.delivery_date_end
+    return _memoized(memo, ('delivery_range', start, end), lambda: contract.format_delivery_date_range(start, end))
+
+def _status(contract, memo=None):
+    states = _memoized(memo, 'state_labels', lambda: dict(contract._fields['state'].selection))
+    return states.get(contract.state, 'Unknown').lower()
+
+def serialize_contract_for_list(contract, changed_fields=None, memo=None, fields=None):
+    """
+    List payload for a single consignment.contract.
+
+    changed_fields: optional set of field names with catalog changes (see catalog_change_index);
+    when omitted the flags are read from the contract itself.
+    memo: optional dict shared across rows to reuse formatted phones and date ranges.
+    fields: optional sparse fieldset (see select_fields).
+    """
+    def changed(field_names):
+        return _field_changed(contract, field_names, changed_fields)
+
+    return select_fields({
+        'id': lambda: contract.id,
+        'lot_number': lambda: contract.lot_number or None,
+        'sale_type': lambda: contract.sale_type.name if contract.sale_type else None,
+        'status': lambda: _status(contract, memo),
+        'seller': lambda: {'id': contract.seller_id.id, 'name': contract.seller_id.name} if contract.seller_id else None,
+        'created_on': lambda: contract.create_date,
+        'auction': lambda: serialize_auction_preview(contract.auction_id),
+        'contract_type': lambda: {
             'value': contract.contract_type.name,
-            'catalog_change': contract.has_field_catalog_change('contract_type'),
+            'catalog_change': changed('contract_type'),
         } if contract.contract_type else None,
-        'head1': {
+        'head1': lambda: {
             'value': contract.head1,
-            'catalog_change': contract.has_field_catalog_change('head1'),
+            'catalog_change': changed('head1'),
         } if contract.head1 else None,
-        'kind1': {
+        'kind1': lambda: {
             'value': contract.kind1.name,
-            'catalog_change': contract.has_field_catalog_change('kind1'),
+            'catalog_change': changed('kind1'),
         } if contract.kind1 else None,
-        'weight1': {
+        'weight1': lambda: {
             'value': contract.weight1,
-            'catalog_change': contract.has_field_catalog_change('weight1'),
+            'catalog_change': changed('weight1'),
         } if contract.weight1 else None,
-        'head2': {
+        'head2': lambda: {
             'value': contract.head2,
-            'catalog_change': contract.has_field_catalog_change('head2'),
+            'catalog_change': changed('head2'),
         } if contract.head2 else None,
-        'kind2': {
+        'kind2': lambda: {
             'value': contract.kind2.name,
-            'catalog_change': contract.has_field_catalog_change('kind2'),
+            'catalog_change': changed('kind2'),
         } if contract.kind2 else None,
-        'weight2': {
+        'weight2': lambda: {
             'value': contract.weight2,
-            'catalog_change': contract.has_field_catalog_change('weight2'),
+            'catalog_change': changed('weight2'),
         } if contract.weight2 else None,
-        'delivery_range': {'value': delivery_range, 'catalog_change': contract.has_field_catalog_change(['delivery_date_start', 'delivery_date_end'])},
-        'reps': basic_reps_for_contract(contract),
-    }
+        'delivery_range': lambda: {'value': _delivery_range(contract, memo), 'catalog_change': changed(['delivery_date_start', 'delivery_date_end'])},
+        'reps': lambda: basic_reps_for_contract(contract, memo),
+    }, fields)
 
-def serialize_contract_preview(contract):
-    delivery_range = contract.format_delivery_date_range(contract.delivery_date_start, contract.delivery_date_end)
-    auction = serialize_auction_preview(contract.auction_id)
+# List keys whose payload carries no catalog-change flag.
+CONTRACT_LIST_PLAIN_KEYS = frozenset({'id', 'lot_number', 'sale_type', 'status', 'seller', 'created_on', 'auction', 'reps'})
+
+def serialize_contracts_for_list(contracts, fields=None):
+    """
+    List payloads for a whole recordset (one page of /api/v3/contracts).
+
+    Fetches the list columns and related names for every contract at once and
+    resolves all catalog-change flags from a single catalog.change query.
+    With a sparse fieldset, relations and catalog changes that are not
+    requested are not loaded.
+    """
+    if not contracts:
+        return []
+    contracts.fetch(CONTRACT_LIST_FIELDS)
+    if fields is None or 'auction' in fields:
+        contracts.auction_id.fetch(['name', 'sale_date_begin', 'sale_date_est_end', 'location', 'sale_type', 'state'])
+    if fields is None or 'reps' in fields:
+        contracts.rep_ids.fetch(['rep_id', 'consigning_rep', 'percentage_commission'])
+        contracts.rep_ids.rep_id.fetch(['name', 'phone'])
+    if fields is None or not set(fields) <= CONTRACT_LIST_PLAIN_KEYS:
+        changes = catalog_change_index(contracts)
+    else:
+        changes = {}
+    memo = {}
+    return [
+        serialize_contract_for_list(contract, changed_fields=changes.get(contract.id, set()), memo=memo, fields=fields)
+        for contract in contracts
+    ]
+
+def _contract_preview_spec(contract, changed):
     return {
-        'id': contract.id,
-        'created_on': contract.create_date,
-        'lot_number': contract.lot_number or None,
-        'status': dict(contract._fields['state'].selection).get(contract.state, 'Unknown').lower(),
-        'seller': {'id': contract.seller_id.id, 'name': contract.seller_id.name} if contract.seller_id else None,
-        'sale_type': contract.sale_type.name if contract.sale_type else None,
-        'auction': auction,
-        'contract_type': {
+        'id': lambda: contract.id,
+        'created_on': lambda: contract.create_date,
+        'lot_number': lambda: contract.lot_number or None,
+        'status': lambda: _status(contract),
+        'seller': lambda: {'id': contract.seller_id.id, 'name': contract.seller_id.name} if contract.seller_id else None,
+        'sale_type': lambda: contract.sale_type.name if contract.sale_type else None,
+        'auction': lambda: serialize_auction_preview(contract.auction_id),
+        'contract_type': lambda: {
             'value': contract.contract_type.name,
-            'catalog_change': contract.has_field_catalog_change('contract_type'),
+            'catalog_change': changed('contract_type'),
         } if contract.contract_type else None,
-        'sell_by_head': {
+        'sell_by_head': lambda: {
             'value': contract.sell_by_head,
-            'catalog_change': contract.has_field_catalog_change('sell_by_head'),
+            'catalog_change': changed('sell_by_head'),
         },
-        'video_link': contract.video_link or None,
-        'head1': {
+        'video_link': lambda: contract.video_link or None,
+        'head1': lambda: {
             'value': contract.head1,
-            'catalog_change': contract.has_field_catalog_change('head1'),
+            'catalog_change': changed('head1'),
         } if contract.head1 else None,
-        'kind1': {
+        'kind1': lambda: {
             'value': contract.kind1.name,
-            'catalog_change': contract.has_field_catalog_change('kind1'),
+            'catalog_change': changed('kind1'),
         } if contract.kind1 else None,
-        'weight1': {
+        'weight1': lambda: {
             'value': contract.weight1,
-            'catalog_change': contract.has_field_catalog_change('weight1'),
+            'catalog_change': changed('weight1'),
         } if contract.weight1 else None,
-        'head2': {
+        'head2': lambda: {
             'value': contract.head2,
-            'catalog_change': contract.has_field_catalog_change('head2'),
+            'catalog_change': changed('head2'),
         } if contract.head2 else None,
-        'kind2': {
+        'kind2': lambda: {
             'value': contract.kind2.name,
-            'catalog_change': contract.has_field_catalog_change('kind2'),
+            'catalog_change': changed('kind2'),
         } if contract.kind2 else None,
-        'weight2': {
+        'weight2': lambda: {
             'value': contract.weight2,
-            'catalog_change': contract.has_field_catalog_change('weight2'),
+            'catalog_change': changed('weight2'),
         } if contract.weight2 else None,
-        'price_back': {
+        'price_back': lambda: {
             'value': contract.price_back,
-            'catalog_change': contract.has_field_catalog_change('price_back'),
+            'catalog_change': changed('price_back'),
         } if contract.price_back else None,
-        'delivery_range': {'value': delivery_range, 'catalog_change': contract.has_field_catalog_change(['delivery_date_start', 'delivery_date_end'])},
-        'origin': {
+        'delivery_range': lambda: {'value': _delivery_range(contract), 'catalog_change': changed(['delivery_date_start', 'delivery_date_end'])},
+        'origin': lambda: {
             'value': f"{contract.origin.name} {contract.origin_description}" if contract.origin_description else f"{contract.origin.name}",
-            'catalog_change': contract.has_field_catalog_change('origin'),
+            'catalog_change': changed('origin'),
         } if contract.origin else None,
-        'origin_description': {
+        'origin_description': lambda: {
             'value': contract.origin_description,
-            'catalog_change': contract.has_field_catalog_change('origin_description'),
+            'catalog_change': changed('origin_description'),
         } if contract.origin_description else None,
-        'location': {
+        'location': lambda: {
             'value': contract.location_description or None,
-            'catalog_change': contract.has_field_catalog_change(['nearest_town', 'state_of_nearest_town', 'direction_to_nearest_town', 'distance_to_nearest_town', 'buyer_fob']),
+            'catalog_change': changed(['nearest_town', 'state_of_nearest_town', 'direction_to_nearest_town', 'distance_to_nearest_town', 'buyer_fob']),
         } if contract.nearest_town and contract.state_of_nearest_town else None,
-        'slide': {
+        'slide': lambda: {
             'value': {
                 'type': contract.slide_type.label,
                 'over': contract.slide_over or None,
@@ -165,265 +282,271 @@ def serialize_contract_preview(contract):
                 'both': contract.slide_both or None,
                 'description': contract.short_slide_description or None
             },
-            'catalog_change': contract.has_field_catalog_change(['slide_type', 'slide_over', 'slide_under', 'slide_both']),
+            'catalog_change': changed(['slide_type', 'slide_over', 'slide_under', 'slide_both']),
         } if contract.slide_type else None,
-        'breed_type': {
+        'breed_type': lambda: {
             'value': contract.breed_type,
-            'catalog_change': contract.has_field_catalog_change('breed_type'),
+            'catalog_change': changed('breed_type'),
         } if contract.breed_type else None,
-        'frame_size': {
+        'frame_size': lambda: {
             'value': contract.frame_size.name,
-            'catalog_change': contract.has_field_catalog_change('frame_size'),
+            'catalog_change': changed('frame_size'),
         } if contract.frame_size else None,
-        'flesh_type': {
+        'flesh_type': lambda: {
             'value': contract.flesh_type.name,
-            'catalog_change': contract.has_field_catalog_change('flesh_type'),
+            'catalog_change': changed('flesh_type'),
         } if contract.flesh_type else None,
-        'weight_variance': {
+        'weight_variance': lambda: {
             'value': contract.weight_variance.name,
-            'catalog_change': contract.has_field_catalog_change('weight_variance'),
+            'catalog_change': changed('weight_variance'),
         } if contract.weight_variance else None,
-        'horns': {
+        'horns': lambda: {
             'value': contract.horns.name,
-            'catalog_change': contract.has_field_catalog_change('horns'),
+            'catalog_change': changed('horns'),
         } if contract.horns else None,
-        'feeding_program': {
+        'feeding_program': lambda: {
             'value': contract.feeding_program,
-            'catalog_change': contract.has_field_catalog_change('feeding_program'),
+            'catalog_change': changed('feeding_program'),
         } if contract.feeding_program else None,
-        'weighing_conditions': {
+        'weighing_conditions': lambda: {
             'value': contract.weighing_conditions,
-            'catalog_change': contract.has_field_catalog_change('weighing_conditions'),
+            'catalog_change': changed('weighing_conditions'),
         } if contract.weighing_conditions else None,
-        'vaccination_desc': {
+        'vaccination_desc': lambda: {
             'value': contract.full_vaccination_desc,
-            'catalog_change': contract.has_field_catalog_change('full_vaccination_desc'),
+            'catalog_change': changed('full_vaccination_desc'),
         } if contract.full_vaccination_desc else None,
-        'comments': {
+        'comments': lambda: {
             'value': contract.full_comments,
-            'catalog_change': contract.has_field_catalog_change('full_comments'),
+            'catalog_change': changed('full_comments'),
         } if contract.full_comments else None,
-        'reps': basic_reps_for_contract(contract),
-        'program_icons': [{'url':program.image_url, 'name':program.name} for program in contract.program_icon_ids] if contract.program_icon_ids else None,
-        'has_catalog_change': contract.has_catalog_changes,
-        'load_option': {
+        'reps': lambda: basic_reps_for_contract(contract),
+        'program_icons': lambda: [{'url':program.image_url, 'name':program.name} for program in contract.program_icon_ids] if contract.program_icon_ids else None,
+        'has_catalog_change': lambda: contract.has_catalog_changes,
+        'load_option': lambda: {
             'value': contract.load_option,
-            'catalog_change': contract.has_field_catalog_change('load_option'),
+            'catalog_change': changed('load_option'),
         } if contract.load_option else None,
-        'option': {
+        'option': lambda: {
             'value': contract.option_on_contract,
             'description': contract.option_description,
             'can_merge': contract.can_merge_option_contracts,
-            'catalog_change': contract.has_field_catalog_change('option_contract_ids'),
+            'catalog_change': changed('option_contract_ids'),
         } if contract.option_on_contract else None,
     }
 
-def serialize_contract_detailed(contract):
-    return {
-        **serialize_contract_preview(contract),
-        'weight_stop': {
+def serialize_contract_preview(contract, fields=None):
+    """Preview payload for a consignment.contract; fields is an optional sparse fieldset."""
+    return select_fields(_contract_preview_spec(contract, _catalog_changed(contract)), fields)
+
+def serialize_contract_detailed(contract, fields=None):
+    """Preview payload plus detail keys; fields is an optional sparse fieldset."""
+    changed = _catalog_changed(contract)
+    return select_fields({
+        **_contract_preview_spec(contract, changed),
+        'weight_stop': lambda: {
             'value': contract.weight_stop.name,
-            'catalog_change': contract.has_field_catalog_change('weight_stop'),
+            'catalog_change': changed('weight_stop'),
         } if contract.weight_stop else None,
-        'all_black_hided': {
+        'all_black_hided': lambda: {
             'value': contract.all_black_hided,
-            'catalog_change': contract.has_field_catalog_change('all_black_hided'),
+            'catalog_change': changed('all_black_hided'),
         },
-        'implanted_type': {
+        'implanted_type': lambda: {
             'value': contract.implanted_type.name,
-            'catalog_change': contract.has_field_catalog_change('implanted_type'),
+            'catalog_change': changed('implanted_type'),
         } if contract.implanted_type else None,
-        'implanted_date': {
+        'implanted_date': lambda: {
             'value': {
                 'month': contract.implanted_month,
                 'year': contract.implanted_year,
             },
-            'catalog_change': contract.has_field_catalog_change(['implanted_month', 'implanted_year', 'implanted_date']),
+            'catalog_change': changed(['implanted_month', 'implanted_year', 'implanted_date']),
         } if contract.implanted_date else None,
-        'castration': {
+        'castration': lambda: {
             'value': contract.castration.name,
-            'catalog_change': contract.has_field_catalog_change('castration'),
+            'catalog_change': changed('castration'),
         } if contract.castration else None,
-        'bangs_vacc': {
+        'bangs_vacc': lambda: {
             'value': contract.bangs_vaccinated.name,
-            'catalog_change': contract.has_field_catalog_change('bangs_vaccinated'),
+            'catalog_change': changed('bangs_vaccinated'),
         } if contract.bangs_vaccinated else None,
-        'country': {
+        'country': lambda: {
             'value': contract.country_id.code,
-            'catalog_change': contract.has_field_catalog_change('country_id'),
+            'catalog_change': changed('country_id'),
         } if contract.country_id else None,
-        'programs': {
+        'programs': lambda: {
             'vac_program': {
                 'value': contract.vac_program.name,
-                'catalog_change': contract.has_field_catalog_change('vac_program'),
+                'catalog_change': changed('vac_program'),
             } if contract.vac_program else None,
             'special_section': {
                 'value': contract.special_section.name,
-                'catalog_change': contract.has_field_catalog_change('special_section'),
+                'catalog_change': changed('special_section'),
             } if contract.special_section else None,
             'genetic_merit_program': {
                 'value': contract.genetic_merit_program.name,
-                'catalog_change': contract.has_field_catalog_change('genetic_merit_program'),
+                'catalog_change': changed('genetic_merit_program'),
             } if contract.genetic_merit_program else None,
             'value_added_nutrition': {
                 'value': contract.value_added_nutrition.name,
-                'catalog_change': contract.has_field_catalog_change('value_added_nutrition'),
+                'catalog_change': changed('value_added_nutrition'),
             } if contract.value_added_nutrition else None,
             'premium_genetics': {
                 'value': [
                     program.name for program in contract.premium_genetics_program
                 ],
-                'catalog_change': contract.has_field_catalog_change('premium_genetics_program'),
+                'catalog_change': changed('premium_genetics_program'),
             } if contract.premium_genetics_program else None,
             'pi_free': {
                 'value': contract.pi_free,
-                'catalog_change': contract.has_field_catalog_change('pi_free'),
+                'catalog_change': changed('pi_free'),
             },
             'tag_840': {
                 'value': contract.tag_840,
-                'catalog_change': contract.has_field_catalog_change('tag_840'),
+                'catalog_change': changed('tag_840'),
             },
             'source_age_program': {
                 'value': contract.source_age_program.name,
-                'catalog_change': contract.has_field_catalog_change('source_age_program'),
+                'catalog_change': changed('source_age_program'),
             } if contract.source_age_program else None,
             'gap_program': {
                 'value': contract.gap_program.name,
-                'catalog_change': contract.has_field_catalog_change('gap_program'),
+                'catalog_change': changed('gap_program'),
             } if contract.gap_program else None,
             'natural': {
                 'value': contract.natural,
-                'catalog_change': contract.has_field_catalog_change('natural'),
+                'catalog_change': changed('natural'),
             },
             'natural_plus': {
                 'value': contract.natural_plus,
-                'catalog_change': contract.has_field_catalog_change('natural_plus'),
+                'catalog_change': changed('natural_plus'),
             },
             'nhtc': {
                 'value': contract.nhtc,
-                'catalog_change': contract.has_field_catalog_change('nhtc'),
+                'catalog_change': changed('nhtc'),
             },
             'verified_natural': {
                 'value': contract.verified_natural,
-                'catalog_change': contract.has_field_catalog_change('verified_natural'),
+                'catalog_change': changed('verified_natural'),
             },
             'bqa_certified': {
                 'value': contract.bqa_certified,
-                'catalog_change': contract.has_field_catalog_change('bqa_certified'),
+                'catalog_change': changed('bqa_certified'),
             },
             'beef_care': {
                 'value': contract.beef_care,
-                'catalog_change': contract.has_field_catalog_change('beef_care'),
+                'catalog_change': changed('beef_care'),
             },
             'cfp': {
                 'value': contract.cfp,
-                'catalog_change': contract.has_field_catalog_change('cfp'),
+                'catalog_change': changed('cfp'),
             },
             'verified_grassfed': {
                 'value': contract.verified_grassfed,
-                'catalog_change': contract.has_field_catalog_change('verified_grassfed'),
+                'catalog_change': changed('verified_grassfed'),
             },
             'organic': {
                 'value': contract.organic,
-                'catalog_change': contract.has_field_catalog_change('organic'),
+                'catalog_change': changed('organic'),
             },
             'non_gmo': {
                 'value': contract.non_gmo,
-                'catalog_change': contract.has_field_catalog_change('non_gmo'),
+                'catalog_change': changed('non_gmo'),
             },
             'imi_raise_well': {
                 'value': contract.imi_raise_well,
-                'catalog_change': contract.has_field_catalog_change('imi_raise_well'),
+                'catalog_change': changed('imi_raise_well'),
             },
             'imi_pasture_raised': {
                 'value': contract.imi_pasture_raised,
-                'catalog_change': contract.has_field_catalog_change('imi_pasture_raised'),
+                'catalog_change': changed('imi_pasture_raised'),
             },
         },
-        'current_fob': {
+        'current_fob': lambda: {
             'value': contract.current_fob.name,
-            'catalog_change': contract.has_field_catalog_change('current_fob'),
+            'catalog_change': changed('current_fob'),
         } if contract.current_fob else None,
-        'distance_to_nearest_town': {
+        'distance_to_nearest_town': lambda: {
             'value': contract.distance_to_nearest_town,
-            'catalog_change': contract.has_field_catalog_change('distance_to_nearest_town'),
+            'catalog_change': changed('distance_to_nearest_town'),
         } if contract.distance_to_nearest_town else None,
-        'direction_to_nearest_town': {
+        'direction_to_nearest_town': lambda: {
             'value': contract.direction_to_nearest_town,
-            'catalog_change': contract.has_field_catalog_change('direction_to_nearest_town'),
+            'catalog_change': changed('direction_to_nearest_town'),
         } if contract.direction_to_nearest_town else None,
-        'nearest_town': {
+        'nearest_town': lambda: {
             'value': contract.nearest_town,
-            'catalog_change': contract.has_field_catalog_change('nearest_town'),
+            'catalog_change': changed('nearest_town'),
         } if contract.nearest_town else None,
-        'state_of_nearest_town': {
+        'state_of_nearest_town': lambda: {
             'value': contract.state_of_nearest_town.code,
-            'catalog_change': contract.has_field_catalog_change('state_of_nearest_town'),
+            'catalog_change': changed('state_of_nearest_town'),
         } if contract.state_of_nearest_town else None,
-        'distance_to_nearest_city': {
+        'distance_to_nearest_city': lambda: {
             'value': contract.distance_to_nearest_city,
-            'catalog_change': contract.has_field_catalog_change('distance_to_nearest_city'),
+            'catalog_change': changed('distance_to_nearest_city'),
         } if contract.distance_to_nearest_city else None,
-        'direction_to_nearest_city': {
+        'direction_to_nearest_city': lambda: {
             'value': contract.direction_to_nearest_city,
-            'catalog_change': contract.has_field_catalog_change('direction_to_nearest_city'),
+            'catalog_change': changed('direction_to_nearest_city'),
         } if contract.direction_to_nearest_city else None,
-        'nearest_city': {
+        'nearest_city': lambda: {
             'value': contract.nearest_city,
-            'catalog_change': contract.has_field_catalog_change('nearest_city'),
+            'catalog_change': changed('nearest_city'),
         } if contract.nearest_city else None,
-        'state_of_nearest_city': {
+        'state_of_nearest_city': lambda: {
             'value': contract.state_of_nearest_city.code,
-            'catalog_change': contract.has_field_catalog_change('state_of_nearest_city'),
+            'catalog_change': changed('state_of_nearest_city'),
         } if contract.state_of_nearest_city else None,
-        'region': {
+        'region': lambda: {
             'value': contract.region_id.name,
-            'catalog_change': contract.has_field_catalog_change('region_id'),
+            'catalog_change': changed('region_id'),
         } if contract.region_id else None,
-        'coordinates': {
+        'coordinates': lambda: {
             'latitude': contract.latitude or None,
             'longitude': contract.longitude or None,
         },
-        'buyer_receives_fob': {
+        'buyer_receives_fob': lambda: {
             'value': contract.buyer_receives_fob.name,
-            'catalog_change': contract.has_field_catalog_change('buyer_receives_fob'),
+            'catalog_change': changed('buyer_receives_fob'),
         } if contract.buyer_receives_fob else None,
-        'whose_option': {
+        'whose_option': lambda: {
             'value': contract.whose_option.name,
-            'catalog_change': contract.has_field_catalog_change('whose_option'),
+            'catalog_change': changed('whose_option'),
         } if contract.whose_option else None,
-        'shrink_percentage': {
+        'shrink_percentage': lambda: {
             'value': contract.shrink_percentage,
-            'catalog_change': contract.has_field_catalog_change('shrink_percentage'),
+            'catalog_change': changed('shrink_percentage'),
         } if contract.shrink_percentage else None,
-        'freight_adjustment_amount': {
+        'freight_adjustment_amount': lambda: {
             'value': contract.freight_adjustment_amount,
-            'catalog_change': contract.has_field_catalog_change('freight_adjustment_amount'),
+            'catalog_change': changed('freight_adjustment_amount'),
         } if contract.freight_adjustment_amount else None,
-        'oversize_load': {
+        'oversize_load': lambda: {
             'value': contract.oversize_load,
-            'catalog_change': contract.has_field_catalog_change('oversize_load'),
+            'catalog_change': changed('oversize_load'),
         },
-        'seller_need_part_payment': {
+        'seller_need_part_payment': lambda: {
             'value': contract.seller_need_part_payment,
-            'catalog_change': contract.has_field_catalog_change('seller_need_part_payment'),
+            'catalog_change': changed('seller_need_part_payment'),
         },
-        'weighing_conditions': {
+        'weighing_conditions': lambda: {
             'value': contract.weighing_conditions,
-            'catalog_change': contract.has_field_catalog_change('weighing_conditions'),
+            'catalog_change': changed('weighing_conditions'),
         } if contract.weighing_conditions else None,
-        'load_option': {
+        'load_option': lambda: {
             'value': contract.load_option,
-            'catalog_change': contract.has_field_catalog_change('load_option'),
+            'catalog_change': changed('load_option'),
         } if contract.load_option else None,
-        'option_contract_ids': [
+        'option_contract_ids': lambda: [
             {
                 'id': option['id'],
                 'lot_number': option['lot_number'] or None,
                 'head1': option['head1'] or None,
                 'head2': option['head2'] or None,
             } for option in contract.option_contract_ids.read(['id', 'lot_number', 'head1', 'head2'])] if contract.option_contract_ids else None,
-        'addendum_ids': [
+        'addendum_ids': lambda: [
             {
                 'id': addendum.id,
                 'head_count': addendum.head_count or None,
@@ -433,21 +556,21 @@ def serialize_contract_detailed(contract):
                 'part_payment': addendum.part_payment or None,
             } for addendum in contract.addendum_ids
         ] if contract.addendum_ids else None,
-        'office_notes': contract.office_notes or None,
-    }
+        'office_notes': lambda: contract.office_notes or None,
+    }, fields)
 
-def serialize_contract_editable(contract):
-    return {
-        'id': contract.id,
-        'contract_id': contract.id,
-        'status': dict(contract._fields['state'].selection).get(contract.state, 'Unknown').lower(),
-        'sale_type': contract.sale_type.id if contract.sale_type else None,
-        'auction_id': contract.auction_id.id if contract.auction_id else None,
-        'contract_type': contract.contract_type.id if contract.contract_type else None,
-        'seller_id': contract.seller_id.id if contract.seller_id else None,
-        'lien_holder_id': contract.lien_holder_id.id if contract.lien_holder_id else None,
-        'payment_info': contract.payment_info.id if contract.payment_info else None,
-        'rep_ids': [
+def serialize_contract_editable(contract, fields=None):
+    return select_fields({
+        'id': lambda: contract.id,
+        'contract_id': lambda: contract.id,
+        'status': lambda: dict(contract._fields['state'].selection).get(contract.state, 'Unknown').lower(),
+        'sale_type': lambda: contract.sale_type.id if contract.sale_type else None,
+        'auction_id': lambda: contract.auction_id.id if contract.auction_id else None,
+        'contract_type': lambda: contract.contract_type.id if contract.contract_type else None,
+        'seller_id': lambda: contract.seller_id.id if contract.seller_id else None,
+        'lien_holder_id': lambda: contract.lien_holder_id.id if contract.lien_holder_id else None,
+        'payment_info': lambda: contract.payment_info.id if contract.payment_info else None,
+        'rep_ids': lambda: [
             {
                 'rep_id': rep['rep_id'][0],
                 'percentage_commission': rep['percentage_commission'],
@@ -455,80 +578,80 @@ def serialize_contract_editable(contract):
             }
             for rep in contract.rep_ids.read(['rep_id', 'percentage_commission', 'consigning_rep'])
         ] if contract.rep_ids else None,
-        'head1': contract.head1 if contract.head1 else None,
-        'kind1': contract.kind1.id if contract.kind1 else None,
-        'weight1': contract.weight1 if contract.weight1 else None,
-        'head2': contract.head2 if contract.head2 else None,
-        'kind2': contract.kind2.id if contract.kind2 else None,
-        'weight2': contract.weight2 if contract.weight2 else None,
-        'sell_by_head': contract.sell_by_head,
-        'price_back': contract.price_back if contract.price_back else None,
-        'slide_type': contract.slide_type.id if contract.slide_type else None,
-        'slide_over': contract.slide_over if contract.slide_over else None,
-        'slide_under': contract.slide_under if contract.slide_under else None,
-        'weight_stop': contract.weight_stop.id if contract.weight_stop else None,
-        'all_black_hided': contract.all_black_hided,
-        'breed_type': contract.breed_type if contract.breed_type else None,
-        'frame_size': contract.frame_size.id if contract.frame_size else None,
-        'flesh_type': contract.flesh_type.id if contract.flesh_type else None,
-        'weight_variance': contract.weight_variance.id if contract.weight_variance else None,
-        'horns': contract.horns.id if contract.horns else None,
-        'feeding_program': contract.feeding_program or None,
-        'implanted_type': contract.implanted_type.id if contract.implanted_type else None,
-        'implanted_month': contract.implanted_month or None,
-        'implanted_year': contract.implanted_year or None,
-        'implanted_date': contract.implanted_date or None,
-        'castration': contract.castration.id if contract.castration else None,
-        'bangs_vaccinated': contract.bangs_vaccinated.id if contract.bangs_vaccinated else None,
-        'origin': contract.origin.id if contract.origin else None,
+        'head1': lambda: contract.head1 if contract.head1 else None,
+        'kind1': lambda: contract.kind1.id if contract.kind1 else None,
+        'weight1': lambda: contract.weight1 if contract.weight1 else None,
+        'head2': lambda: contract.head2 if contract.head2 else None,
+        'kind2': lambda: contract.kind2.id if contract.kind2 else None,
+        'weight2': lambda: contract.weight2 if contract.weight2 else None,
+        'sell_by_head': lambda: contract.sell_by_head,
+        'price_back': lambda: contract.price_back if contract.price_back else None,
+        'slide_type': lambda: contract.slide_type.id if contract.slide_type else None,
+        'slide_over': lambda: contract.slide_over if contract.slide_over else None,
+        'slide_under': lambda: contract.slide_under if contract.slide_under else None,
+        'weight_stop': lambda: contract.weight_stop.id if contract.weight_stop else None,
+        'all_black_hided': lambda: contract.all_black_hided,
+        'breed_type': lambda: contract.breed_type if contract.breed_type else None,
+        'frame_size': lambda: contract.frame_size.id if contract.frame_size else None,
+        'flesh_type': lambda: contract.flesh_type.id if contract.flesh_type else None,
+        'weight_variance': lambda: contract.weight_variance.id if contract.weight_variance else None,
+        'horns': lambda: contract.horns.id if contract.horns else None,
+        'feeding_program': lambda: contract.feeding_program or None,
+        'implanted_type': lambda: contract.implanted_type.id if contract.implanted_type else None,
+        'implanted_month': lambda: contract.implanted_month or None,
+        'implanted_year': lambda: contract.implanted_year or None,
+        'implanted_date': lambda: contract.implanted_date or None,
+        'castration': lambda: contract.castration.id if contract.castration else None,
+        'bangs_vaccinated': lambda: contract.bangs_vaccinated.id if contract.bangs_vaccinated else None,
+        'origin': lambda: contract.origin.id if contract.origin else None,
         # 'states_of_origin': contract.state_of_origin or None,
-        'country_id': contract.country_id.id if contract.country_id else None,
-        'asking_price': contract.asking_price or None,
-        'comments': contract.comments or None,
-        'vac_program': contract.vac_program.id if contract.vac_program else None,
-        'special_section': contract.special_section.id if contract.special_section else None,
-        'genetic_merit_program': contract.genetic_merit_program.id if contract.genetic_merit_program else None,
-        'value_added_nutrition': contract.value_added_nutrition.id if contract.value_added_nutrition else None,
-        'premium_genetics_program': contract.premium_genetics_program.id if contract.premium_genetics_program else None,
-        'pi_free': contract.pi_free,
-        'tag_840': contract.tag_840,
-        'vaccination_desc': contract.vaccination_desc or None,
-        'source_age_program': contract.source_age_program.id if contract.source_age_program else None,
-        'gap_program': contract.gap_program.id if contract.gap_program else None,
-        'natural': contract.natural,
-        'nhtc': contract.nhtc,
-        'verified_natural': contract.verified_natural,
-        'bqa_certified': contract.bqa_certified,
-        'beef_care': contract.beef_care,
-        'cfp': contract.cfp,
-        'verified_grassfed': contract.verified_grassfed,
-        'organic': contract.organic,
-        'non_gmo': contract.non_gmo,
-        'current_fob': contract.current_fob.id if contract.current_fob else None,
-        'distance_to_nearest_town': contract.distance_to_nearest_town or None,
-        'direction_to_nearest_town': contract.direction_to_nearest_town or None,
-        'nearest_town': contract.nearest_town or None,
-        'state_of_nearest_town': contract.state_of_nearest_town.id if contract.state_of_nearest_town else None,
-        'distance_to_nearest_city': contract.distance_to_nearest_city or None,
-        'direction_to_nearest_city': contract.direction_to_nearest_city or None,
-        'nearest_city': contract.nearest_city or None,
-        'state_of_nearest_city': contract.state_of_nearest_city.id if contract.state_of_nearest_city else None,
-        'region_id': contract.region_id.id if contract.region_id else None,
-        'latitude': contract.latitude or None,
-        'longitude': contract.longitude or None,
-        'buyer_receives_fob': contract.buyer_receives_fob.id if contract.buyer_receives_fob else None,
-        'whose_option': contract.whose_option.id if contract.whose_option else None,
-        'delivery_date_start': contract.delivery_date_start or None,
-        'delivery_date_end': contract.delivery_date_end or None,
-        'shrink_percentage': contract.shrink_percentage or None,
-        'freight_adjustment_amount': contract.freight_adjustment_amount or None,
-        'oversize_load': contract.oversize_load,
-        'seller_need_part_payment': contract.seller_need_part_payment,
-        'weighing_conditions': contract.weighing_conditions or None,
-        'load_option': contract.load_option or None,
-        'option_on_contract': contract.option_on_contract,
-        'can_merge_option_contracts': contract.can_merge_option_contracts,
-        'option_contract_ids': [
+        'country_id': lambda: contract.country_id.id if contract.country_id else None,
+        'asking_price': lambda: contract.asking_price or None,
+        'comments': lambda: contract.comments or None,
+        'vac_program': lambda: contract.vac_program.id if contract.vac_program else None,
+        'special_section': lambda: contract.special_section.id if contract.special_section else None,
+        'genetic_merit_program': lambda: contract.genetic_merit_program.id if contract.genetic_merit_program else None,
+        'value_added_nutrition': lambda: contract.value_added_nutrition.id if contract.value_added_nutrition else None,
+        'premium_genetics_program': lambda: contract.premium_genetics_program.id if contract.premium_genetics_program else None,
+        'pi_free': lambda: contract.pi_free,
+        'tag_840': lambda: contract.tag_840,
+        'vaccination_desc': lambda: contract.vaccination_desc or None,
+        'source_age_program': lambda: contract.source_age_program.id if contract.source_age_program else None,
+        'gap_program': lambda: contract.gap_program.id if contract.gap_program else None,
+        'natural': lambda: contract.natural,
+        'nhtc': lambda: contract.nhtc,
+        'verified_natural': lambda: contract.verified_natural,
+        'bqa_certified': lambda: contract.bqa_certified,
+        'beef_care': lambda: contract.beef_care,
+        'cfp': lambda: contract.cfp,
+        'verified_grassfed': lambda: contract.verified_grassfed,
+        'organic': lambda: contract.organic,
+        'non_gmo': lambda: contract.non_gmo,
+        'current_fob': lambda: contract.current_fob.id if contract.current_fob else None,
+        'distance_to_nearest_town': lambda: contract.distance_to_nearest_town or None,
+        'direction_to_nearest_town': lambda: contract.direction_to_nearest_town or None,
+        'nearest_town': lambda: contract.nearest_town or None,
+        'state_of_nearest_town': lambda: contract.state_of_nearest_town.id if contract.state_of_nearest_town else None,
+        'distance_to_nearest_city': lambda: contract.distance_to_nearest_city or None,
+        'direction_to_nearest_city': lambda: contract.direction_to_nearest_city or None,
+        'nearest_city': lambda: contract.nearest_city or None,
+        'state_of_nearest_city': lambda: contract.state_of_nearest_city.id if contract.state_of_nearest_city else None,
+        'region_id': lambda: contract.region_id.id if contract.region_id else None,
+        'latitude': lambda: contract.latitude or None,
+        'longitude': lambda: contract.longitude or None,
+        'buyer_receives_fob': lambda: contract.buyer_receives_fob.id if contract.buyer_receives_fob else None,
+        'whose_option': lambda: contract.whose_option.id if contract.whose_option else None,
+        'delivery_date_start': lambda: contract.delivery_date_start or None,
+        'delivery_date_end': lambda: contract.delivery_date_end or None,
+        'shrink_percentage': lambda: contract.shrink_percentage or None,
+        'freight_adjustment_amount': lambda: contract.freight_adjustment_amount or None,
+        'oversize_load': lambda: contract.oversize_load,
+        'seller_need_part_payment': lambda: contract.seller_need_part_payment,
+        'weighing_conditions': lambda: contract.weighing_conditions or None,
+        'load_option': lambda: contract.load_option or None,
+        'option_on_contract': lambda: contract.option_on_contract,
+        'can_merge_option_contracts': lambda: contract.can_merge_option_contracts,
+        'option_contract_ids': lambda: [
             {
                 'id': c.id,
                 'head1': c.head1,
@@ -536,8 +659,8 @@ def serialize_contract_editable(contract):
             }
             for c in contract.option_contract_ids
         ] if contract.option_contract_ids else None,
-        'office_notes': contract.office_notes or None,
-        'addendum_ids': [
+        'office_notes': lambda: contract.office_notes or None,
+        'addendum_ids': lambda: [
             {
                 'id': addendum.id,
                 'seller_id': addendum.seller_id.id,
@@ -547,22 +670,26 @@ def serialize_contract_editable(contract):
                 'part_payment': addendum.part_payment or 0
             } for addendum in contract.addendum_ids
         ] if contract.addendum_ids else None,
-        'seller_part_payment': contract.seller_part_payment or 0,
-    }
+        'seller_part_payment': lambda: contract.seller_part_payment or 0,
+    }, fields)
 
-def serialize_contact_basic_info(contact):
+def _contact_basic_info_spec(contact):
 	return {
-		'id': contact.id,
-		'company_type': contact.company_type,
-		'company': contact.commercial_company_name or None,
-		'contact_name': contact.contact_name,
-		'email': contact.email,
-		'phone': contact.phone or None,
-		'address': serialize_address(contact),
-		'roles': [contact_type.name.lower() for contact_type in contact.contact_type_ids],
-		'name': contact.name or None,
+		'id': lambda: contact.id,
+		'company_type': lambda: contact.company_type,
+		'company': lambda: contact.commercial_company_name or None,
+		'contact_name': lambda: contact.contact_name,
+		'email': lambda: contact.email,
+		'phone': lambda: contact.phone or None,
+		'address': lambda: serialize_address(contact),
+		'roles': lambda: [contact_type.name.lower() for contact_type in contact.contact_type_ids],
+		'name': lambda: contact.name or None,
 	}
 
+def serialize_contact_basic_info(contact, fields=None):
+	"""Basic res.partner payload; fields is an optional sparse fieldset."""
+	return select_fields(_contact_basic_info_spec(contact), fields)
+
 def serialize_contact_buyer(contact):
 	bank_info_options = []
 	for bank_info in contact.child_ids:
@@ -581,53 +708,74 @@ def serialize_contact_buyer(contact):
 		'bank': bank_info_options,
 	}
 
-def serialize_contact_seller(contact):
-	default_reps = None
-	if contact.rep_ids:
-		default_reps = []
-		for rep in contact.rep_ids:
-			default_reps.append({
-				'percentage_commission': rep.percentage_commission,
-				'id': rep.rep_id.id,
-				'name': rep.rep_id.rep_name,
-			})
-	default_lien_holder = None
-	if contact.default_lien_holder_id:
-		lien_holder = contact.default_lien_holder_id
-		default_lien_holder = {
-			'id': lien_holder.id,
-			'name': lien_holder.name,
-			'city': lien_holder.city,
-			'state': lien_holder.state_id.code if lien_holder.state_id else None,
-			'zip': lien_holder.zip,
-			'country': lien_holder.country_id.code if lien_holder.country_id else None,
-		}
-	default_payment_info = None
-	if contact.default_payment_info_id:
-		payment_info = contact.default_payment_info_id
-		default_payment_info = {
-			'id': payment_info.id,
-			'name': payment_info.name,
-			'street': payment_info.street,
-			'street2': payment_info.street2 if payment_info.street2 else None,
-			'city': payment_info.city,
-			'state': payment_info.state_id.code if payment_info.state_id else None,
-			'zip': payment_info.zip,
-			'country': payment_info.country_id.code if payment_info.country_id else None,
-		}
+def _contact_default_reps(contact):
+	if not contact.rep_ids:
+		return None
+	default_reps = []
+	for rep in contact.rep_ids:
+		default_reps.append({
+			'percentage_commission': rep.percentage_commission,
+			'id': rep.rep_id.id,
+			'name': rep.rep_id.rep_name,
+		})
+	return default_reps
+
+def _contact_default_lien_holder(contact):
+	if not contact.default_lien_holder_id:
+		return None
+	lien_holder = contact.default_lien_holder_id
 	return {
-		'default_lien_holder': default_lien_holder or None,
-		'affidavit_verified': contact.affidavit_verified or None,
-		'has_master_agreement': contact.has_master_agreement or None,
-		'default_payment_info': default_payment_info or None,
-		'reps': default_reps
+		'id': lien_holder.id,
+		'name': lien_holder.name,
+		'city': lien_holder.city,
+		'state': lien_holder.state_id.code if lien_holder.state_id else None,
+		'zip': lien_holder.zip,
+		'country': lien_holder.country_id.code if lien_holder.country_id else None,
 	}
 
-def serialize_contact_rep(contact):
+def _contact_default_payment_info(contact):
+	if not contact.default_payment_info_id:
+		return None
+	payment_info = contact.default_payment_info_id
+	return {
+		'id': payment_info.id,
+		'name': payment_info.name,
+		'street': payment_info.street,
+		'street2': payment_info.street2 if payment_info.street2 else None,
+		'city': payment_info.city,
+		'state': payment_info.state_id.code if payment_info.state_id else None,
+		'zip': payment_info.zip,
+		'country': payment_info.country_id.code if payment_info.country_id else None,
+	}
+
+def _contact_seller_spec(contact):
 	return {
-		'rep_number': 'test of rep serialization',
+		'default_lien_holder': lambda: _contact_default_lien_holder(contact),
+		'affidavit_verified': lambda: contact.affidavit_verified or None,
+		'has_master_agreement': lambda: contact.has_master_agreement or None,
+		'default_payment_info': lambda: _contact_default_payment_info(contact),
+		'reps': lambda: _contact_default_reps(contact),
 	}
 
+def serialize_contact_seller(contact):
+	return select_fields(_contact_seller_spec(contact))
+
+def serialize_seller(contact, fields=None):
+	"""Basic info merged with seller defaults; fields is an optional sparse fieldset."""
+	return select_fields({**_contact_basic_info_spec(contact), **_contact_seller_spec(contact)}, fields)
+
+def _contact_rep_spec(contact):
+	return {
+		'rep_number': lambda: 'test of rep serialization',
+	}
+
+def serialize_contact_rep(contact):
+	return select_fields(_contact_rep_spec(contact))
+
+def serialize_rep(contact, fields=None):
+	"""Basic info merged with rep details; fields is an optional sparse fieldset."""
+	return select_fields({**_contact_basic_info_spec(contact), **_contact_rep_spec(contact)}, fields)
+
 
 def serialize_payment_address(partner, is_default=False):
 	"""Serialize a single payment-address child (res.partner with type='payment') for API."""
@@ -1,14 +1,120 @@
+import calendar
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 from odoo import fields
 from odoo.http import request
 
 from odoo.addons.liveag_api.tools.http_utils import json_response
 
+# Validated tokens are cached per worker process so the liveag.auth.token
+# lookup is skipped on repeat calls. Entries live at most TOKEN_CACHE_TTL
+# seconds (and never past the token's expires_at). Each entry records the
+# token cache generation it was loaded in, a database sequence read with one
+# cheap query per lookup; writes/unlinks on a token (and user deletions)
+# bump it for every worker, which makes older entries misses.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 2048
+
+
+class LocalTokenCache:
+    """
+    Bounded, thread-safe TTL/LRU map: key -> entry dict.
+
+    Any object exposing get/set/delete/clear with the same signatures can be
+    swapped in for _TOKEN_CACHE (e.g. a store shared between workers).
+    """
+
+    def __init__(self, max_size=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (entry, expires_at_epoch)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            entry, expires = item
+            if expires <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, expires_at_epoch=None):
+        expires = time.time() + self.ttl
+        if expires_at_epoch is not None:
+            expires = min(expires, expires_at_epoch)
+        with self._lock:
+            self._data[key] = (entry, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_TOKEN_CACHE = LocalTokenCache()
+
+
+def token_cache_key(dbname, token_str):
+    """Cache key for a bearer token; the raw token is never kept in memory."""
+    return (dbname, hashlib.sha256(token_str.encode()).hexdigest())
+
+
 def _extract_bearer_token():
     auth = request.httprequest.headers.get("Authorization", "")
     if not auth.lower().startswith("bearer "):
         return None
     return auth.split(" ", 1)[1].strip()
 
+
+def _lookup_token(token_str):
+    """Return the cached entry for token_str, loading it from liveag.auth.token on a miss."""
+    Token = request.env["liveag.auth.token"].sudo()
+    # Read before the lookup, so an entry loaded from a row changed meanwhile is already outdated
+    generation = Token._get_token_cache_generation()
+    key = token_cache_key(request.env.cr.dbname, token_str)
+    entry = _TOKEN_CACHE.get(key)
+    if entry is not None:
+        if entry["generation"] != generation:
+            _TOKEN_CACHE.delete(key)
+        elif entry["expires_at"] > fields.Datetime.now():
+            return entry
+        else:
+            _TOKEN_CACHE.delete(key)
+            return None
+
+    token_rec = Token.search([
+        ("token", "=", token_str),
+        ("active", "=", True),
+        ("expires_at", ">", fields.Datetime.now()),
+    ], limit=1)
+    if not token_rec:
+        return None
+
+    entry = {
+        "token_id": token_rec.id,
+        "user_id": token_rec.user_id.id,
+        "scopes": frozenset((token_rec.scope or "").split()),
+        "expires_at": token_rec.expires_at,
+        "generation": generation,
+    }
+    _TOKEN_CACHE.set(key, entry, calendar.timegm(token_rec.expires_at.timetuple()))
+    return entry
+
+
 def authenticate_liveag_token(required_scope: str | None = None):
     """
     Validates Authorization: Bearer <token> against liveag.auth.token.
@@ -25,26 +131,20 @@ def authenticate_liveag_token(required_scope: str | None = None):
             "error_description": "Missing Authorization: Bearer token",
         }
 
-    Token = request.env["liveag.auth.token"].sudo()
-    token_rec = Token.search([
-        ("token", "=", token_str),
-        ("active", "=", True),
-        ("expires_at", ">", fields.Datetime.now()),
-    ], limit=1)
-
-    if not token_rec:
+    entry = _lookup_token(token_str)
+    if entry is None:
         return None, None, {
             "error": "invalid_token",
             "error_description": "Token invalid or expired",
         }
 
     if required_scope:
-        scopes = (token_rec.scope or "").split()
-        if required_scope not in scopes:
+        if required_scope not in entry["scopes"]:
             return None, None, {
                 "error": "insufficient_scope",
                 "error_description": f"Missing required scope: {required_scope}",
             }
 
-    env_as_user = request.env(user=token_rec.user_id.id)
-    return env_as_user, token_rec, None
\ No newline at end of file
+    token_rec = request.env["liveag.auth.token"].sudo().browse(entry["token_id"])
+    env_as_user = request.env(user=entry["user_id"])
+    return env_as_user, token_rec, None
@@ -0,0 +1,197 @@
+import gzip
+import hashlib
+import json
+
+from odoo.http import request
+
+from odoo.addons.liveag_api.tools.http_utils import _json_default
+from odoo.addons.liveag_consignment.models.consignment_contract import DIRECTION_LIST
+
+
+def _value_label(model_name):
+    """Builder for the common {value, label} list of active records in sequence order."""
+    def build(env):
+        records = env[model_name].search([("active", "=", True)], order="sequence, id")
+        return [{"value": r.id, "label": r.name} for r in records]
+    return build
+
+
+def _statuses(env):
+    selection = env["consignment.contract"]._fields["state"].selection
+    return [{"value": value, "label": label} for value, label in selection]
+
+
+def _directions(env):
+    return [{"value": val, "label": label} for val, label in DIRECTION_LIST]
+
+
+def _kinds(env):
+    kinds = env["kind.list"].search([("active", "=", True)], order="sequence, id")
+    return [{"value": k.id, "label": k.name, "sex": k.sex} for k in kinds]
+
+
+def _slide_types(env):
+    slide_types = env["slide.type"].search([("active", "=", True)], order="sequence, id")
+    return [
+        {
+            "value": st.id,
+            "label": st.label,
+            "sell_by_head": st.sell_by_head,
+            "above": st.above,
+            "under": st.under,
+            "both": st.both,
+            "description": st.description,
+        }
+        for st in slide_types
+    ]
+
+
+def _countries(env, base_url):
+    countries = env["res.country"].search(
+        [("code", "in", ["US", "CA", "MX"])], order="name, id"
+    )
+    # US first, then rest alphabetical by name
+    us = countries.filtered(lambda c: c.code == "US")
+    others = (countries - us).sorted(key=lambda c: c.name)
+    return [
+        {
+            "value": c.id,
+            "label": c.name,
+            "code": c.code,
+            "flag": f"{base_url}{c.image_url}" if c.image_url else None,
+        }
+        for c in us + others
+    ]
+
+
+def _states(env, country_code):
+    domain = []
+    country = env["res.country"].search([("code", "=", country_code)], limit=1)
+    if not country:
+        country = env["res.country"].search([("code", "=", "US")], limit=1)
+    if country:
+        domain.append(("country_id", "=", country.id))
+    states = env["res.country.state"].search(domain, order="code, id")
+    return [
+        {
+            "value": s.id,
+            "label": s.name,
+            "abbr": s.code,
+            "region": {"value": s.region_id.id, "label": s.region_id.name} if s.region_id else None,
+        }
+        for s in states
+    ]
+
+
+# Cacheable metadata lists: key -> builder(env, *params).
+METADATA_SOURCES = {
+    "status": _statuses,
+    "directions": _directions,
+    "sale_type": _value_label("sale.type"),
+    "kind": _kinds,
+    "contract_type": _value_label("contract.type"),
+    "origin": _value_label("origin.list"),
+    "frame_size": _value_label("frame.size"),
+    "flesh_type": _value_label("flesh.type"),
+    "weight_variance": _value_label("weight.variance"),
+    "horns": _value_label("horns.list"),
+    "implanted_type": _value_label("implanted.list"),
+    "castration_type": _value_label("castration.list"),
+    "bangs_vaccination": _value_label("bangs.vaccinated"),
+    "special_section": _value_label("special.section"),
+    "genetic_merit": _value_label("genetic.merit"),
+    "premium_genetics_program": _value_label("premium.genetics.program"),
+    "van_program": _value_label("van.program"),
+    "source_age_program": _value_label("third.party.age"),
+    "vac_program": _value_label("vac.program"),
+    "location_type": _value_label("location.type"),
+    "delivery_option": _value_label("whose.option"),
+    "slide_type": _slide_types,
+    "weight_stop": _value_label("weight.stop"),
+    "gap_program": _value_label("gap.program"),
+    "regions": _value_label("res.region"),
+    "countries": _countries,
+    "states": _states,
+}
+
+
+def build_metadata(env, key, params=()):
+    """
+    Build one metadata list uncached.
+
+    Returns (body, etag): the serialized {"data", "success"} JSON body and a
+    quoted content-hash ETag.
+    """
+    data = METADATA_SOURCES[key](env, *params)
+    body = json.dumps({"data": data, "success": True}, default=_json_default)
+    etag = '"%s"' % hashlib.sha1(body.encode()).hexdigest()
+    return body, etag
+
+
+def _bundle_params(key, base_url, country_code):
+    if key == "countries":
+        return (base_url,)
+    if key == "states":
+        return (country_code,)
+    return ()
+
+
+def build_metadata_bundle(env, keys, base_url, country_code):
+    """
+    Build several metadata lists as one document.
+
+    Returns (body, gzipped_body, version) where version is a content hash of
+    the data, echoed in the body so clients can send it back to skip downloads.
+    """
+    data = {key: METADATA_SOURCES[key](env, *_bundle_params(key, base_url, country_code)) for key in keys}
+    data_json = json.dumps(data, default=_json_default, sort_keys=True)
+    version = hashlib.sha1(data_json.encode()).hexdigest()
+    body = '{"data": %s, "version": "%s", "success": true}' % (data_json, version)
+    body = body.encode()
+    return body, gzip.compress(body), version
+
+
+def metadata_bundle_response(env, keys, base_url, country_code):
+    """
+    JSON response for a cached metadata bundle. Answers 304 when the client's
+    ?version= or If-None-Match matches, and serves the precompressed body to
+    clients that accept gzip.
+    """
+    body, gzipped, version = env["liveag.api.metadata"]._get_metadata_bundle(
+        tuple(keys), base_url, country_code
+    )
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+    if request.params.get("version") == version or _not_modified(etag):
+        return request.make_response("", headers=list(headers.items()), status=304)
+    headers["Content-Type"] = "application/json"
+    accept_encoding = request.httprequest.headers.get("Accept-Encoding") or ""
+    if "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        body = gzipped
+    return request.make_response(body, headers=list(headers.items()), status=200)
+
+
+def metadata_response(env, key, params=()):
+    """
+    JSON response for a cached metadata list, honouring If-None-Match with a
+    304. The cache lives in liveag.api.metadata.
+
+    No Last-Modified is sent: the newest write_date of a list does not move
+    when a row is deleted, so If-Modified-Since would keep answering 304 for
+    a list that changed. The content-hash ETag covers every change.
+    """
+    body, etag = env["liveag.api.metadata"]._get_metadata(key, tuple(params))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _not_modified(etag):
+        return request.make_response("", headers=list(headers.items()), status=304)
+    headers["Content-Type"] = "application/json"
+    return request.make_response(body, headers=list(headers.items()), status=200)
+
+
+def _not_modified(etag):
+    if_none_match = request.httprequest.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
@@ -0,0 +1,168 @@
+import base64
+import json
+from datetime import date, datetime
+
+from odoo import fields, models
+from odoo.osv.expression import AND, OR
+from odoo.tools import SQL
+
+# Field types where Odoo matches NULL and '' together on (field, '=', False) / (field, '=', '')
+_EMPTY_STRING_TYPES = ("char", "text", "html")
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor is malformed or does not match the active sort."""
+
+
+def order_spec(order_clause):
+    """
+    Parse an order clause into [(field, direction), ...] with an id tiebreaker.
+
+    "create_date desc" -> [("create_date", "desc"), ("id", "desc")]
+    The tiebreaker follows the direction of the first term so keyset pages are stable.
+    """
+    spec = []
+    for term in (order_clause or "").split(","):
+        parts = term.split()
+        if not parts:
+            continue
+        direction = parts[1].lower() if len(parts) > 1 and parts[1].lower() in ("asc", "desc") else "asc"
+        spec.append((parts[0], direction))
+    if not any(field == "id" for field, _direction in spec):
+        spec.append(("id", spec[0][1] if spec else "asc"))
+    return spec
+
+
+def _order_clause(spec):
+    """Order clause for keyset mode; NULLs always sort last so cursors can skip past them."""
+    return ", ".join(
+        f"{field} {direction}" if field == "id" else f"{field} {direction} nulls last"
+        for field, direction in spec
+    )
+
+
+def _cursor_value(record, field):
+    value = record[field]
+    if isinstance(value, models.BaseModel):
+        return value.id or None
+    if isinstance(value, datetime):
+        # Full precision: create_date/write_date keep microseconds in the database
+        return value.isoformat(sep=" ", timespec="microseconds")
+    if isinstance(value, date):
+        return fields.Date.to_string(value)
+    if value is False:
+        return None
+    return value
+
+
+def encode_cursor(spec, record):
+    """Opaque cursor pointing just after record for the given order spec."""
+    payload = {
+        "k": [[field, direction] for field, direction in spec],
+        "v": [_cursor_value(record, field) for field, _direction in spec],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(Model, cursor, spec):
+    """Return the sort values stored in cursor; raises InvalidCursor if it does not match spec."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        keys = [tuple(key) for key in payload["k"]]
+        values = list(payload["v"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor parameter")
+    if keys != list(spec) or len(values) != len(spec):
+        raise InvalidCursor("cursor does not match the requested sort order")
+    for index, (field, _direction) in enumerate(spec):
+        model_field = Model._fields.get(field)
+        if values[index] is not None and model_field and model_field.type == "datetime":
+            try:
+                values[index] = datetime.fromisoformat(values[index])
+            except (ValueError, TypeError):
+                raise InvalidCursor("Invalid cursor parameter")
+    return values
+
+
+def _column_domain(Model, field, condition):
+    return [("id", "in", SQL(
+        "SELECT id FROM %s WHERE %s %s", SQL.identifier(Model._table), SQL.identifier(field), condition,
+    ))]
+
+
+def _null_domain(Model, field):
+    """Domain matching rows where field is NULL; '' is a regular value that sorts first."""
+    if Model._fields[field].type in _EMPTY_STRING_TYPES:
+        return _column_domain(Model, field, SQL("IS NULL"))
+    return [(field, "=", False)]
+
+
+def _compare_domain(Model, field, operator, value):
+    if isinstance(value, datetime):
+        # Compared in SQL so the microseconds of the cursor value are kept
+        return _column_domain(Model, field, SQL(f"{operator} %s", value))
+    return [(field, operator, value)]
+
+
+def _equal_domain(Model, field, value):
+    if value is None:
+        return _null_domain(Model, field)
+    if value == "" and Model._fields[field].type in _EMPTY_STRING_TYPES:
+        return _column_domain(Model, field, SQL("= ''"))
+    return _compare_domain(Model, field, "=", value)
+
+
+def keyset_domain(Model, spec, values):
+    """Domain selecting rows strictly after values in spec order (NULLs last)."""
+    branches = []
+    for index, (field, direction) in enumerate(spec):
+        value = values[index]
+        if value is None:
+            # NULLs sort last: nothing is strictly after a NULL in this column.
+            continue
+        prefix = [_equal_domain(Model, f, values[i]) for i, (f, _d) in enumerate(spec[:index])]
+        op = "<" if direction == "desc" else ">"
+        after = [(field, op, value)] if field == "id" else OR([_compare_domain(Model, field, op, value), _null_domain(Model, field)])
+        branches.append(AND(prefix + [after]))
+    return OR(branches) if branches else [("id", "=", 0)]
+
+
+def search_page(Model, domain, order, pagination):
+    """
+    Run one paginated search for request.pagination (see with_pagination).
+
+    Offset mode uses limit/offset; cursor mode seeks past the cursor on the active
+    sort instead of scanning the skipped rows. The total count is only computed
+    when pagination["with_count"] is set.
+
+    Returns (records, pagination_meta). Raises InvalidCursor on a bad cursor.
+    """
+    limit = pagination["limit"]
+    meta = {"per_page": pagination["per_page"]}
+
+    if pagination.get("mode") == "cursor":
+        spec = order_spec(order)
+        search_domain = domain
+        if pagination.get("cursor"):
+            search_domain = AND([domain, keyset_domain(Model, spec, decode_cursor(Model, pagination["cursor"], spec))])
+        records = Model.search(search_domain, limit=limit + 1, order=_order_clause(spec))
+        has_more = len(records) > limit
+        records = records[:limit]
+        meta["next_cursor"] = encode_cursor(spec, records[-1]) if has_more and records else None
+        meta["has_more"] = has_more
+        if pagination.get("with_count"):
+            meta["total_count"] = Model.search_count(domain)
+        return records, meta
+
+    records = Model.search(domain, limit=limit + 1, offset=pagination["offset"], order=order)
+    has_more = len(records) > limit
+    records = records[:limit]
+    meta["page"] = pagination["page"]
+    if pagination.get("with_count", True):
+        total_count = Model.search_count(domain)
+        meta["total_count"] = total_count
+        meta["total_pages"] = (total_count + pagination["per_page"] - 1) // pagination["per_page"]
+    meta["has_more"] = has_more
+    return records, meta
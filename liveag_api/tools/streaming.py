@@ -0,0 +1,88 @@
+import json
+import logging
+
+from odoo import api
+from odoo.http import Response, request
+from odoo.modules.registry import Registry
+
+from odoo.addons.liveag_api.tools.http_utils import _json_default
+
+_logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 500
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def stream_format():
+    """
+    Streaming format requested by the client: "ndjson" with ?stream=ndjson or
+    Accept: application/x-ndjson, otherwise "json" (one chunked JSON array).
+    """
+    if (request.params.get("stream") or "").strip().lower() == "ndjson":
+        return "ndjson"
+    if NDJSON_MIMETYPE in (request.httprequest.headers.get("Accept") or ""):
+        return "ndjson"
+    return "json"
+
+
+def stream_records(records, serialize_batch, fmt="json", batch_size=STREAM_BATCH_SIZE, default=_json_default):
+    """
+    Response that serializes records batch by batch while it is sent.
+
+    serialize_batch(batch) returns the list of JSON-able items for one batch of
+    records. The first batch is serialized right away with the request's
+    environment so errors (e.g. invalid sparse fields) can still be answered
+    with a proper status. The remaining batches are browsed on a dedicated
+    cursor, since the request cursor is closed once the body is sent, and
+    dropped from the cache after being written out, so memory stays flat
+    however many rows are returned.
+
+    The later batches are read in a newer snapshot than the request's: rows
+    deleted meanwhile are left out. Once the status is sent an error can no
+    longer change it, so a failing batch is logged and ends the body cleanly,
+    closing the JSON array, or with an error line in ndjson.
+    """
+    model_name = records._name
+    ids = list(records.ids)
+    dbname = records.env.cr.dbname
+    uid = records.env.uid
+    context = dict(records.env.context)
+    su = records.env.su
+    first_items = serialize_batch(records.browse(ids[:batch_size]))
+
+    failure = {}
+
+    def batches():
+        yield first_items
+        if len(ids) <= batch_size:
+            return
+        try:
+            with Registry(dbname).cursor() as cr:
+                env = api.Environment(cr, uid, context, su=su)
+                Model = env[model_name]
+                for start in range(batch_size, len(ids), batch_size):
+                    yield serialize_batch(Model.browse(ids[start:start + batch_size]).exists())
+                    env.invalidate_all()
+        except Exception as e:
+            _logger.exception("Error streaming %s records", model_name)
+            failure["error"] = str(e)
+
+    def generate():
+        separator = b""
+        if fmt == "json":
+            yield b"["
+        for items in batches():
+            for item in items:
+                chunk = json.dumps(item, default=default).encode()
+                if fmt == "ndjson":
+                    yield chunk + b"\n"
+                else:
+                    yield separator + chunk
+                    separator = b","
+        if fmt == "ndjson" and failure:
+            yield json.dumps({"error": "server_error", "error_description": failure["error"]}).encode() + b"\n"
+        if fmt == "json":
+            yield b"]"
+
+    mimetype = NDJSON_MIMETYPE if fmt == "ndjson" else "application/json"
+    return Response(generate(), headers=[("Content-Type", mimetype)], direct_passthrough=True)
@@ -15,6 +15,7 @@
     'data': [
         # ============================== DATA =================================
         'data/ir_sequence_data.xml',
+        'data/ir_cron_data.xml',
         'data/consignment_contract_actions.xml',
         'data/email_templates.xml',
         'data/ir_module_category_data.xml',
@@ -56,9 +57,11 @@
         'views/gap_program_views.xml',
         'views/res_region_views.xml',
         'views/contract_activity_log_views.xml',
+        'views/consignment_catalog_change_views.xml',
         'views/program_icon_views.xml',
         'views/beef_checkoff_views.xml',
         'views/auction_report_email_views.xml',
+        'views/contract_export_views.xml',
         # 'views/res_users_views.xml',
         # ============================== WIZARDS ==============================
         'wizard/split_contract_wizard.xml',
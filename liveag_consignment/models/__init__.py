@@ -27,6 +27,7 @@ from . import van_program
 from . import gap_program
 from . import consignment_contract
 from . import consignment_catalog_change
+from . import contract_export
 from . import res_rep
 from . import res_contact_type
 from . import buyer_number
@@ -3,14 +3,34 @@
 
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
-from odoo import sql_db
-import base64
+from odoo.modules.registry import Registry
+from odoo.tools import SQL
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import hashlib
 import logging
 import threading
-import time
 
 _logger = logging.getLogger(__name__)
 
+# Queue tuning, overridable through system parameters
+WORKERS_PARAM = 'liveag_consignment.report_email_workers'
+MAX_ATTEMPTS_PARAM = 'liveag_consignment.report_email_max_attempts'
+SMTP_BATCH_PARAM = 'liveag_consignment.report_email_smtp_batch'
+PDF_WORKERS_PARAM = 'liveag_consignment.report_pdf_workers'
+DEFAULT_WORKERS = 2
+# Report PDFs rendered at the same time, each by its own wkhtmltopdf process
+DEFAULT_PDF_WORKERS = 2
+DEFAULT_MAX_ATTEMPTS = 5
+# Emails delivered over one SMTP connection; also the jobs a worker claims per round
+DEFAULT_SMTP_BATCH = 50
+# First retry delay; doubles with every failed attempt
+RETRY_BASE_DELAY = timedelta(minutes=1)
+# A claimed job whose worker died is picked up again after this lease
+CLAIM_LEASE = timedelta(minutes=15)
+# Stop claiming new rounds after this long and let the cron trigger itself again
+CRON_TIME_BUDGET = timedelta(minutes=10)
+
 REPORT_TYPE_SELECTION = [
     ('buyer_report', 'Buyer Report'),
     ('seller_report', 'Seller Report'),
@@ -19,6 +39,8 @@ REPORT_TYPE_SELECTION = [
 
 STATE_SELECTION = [
     ('draft', 'Draft'),
+    ('queued', 'Queued'),
+    ('sending', 'Sending'),
     ('sent', 'Sent'),
     ('failed', 'Failed'),
     ('no_email', 'No Email'),
@@ -84,6 +106,37 @@ class AuctionReportEmail(models.Model):
         readonly=True,
         copy=False,
     )
+    attempt_count = fields.Integer(
+        string='Attempts',
+        readonly=True,
+        copy=False,
+    )
+    next_attempt_at = fields.Datetime(
+        string='Next Attempt',
+        readonly=True,
+        copy=False,
+        help='When a queued email is due, or when the claim of an email being sent expires.',
+    )
+    requested_by_id = fields.Many2one(
+        comodel_name='res.users',
+        string='Requested By',
+        readonly=True,
+        copy=False,
+        help='User the queued email is sent as.',
+    )
+    report_attachment_id = fields.Many2one(
+        comodel_name='ir.attachment',
+        string='Report PDF',
+        readonly=True,
+        copy=False,
+        ondelete='set null',
+    )
+    report_cache_key = fields.Char(
+        string='Report Version',
+        readonly=True,
+        copy=False,
+        help='Hash of the auction, partner and contract versions the report PDF was rendered from.',
+    )
     # Optional filters copied from wizard for reproducibility
     date_from = fields.Date(string='Sale Date From', help='Optional start date to filter contracts.')
     date_to = fields.Date(string='Sale Date To', help='Optional end date to filter contracts.')
@@ -93,6 +146,7 @@ class AuctionReportEmail(models.Model):
         'unique(auction_id, partner_id, report_type)',
         "Only one email per auction/partner/report type is allowed.",
     )
+    _queue_idx = models.Index("(next_attempt_at, id) WHERE state IN ('queued', 'sending')")
 
     # ============================== HELPERS =================================
     def get_report_type_label(self):
@@ -154,101 +208,369 @@ class AuctionReportEmail(models.Model):
             })
         raise UserError(_('Unsupported report type: %s') % (self.report_type,))
 
-    def _render_report_pdf(self):
+    def _get_report_filename(self):
+        self.ensure_one()
+        safe_auction = (self.auction_id.name or 'Auction').replace('/', '-')
+        safe_partner = (self.partner_id.name or 'Partner').replace('/', '-')
+        return f"{self.get_report_type_label().replace(' ', '_')}_{safe_auction}_{safe_partner}.pdf"
+
+    def _get_report_cache_key(self, xmlid, extra_ctx):
+        """
+        Hash of everything the report is rendered from: the auction, the partner,
+        the contracts and the records printed with them (addenda, rep lines,
+        their partners and buyer numbers), each by its write_date.
+        """
+        self.ensure_one()
+        contracts = self.env['consignment.contract'].browse(extra_ctx.get('filtered_contract_ids') or [])
+        addenda = contracts.addendum_ids
+        rep_lines = contracts.rep_ids
+        partners = (
+            contracts.lien_holder_id | addenda.seller_id | addenda.lien_holder_id | rep_lines.rep_id
+        )
+
+        def versions(records):
+            return sorted((record.id, str(record.write_date)) for record in records)
+
+        parts = [
+            xmlid,
+            self.auction_id.id, str(self.auction_id.write_date),
+            self.partner_id.id, str(self.partner_id.write_date),
+            bool(extra_ctx.get('print_with_contracts')),
+            versions(contracts),
+            versions(addenda),
+            versions(rep_lines),
+            versions(partners),
+            versions(contracts.buyer_number),
+        ]
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def _get_render_job(self):
+        """(xmlid, render context, cache key), or None when the cached PDF is still current."""
         self.ensure_one()
         xmlid, extra_ctx = self._get_report_action_xmlid_and_context()
+        key = self._get_report_cache_key(xmlid, extra_ctx)
+        if self.report_attachment_id and self.report_cache_key == key:
+            return None
+        return xmlid, extra_ctx, key
+
+    def _store_report_pdf(self, pdf_content, key):
+        self.ensure_one()
+        attachment = self.env['ir.attachment'].create({
+            'name': self._get_report_filename(),
+            'res_model': self._name,
+            'res_id': self.id,
+            'type': 'binary',
+            'raw': pdf_content,
+            'mimetype': 'application/pdf',
+        })
+        self.write({'report_attachment_id': attachment.id, 'report_cache_key': key})
+        return attachment
+
+    def _get_report_attachment(self):
+        """
+        The report PDF as an attachment, rendered only when something it is
+        rendered from changed since the cached one (see _get_report_cache_key).
+        """
+        self.ensure_one()
+        job = self._get_render_job()
+        if not job:
+            return self.report_attachment_id
+        xmlid, extra_ctx, key = job
         report_action = self.env.ref(xmlid)
         if not report_action or report_action._name != 'ir.actions.report':
             raise UserError(_('Report action not found: %s') % (xmlid,))
-        safe_auction = (self.auction_id.name or 'Auction').replace('/', '-')
-        safe_partner = (self.partner_id.name or 'Partner').replace('/', '-')
-        filename = f"{self.get_report_type_label().replace(' ', '_')}_{safe_auction}_{safe_partner}.pdf"
-        ctx = dict(self.env.context or {})
-        ctx.update(extra_ctx or {})
         pdf_content, _format = report_action.with_context(extra_ctx)._render_qweb_pdf(xmlid, [self.auction_id.id])
         if not pdf_content:
             raise UserError(_('Failed to render PDF for %s') % (self.display_name,))
-        return pdf_content, filename
+        return self._store_report_pdf(pdf_content, key)
 
-    # ============================== ACTIONS =================================
-    def action_send_single(self):
+    def _render_report_pdf(self):
+        self.ensure_one()
+        attachment = self._get_report_attachment()
+        return attachment.raw, attachment.name
+
+    @staticmethod
+    def _render_pdf_worker(dbname, uid, xmlid, extra_ctx, auction_id):
+        """Pool thread: render one report PDF on its own cursor."""
+        threading.current_thread().dbname = dbname
+        threading.current_thread().uid = uid
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, uid, {})
+            pdf_content, _format = env.ref(xmlid).with_context(extra_ctx)._render_qweb_pdf(xmlid, [auction_id])
+            return pdf_content
+
+    def _prerender_report_pdfs(self):
+        """
+        Render the missing or outdated report PDFs of self in one pass on a pool
+        of liveag_consignment.report_pdf_workers threads, so several wkhtmltopdf
+        processes run at once, and cache them.
+
+        The threads read through their own cursors, which only see committed
+        data: call this at the start of a transaction, as the queue does.
+        Reports that fail here are left to _get_report_attachment, which renders
+        them again and reports the error for that email only.
+        """
+        jobs = {}
         for email in self:
-            if not email.exists():
+            try:
+                job = email._get_render_job()
+            except UserError:
                 continue
-            if email.state == 'sent':
+            if job:
+                jobs[email] = job
+        if len(jobs) < 2 or getattr(threading.current_thread(), 'testing', False):
+            return
+        workers = self._get_queue_param(PDF_WORKERS_PARAM, DEFAULT_PDF_WORKERS)
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs)), thread_name_prefix='auction_report_pdf') as pool:
+            futures = {
+                email: pool.submit(self._render_pdf_worker, self.env.cr.dbname, self.env.uid, xmlid, extra_ctx, email.auction_id.id)
+                for email, (xmlid, extra_ctx, _key) in jobs.items()
+            }
+        for email, future in futures.items():
+            try:
+                pdf_content = future.result()
+            except Exception as e:
+                _logger.warning('Failed rendering report PDF for auction report email %s: %s', email.id, e)
                 continue
-            # Retry loop to handle concurrent updates (serialization failures)
-            max_attempts = 3
-            attempt = 0
-            while attempt < max_attempts:
-                try:
-                    email_to_addr = (email.email_to or '').strip() or (email.partner_id.email or '').strip()
-                    if not email_to_addr:
-                        email.write({'state': 'no_email', 'error_message': _('Missing partner email')})
-                        email.env.cr.commit()
-                        break
-                    pdf_bytes, filename = email._render_report_pdf()
-                    attachment = email.env['ir.attachment'].create({
-                        'name': filename,
-                        'res_model': email._name,
-                        'res_id': email.id,
-                        'type': 'binary',
-                        'datas': base64.b64encode(pdf_bytes),
-                        'mimetype': 'application/pdf',
-                    })
-                    template = email.env.ref('liveag_consignment.mail_template_auction_report', raise_if_not_found=False)
-                    if not template:
-                        raise UserError(_('Email template not found: liveag_consignment.mail_template_auction_report'))
-                    template_ctx = {
-                        'report_type_label': email.get_report_type_label(),
-                        'partner_name': email.partner_id.name or '',
-                    }
-                    email_values = {
-                        'email_to': email_to_addr,
-                        'attachment_ids': [(4, attachment.id)],
-                    }
-                    # Send with queue record as the object (template model: auction.report.email)
-                    mail_id = template.with_context(template_ctx).send_mail(email.id, force_send=True, email_values=email_values)
-                    mail = email.env['mail.mail'].browse(mail_id) if mail_id else email.mail_id
-                    email.write({
-                        'state': 'sent',
-                        'sent_at': fields.Datetime.now(),
-                        'mail_id': mail.id if mail else False,
-                        'error_message': False,
-                        'email_to': email_to_addr,
-                    })
-                    email.env.cr.commit()
-                    break
-                except Exception as e:
-                    # Detect serialization failure and retry
-                    if 'could not serialize access due to concurrent update' in str(e):
-                        email.env.cr.rollback()
-                        attempt += 1
-                        # short backoff
-                        time.sleep(0.1 * attempt)
-                        continue
-                    _logger.exception('Failed sending auction report email (email %s): %s', email.id, e)
-                    email.write({
-                        'state': 'failed',
-                        'error_message': str(e)[:2000],
-                    })
-                    email.env.cr.commit()
-                    break
+            if pdf_content:
+                email._store_report_pdf(pdf_content, jobs[email][2])
+
+    def _prepare_mail(self, email_to_addr):
+        """
+        Create the outgoing mail.mail with the cached report PDF, without sending it.
+        A mail left in exception by a previous attempt is sent again as is.
+        """
+        self.ensure_one()
+        if self.mail_id and self.mail_id.state in ('outgoing', 'exception'):
+            self.mail_id.mark_outgoing()
+            return self.mail_id
+        attachment = self._get_report_attachment()
+        template = self.env.ref('liveag_consignment.mail_template_auction_report', raise_if_not_found=False)
+        if not template:
+            raise UserError(_('Email template not found: liveag_consignment.mail_template_auction_report'))
+        template_ctx = {
+            'report_type_label': self.get_report_type_label(),
+            'partner_name': self.partner_id.name or '',
+        }
+        email_values = {
+            'email_to': email_to_addr,
+            'attachment_ids': [(4, attachment.id)],
+        }
+        # Queue with the email record as the object (template model: auction.report.email)
+        mail_id = template.with_context(template_ctx).send_mail(self.id, force_send=False, email_values=email_values)
+        mail = self.env['mail.mail'].browse(mail_id)
+        self.write({'mail_id': mail.id, 'email_to': email_to_addr})
+        return mail
+
+    def _send_batch(self):
+        """
+        Send the report emails of self in batch mode.
+
+        Every report is rendered and its mail.mail queued first; the mails are
+        then delivered in chunks of liveag_consignment.report_email_smtp_batch,
+        each chunk over a single SMTP connection, and all successful emails are
+        marked sent with one write. Returns {email_id: error message} for the
+        emails that could not be sent.
+        """
+        errors = {}
+        no_email = self.browse()
+        mails = self.env['mail.mail']
+        for email in self:
+            email_to_addr = (email.email_to or '').strip() or (email.partner_id.email or '').strip()
+            if not email_to_addr:
+                no_email |= email
+                continue
+            try:
+                with email.env.cr.savepoint():
+                    mails |= email._prepare_mail(email_to_addr)
+            except Exception as e:
+                _logger.warning('Failed preparing auction report email %s: %s', email.id, e)
+                errors[email.id] = str(e)[:2000]
+        if no_email:
+            no_email.write({'state': 'no_email', 'error_message': _('Missing partner email'), 'next_attempt_at': False})
+
+        batch_size = self._get_queue_param(SMTP_BATCH_PARAM, DEFAULT_SMTP_BATCH)
+        for index in range(0, len(mails), batch_size):
+            # mail.mail.send opens one SMTP session per mail server for the chunk
+            mails[index:index + batch_size].send(auto_commit=False, raise_exception=False)
+
+        sent = self.browse()
+        for email in (self - no_email).filtered(lambda e: e.id not in errors):
+            if email.mail_id.state == 'sent':
+                sent |= email
+            else:
+                errors[email.id] = (email.mail_id.failure_reason or _('Mail delivery failed'))[:2000]
+        if sent:
+            sent.write({
+                'state': 'sent',
+                'sent_at': fields.Datetime.now(),
+                'error_message': False,
+                'next_attempt_at': False,
+            })
+        return errors
+
+    # ============================== ACTIONS =================================
+    def action_preview_report(self):
+        self.ensure_one()
+        attachment = self._get_report_attachment()
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/web/content/{attachment.id}?download=true',
+            'target': 'self',
+        }
+
+    def action_send_single(self):
+        emails = self.exists().filtered(lambda e: e.state != 'sent')
+        errors = emails._send_batch()
+        for email in emails.filtered(lambda e: e.id in errors):
+            _logger.error('Failed sending auction report email (email %s): %s', email.id, errors[email.id])
+            email.write({
+                'state': 'failed',
+                'error_message': errors[email.id],
+                'next_attempt_at': False,
+            })
         return True
 
     @api.model
     def send_in_background(self, email_ids):
-        if not email_ids:
+        """
+        Queue emails for the report email cron. The queue lives in the
+        database, so queued emails survive worker restarts and are picked up
+        once the calling transaction commits. Emails already queued, being
+        sent or sent are left alone, so sending twice does not duplicate them.
+        """
+        emails = self.browse(email_ids).exists().filtered(lambda e: e.state in ('draft', 'failed', 'no_email'))
+        if not emails:
             return True
-        db_name = self.env.cr.dbname
-        uid = self.env.uid
-        context = dict(self.env.context or {})
+        emails.write({
+            'state': 'queued',
+            'attempt_count': 0,
+            'next_attempt_at': fields.Datetime.now(),
+            'error_message': False,
+            'requested_by_id': self.env.uid,
+            'mail_id': False,
+        })
+        self.env.ref('liveag_consignment.ir_cron_auction_report_email_queue')._trigger()
+        return True
 
-        def _runner(db, user_id, ids, ctx):
-            with sql_db.db_connect(db).cursor() as cr:
-                env = api.Environment(cr, user_id, ctx)
-                env['auction.report.email'].browse(ids).action_send_single()
+    # ============================== QUEUE ===================================
+    def _get_queue_param(self, key, default):
+        value = self.env['ir.config_parameter'].sudo().get_param(key)
+        try:
+            return max(int(value), 1) if value else default
+        except ValueError:
+            return default
 
-        thread = threading.Thread(target=_runner, args=(db_name, uid, email_ids, context), daemon=True)
-        thread.start()
-        return True
+    @api.model
+    def _claim_jobs(self, limit):
+        """
+        Mark up to limit due emails as sending and return their ids.
+
+        Rows are locked with SKIP LOCKED, so concurrent cron runs never claim the
+        same email. A claim counts as an attempt and expires after CLAIM_LEASE, so
+        emails of a worker that died are retried; once an expired claim has used
+        up the attempts, the email is marked failed instead of claimed again.
+        """
+        now = fields.Datetime.now()
+        max_attempts = self._get_queue_param(MAX_ATTEMPTS_PARAM, DEFAULT_MAX_ATTEMPTS)
+        self.env.cr.execute(SQL(
+            """
+            UPDATE auction_report_email
+               SET state = 'failed', next_attempt_at = NULL,
+                   error_message = %(message)s
+             WHERE state = 'sending' AND next_attempt_at <= %(now)s
+               AND COALESCE(attempt_count, 0) >= %(max_attempts)s
+            RETURNING id
+            """,
+            now=now, max_attempts=max_attempts,
+            message=_('The email was interrupted while sending %s times.') % max_attempts,
+        ))
+        for (email_id,) in self.env.cr.fetchall():
+            _logger.error('Auction report email %s failed: its worker died on every attempt', email_id)
+        self.env.cr.execute(SQL(
+            """
+            UPDATE auction_report_email
+               SET state = 'sending',
+                   attempt_count = COALESCE(attempt_count, 0) + 1,
+                   next_attempt_at = %(lease)s
+             WHERE id IN (
+                SELECT id FROM auction_report_email
+                 WHERE state IN ('queued', 'sending') AND next_attempt_at <= %(now)s
+                 ORDER BY next_attempt_at, id
+                 LIMIT %(limit)s
+                   FOR UPDATE SKIP LOCKED
+             )
+            RETURNING id
+            """,
+            now=now, lease=now + CLAIM_LEASE, limit=limit,
+        ))
+        ids = [row[0] for row in self.env.cr.fetchall()]
+        self.invalidate_model(['state', 'attempt_count', 'next_attempt_at', 'error_message'])
+        return ids
+
+    def _process_jobs(self):
+        """Send claimed emails as one batch; failures are retried with exponential backoff."""
+        max_attempts = self._get_queue_param(MAX_ATTEMPTS_PARAM, DEFAULT_MAX_ATTEMPTS)
+        for user, emails in self.grouped(lambda e: e.requested_by_id or self.env.user).items():
+            emails.with_user(user)._prerender_report_pdfs()
+            errors = emails.with_user(user)._send_batch()
+            for email in emails.filtered(lambda e: e.id in errors):
+                if email.attempt_count >= max_attempts:
+                    _logger.error('Auction report email %s failed after %s attempts: %s',
+                                  email.id, email.attempt_count, errors[email.id])
+                    email.write({'state': 'failed', 'error_message': errors[email.id], 'next_attempt_at': False})
+                else:
+                    delay = RETRY_BASE_DELAY * 2 ** (email.attempt_count - 1)
+                    _logger.warning('Auction report email %s failed (attempt %s), retrying in %s: %s',
+                                    email.id, email.attempt_count, delay, errors[email.id])
+                    email.write({
+                        'state': 'queued',
+                        'error_message': errors[email.id],
+                        'next_attempt_at': fields.Datetime.now() + delay,
+                    })
+
+    @staticmethod
+    def _run_worker(dbname, uid, ids):
+        """Worker thread: send one batch of claimed emails on its own cursor."""
+        threading.current_thread().dbname = dbname
+        threading.current_thread().uid = uid
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, uid, {})
+            env['auction.report.email'].browse(ids)._process_jobs()
+            cr.commit()
+
+    @api.model
+    def _cron_process_queue(self):
+        """
+        Send due queued emails with a pool of worker threads (size from the
+        liveag_consignment.report_email_workers parameter). Runs rounds of
+        claims until the queue is empty or the time budget is spent, then
+        triggers itself again if work remains.
+        """
+        workers = self._get_queue_param(WORKERS_PARAM, DEFAULT_WORKERS)
+        batch_size = self._get_queue_param(SMTP_BATCH_PARAM, DEFAULT_SMTP_BATCH)
+        testing = getattr(threading.current_thread(), 'testing', False)
+        deadline = fields.Datetime.now() + CRON_TIME_BUDGET
+        while fields.Datetime.now() < deadline:
+            ids = self._claim_jobs(workers * batch_size)
+            if not ids:
+                return
+            if testing:
+                self.browse(ids)._process_jobs()
+                continue
+            # Claims must be committed before the workers touch the rows
+            self.env.cr.commit()
+            threads = [
+                threading.Thread(
+                    target=self._run_worker,
+                    args=(self.env.cr.dbname, self.env.uid, ids[index * batch_size:(index + 1) * batch_size]),
+                    name=f'auction_report_email_worker_{index}',
+                )
+                for index in range((len(ids) + batch_size - 1) // batch_size)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.env.invalidate_all()
+        self.env.ref('liveag_consignment.ir_cron_auction_report_email_queue')._trigger()
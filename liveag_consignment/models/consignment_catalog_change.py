@@ -1,5 +1,5 @@
 
-from odoo import fields, models
+from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
 class CatalogChange(models.Model):
@@ -22,24 +22,82 @@ class CatalogChange(models.Model):
     notes = fields.Text(string='Notes')
     catalog_change = fields.Boolean(string='Catalog Change', default=True)
 
-    def action_approve(self):
+    _contract_field_state_idx = models.Index("(contract_id, field_name, state)")
+
+    def _check_approver(self):
         user_partner = self.env.user.partner_id
-        is_admin = 'Admin' in user_partner.contact_type_ids.mapped('name')
-        if is_admin:
-            self.write({
+        if 'Admin' not in user_partner.contact_type_ids.mapped('name'):
+            raise ValidationError(_("Only Admin users can approve changes."))
+
+    def _approve(self):
+        """
+        Approve the draft and pending changes of self and apply their new values.
+
+        Changes are grouped by contract and each contract gets all its values in
+        one write (the newest change wins when several touch the same field).
+        Every contract is written in its own savepoint: when a value cannot be
+        applied, the changes of that contract stay as they are and are reported.
+        Returns {change_id: error message} for those changes.
+        """
+        changes = self.filtered(lambda c: c.state in ('draft', 'pending'))
+        changes.fetch(['contract_id', 'field_name', 'new_value', 'create_date'])
+        errors = {}
+        applied = self.browse()
+        for contract, contract_changes in changes.grouped('contract_id').items():
+            vals = {
+                change.field_name: change.new_value
+                for change in contract_changes.sorted(lambda c: (c.create_date, c.id))
+            }
+            try:
+                with self.env.cr.savepoint():
+                    contract.with_context(from_catalog_change=True).write(vals)
+            except Exception as e:
+                for change in contract_changes:
+                    errors[change.id] = str(e)
+                continue
+            applied |= contract_changes
+        if applied:
+            applied.write({
                 'state': 'approved',
                 'approved_by': self.env.user.id,
-                'approved_date': fields.Datetime.now()
+                'approved_date': fields.Datetime.now(),
             })
-            if self.contract_id and self.field_name:
-                self.contract_id.with_context(from_catalog_change=True).write({self.field_name: self.new_value}) 
-        else:
-            raise ValidationError("Only Admin users can approve changes.")
+        return errors
+
+    def _reject(self):
+        """Reject the draft and pending changes of self; the contracts keep their values."""
+        self.filtered(lambda c: c.state in ('draft', 'pending')).write({'state': 'rejected'})
+
+    def action_approve(self):
+        self._check_approver()
+        errors = self._approve()
+        if not errors:
+            return True
+        # The other changes are applied and kept; only report the failed ones
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Some changes could not be applied'),
+                'message': "\n".join(
+                    f"• {change.contract_id.display_name} / {change.field_name}: {errors[change.id]}"
+                    for change in self.filtered(lambda c: c.id in errors)
+                ),
+                'type': 'warning',
+                'sticky': True,
+                'next': {'type': 'ir.actions.client', 'tag': 'soft_reload'},
+            }
+        }
 
     def action_reject(self):
         self.write({'state': 'rejected'})
 
-    def create(self, data_list):
-        if data_list['state'] in ['draft', 'pending']:
-            self.env['consignment.contract'].browse(data_list['contract_id']).write({'state': 'changed'})
-        return super().create(data_list)
\ No newline at end of file
+    @api.model_create_multi
+    def create(self, vals_list):
+        changed_ids = {
+            vals['contract_id'] for vals in vals_list
+            if vals.get('state', 'draft') in ['draft', 'pending']
+        }
+        if changed_ids:
+            self.env['consignment.contract'].browse(sorted(changed_ids)).write({'state': 'changed'})
+        return super().create(vals_list)
\ No newline at end of file
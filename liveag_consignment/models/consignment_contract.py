@@ -4,9 +4,6 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 import re
-import csv
-from io import StringIO
-import base64
 from datetime import datetime
 import logging
 from ..tools import round_half_up
@@ -602,6 +599,10 @@ class ConsignmentContract(models.Model):
     'gap_program', 'bqa_certified', 'beef_care', 'cfp', 'verified_grassfed',
     'organic', 'non_gmo', 'weight_stop', 'imi_raise_well', 'imi_pasture_raised')
     def _compute_program_icons(self):
+        # Icons of the boolean programs, looked up once for the whole batch
+        icons_by_field = {}
+        for icon in self.env['program.icon'].search([('field_name', '!=', False)]):
+            icons_by_field.setdefault(icon.field_name, icon)
         for contract in self:
             icon_records = self.env['program.icon']
 
@@ -633,10 +634,8 @@ class ConsignmentContract(models.Model):
             ]
 
             for field_name in boolean_fields:
-                if getattr(contract, field_name):
-                    icon_record = self.env['program.icon'].search([('field_name', '=', field_name)], limit=1)
-                    if icon_record:
-                        icon_records |= icon_record
+                if getattr(contract, field_name) and field_name in icons_by_field:
+                    icon_records |= icons_by_field[field_name]
 
             icon_records = icon_records.sorted(key=lambda x: x.priority)
             contract.program_icon_ids = icon_records
@@ -1315,6 +1314,41 @@ class ConsignmentContract(models.Model):
             self._format_field_value(field, new_value)
         )
 
+    @api.model
+    def _new_change_log_buffer(self):
+        """Empty buffer for _log_changes; pass it as the change_log_buffer context key."""
+        return {'contract.activity.log': [], 'catalog.change': []}
+
+    def _log_changes(self, model_name, vals_list):
+        """
+        Create activity or catalog-change log rows, or queue them in the
+        change_log_buffer context dict so _flush_change_logs can insert them later
+        with one create per model.
+        """
+        buffer = self.env.context.get('change_log_buffer')
+        if buffer is not None:
+            buffer[model_name].extend(vals_list)
+            return
+        self._flush_change_logs({model_name: vals_list})
+
+    @api.model
+    def _flush_change_logs(self, buffer):
+        """
+        Insert the queued log rows of a change log buffer and empty it.
+        Like _create_activity_log, a failing activity log insert is only logged;
+        catalog changes are not optional and their errors propagate.
+        """
+        if buffer.get('contract.activity.log'):
+            try:
+                with self.env.cr.savepoint():
+                    self.env['contract.activity.log'].sudo().create(buffer['contract.activity.log'])
+            except Exception as e:
+                _logger.error(f"Failed to create activity logs: {str(e)}")
+        if buffer.get('catalog.change'):
+            self.env['catalog.change'].create(buffer['catalog.change'])
+        for vals_list in buffer.values():
+            vals_list.clear()
+
     def _create_activity_log(self, contract_id, field_name, field_string, old_value, new_value):
         """Create activity log entry with error handling."""
         try:
@@ -1327,7 +1361,7 @@ class ConsignmentContract(models.Model):
                 'user_id': self.env.user.partner_id.id,
                 'timestamp': fields.Datetime.now(),
             }
-            self.env['contract.activity.log'].sudo().create(log_vals)
+            self._log_changes('contract.activity.log', [log_vals])
             _logger.info(f"Activity log created for {field_name}: {old_value} -> {new_value}")
         except Exception as e:
             _logger.error(f"Failed to create activity log for {field_name}: {str(e)}")
@@ -1358,6 +1392,12 @@ class ConsignmentContract(models.Model):
                 new_formatted
             )
 
+    def _prefetch_tracked_fields(self, field_names):
+        """Load the current values of the stored fields about to be compared in one query."""
+        stored = [name for name in field_names if name in self._fields and self._fields[name].store]
+        if stored:
+            self.fetch(stored)
+
     def write(self, vals):
         """Override write method to handle special cases and track changes."""
         # Handle state validation before any changes are made
@@ -2272,605 +2312,18 @@ class ConsignmentContract(models.Model):
     #! Auctic Export
     def action_export_auctic_csv(self):
         """Export selected contracts to CSV file"""
-        if not self:
-            raise ValidationError(_("Please select at least one contract to export."))
-
-        output = StringIO()
-        writer = csv.writer(output)
-
-        headers = [
-            'Contract ID',
-            'Lot Number',
-            'Sale Order',
-            'Title',
-            # 'Title 2',
-            # 'Title 3',
-            'Description',
-            'Seller',
-            'Price Back',
-            'Location',
-            'City',
-            'State',
-            'Delivery',
-            'Origin',
-            'Slide',
-            'Reps',
-            'Breed Type',
-            'Implanted',
-            'Weighing Conditions',
-            'Comments',
-            'Vaccinations',
-            'Frame Size',
-            'Flesh Type',
-            'Horns',
-            'Weight Variance',
-            'Feeding Program',
-            'Icons',
-            'Video',
-        ]
-        
-        # Check if any contract is LiveAgXchange to determine headers
-        is_liveagxchange = any(contract.auction_id and contract.auction_id.sale_type.name == 'LiveAgXchange' for contract in self)
-        
-        if is_liveagxchange:
-            headers.append('Asking Price')
-            headers.append('seller_user_email')
-            headers.append('sale method')
-            headers.append('status')
-        else:
-            headers.append('Starting Bid Amount')
-
-        writer.writerow(headers)
-
-        # Sort contracts based on state and dates
-        def sort_key(c):
-            # Universal sorting for all contracts
-            is_sold = c.state in ['sold', 'delivered', 'delivery_ready']
-            if is_sold:
-                # Sold contracts: sort by sold_date (oldest first)
-                sold_date = c.sold_date or c.create_date.date()
-                return (1, sold_date.toordinal(), c.lot_number or '')
-            else:
-                # Active contracts: sort by create_date (newest first)
-                return (0, -(c.create_date.date()).toordinal(), c.lot_number or '')
-        
-        sorted_contracts = self.sorted(key=sort_key)
-        
-        
-        # Assign sale order numbers for LiveAgXchange contracts
-        liveagxchange_contracts = [c for c in sorted_contracts if c.auction_id and c.auction_id.sale_type.name == 'LiveAgXchange']
-        if liveagxchange_contracts:
-            for i, contract in enumerate(liveagxchange_contracts, 1):
-                contract.sale_order = i
-
-        for contract in sorted_contracts:
-            is_liveagxchange = contract.auction_id and contract.auction_id.sale_type.name == 'LiveAgXchange'
-            lot_number = ''
-            if contract.lot_number:
-                cleaned = ''.join(char for char in contract.lot_number if char.isdigit() or char == '.')
-                if '.' in cleaned:
-                    parts = cleaned.split('.')
-                    lot_number = f"{parts[0]}.{''.join(parts[1:])}"
-                else:
-                    lot_number = cleaned
-
-            # title = self._compute_title(contract)
-            title = ''
-            if is_liveagxchange:
-                title = f"{contract.head1} {contract.kind1.name} {f'{contract.weight1}#' if contract.weight1 else '' }"
-                if contract.kind2 and contract.weight2:
-                    title += f" &{f' {contract.head2}' if contract.head2 else '' } {contract.kind2.name} {f'{contract.weight2}#' if contract.weight2 else ''}"
-            else:
-                title = self._compute_title(contract)
-            title2 = ''
-            if contract.head1 and contract.kind1:
-                title2 = f"{contract.head1} {contract.kind1.name} {f'{contract.weight1}#' if contract.weight1 else ''}"
-            title3 = ''
-            if contract.kind2 and contract.weight2:
-                title3 = f"{f'#{contract.head2}' if contract.head2 else '&' } {contract.kind2.name} {f'{contract.weight2}#' if contract.weight2 else ''}"
-
-            asking_price = contract.asking_price or ''
-            if asking_price and isinstance(asking_price, (int, float)):
-                asking_price = f"{asking_price:.0f}" if asking_price.is_integer() else f"{asking_price:.2f}"
-
-            slide_description = contract.short_slide_description or ''
-            location_description = self.get_short_location_description(contract)
-            
-            sorted_icons = contract.program_icon_ids.sorted(key=lambda x: x.priority)
-            icon_urls = [f'{icon.image_url},{icon.name}' for icon in sorted_icons if icon.image_url]
-            icon_string = '|'.join(icon_urls) if icon_urls else ''
-
-            delivery_range = f'="{contract.delivery_date_range}"' if contract.delivery_date_range else ''
-            description = ''
-            description_parts = []
-            if contract.seller_id:
-                description_parts.append(f"<strong>Seller: </strong>{contract.seller_id.name}")
-            if contract.origin_full_description:
-                description_parts.append(f"<strong>Origin: </strong>{contract.origin_full_description}")
-            if delivery_range:
-                description_parts.append(f"<strong>Delivery: </strong>{delivery_range}")
-            primary_rep = contract.primary_rep
-            if primary_rep:
-                description_parts.append(f"<strong>Rep: </strong>{primary_rep.rep_name}, {self.format_phone(primary_rep.phone) if primary_rep.phone else ''}")
-            description_parts.append("")
-            if contract.breed_type:
-                description_parts.append(f"<strong>Breed Type: </strong>{contract.breed_type}")
-            if slide_description:
-                description_parts.append(f"<strong>Slide: </strong>{slide_description}")
-            description = "<br>".join(description_parts)
-            if sorted_icons:
-                icon_html = '<div style="display: flex; gap: 10px; margin-top: 10px;">'
-                for icon in sorted_icons:
-                    if icon.image_url:
-                        icon_html += f'<img src="{icon.image_url}" alt="{icon.name}" style="height: 40px;">'
-                icon_html += '</div>'
-                description_parts.append(icon_html)
-                description = "<br>".join(description_parts)
-
-
-            implanted = ""
-            if contract.implanted_type:
-                if contract.implanted_month and contract.implanted_year:
-                    month_name = datetime.strptime(str(contract.implanted_month), '%m').strftime('%b')
-                    implanted = f"{contract.implanted_type.name} - {month_name} {contract.implanted_year}"
-                else:
-                    implanted = contract.implanted_type.name
-
-            reps = ""
-            for i, rep in enumerate(contract.rep_ids):
-                if rep.rep_id.rep_name:
-                    formatted_phone = self.format_phone(rep.rep_id.phone)
-                    reps += f"{rep.rep_id.rep_name} {formatted_phone}"
-                    if i < len(contract.rep_ids) - 1:
-                        reps += ", "
-                        
-
-            row = [
-                f'CN {contract.id:05d}',
-                lot_number or '',
-                contract.sale_order or '',
-                title,
-                # title2,
-                # title3,
-                description,
-                contract.seller_id.name or '',
-                contract.price_back or '',
-                location_description or '',
-                contract.nearest_town or '',
-                contract.state_of_nearest_town.code or '',
-                delivery_range or '',
-                contract.origin_full_description or '',
-                slide_description,
-                reps,
-                contract.breed_type or '',
-                implanted,
-                contract.weighing_cond_w_freight or '',
-                contract.full_comments or '',
-                contract.full_vaccination_desc or '',
-                contract.frame_size.name if contract.frame_size else '',
-                contract.flesh_type.name if contract.flesh_type else '',
-                contract.horns.name if contract.horns else '',
-                contract.weight_variance.name if contract.weight_variance else '',
-                contract.feeding_program or '',
-                icon_string,
-                contract.video_link or '',
-            ]
-            if is_liveagxchange:
-                row.append(asking_price)
-                row.append('xchange@live-ag.com')
-                row.append('buynow_makeoffer')
-                row.append('active')
-            else:
-                row.append(asking_price or '')
-                
-            writer.writerow(row)
-
-        auction = self[0].auction_id
-        timestamp = fields.Datetime.now().strftime('%b-%d-%y_%H:%M')
-        if auction and auction.sale_type.name == 'Video Sale':
-            date_str = auction.sale_date_begin.strftime('%B %d')
-            filename = f'LAVA_Auctic_{date_str}.csv'
-        elif auction and auction.sale_type.name == 'Private Treaty':
-            filename = f'PT_Auctic_{timestamp}.csv'
-        elif auction and auction.sale_type.name == 'LiveAgXchange':
-            filename = f'LAX_Auctic_{timestamp}.csv'
-        else:
-            filename = f'Auctic_Contracts_{timestamp}.csv'
-
-        attachment_vals = {
-            'name': filename,
-            'datas': base64.b64encode(output.getvalue().encode()).decode(),
-            'type': 'binary',
-        }
-        attachment = self.env['ir.attachment'].create(attachment_vals)
+        return self.env['consignment.contract.export']._export(self, 'auctic')
 
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'self',
-        }
-        
     #! Auctic Export v2
     def action_export_auctic_v2_csv(self):
         """Export selected contracts to CSV file"""
-        if not self:
-            raise ValidationError(_("Please select at least one contract to export."))
-
-        output = StringIO()
-        writer = csv.writer(output)
-
-        headers = [
-            'Contract ID',
-            'Lot Number',
-            'Sale Order',
-            'Title',
-            'Seller',
-            'Head1',
-            'Kind1',
-            'Weight1',
-            'Head2',
-            'Kind2',
-            'Weight2',
-            'Price Back',
-            'Description',
-            'Location',
-            'Delivery',
-            'Slide',
-            'Rep',
-            'Origin',
-            'Breed Type',
-            'Bangs Vacc',
-            'Frame Size',
-            'Flesh',
-            'Wt. Variance',
-            'Horns',
-            'Implanted',
-            'Feeding Type',
-            'Weigh Cond.',
-            'Vaccinations',
-            'Comments',
-            'Option',
-            'Represented By',
-            'City',
-            'State',
-            'Icons',
-            'Video',
-        ]
-        
-        # Check if any contract is LiveAgXchange to determine headers
-        is_liveagxchange = any(contract.auction_id and contract.auction_id.sale_type.name == 'LiveAgXchange' for contract in self)
-        
-        if is_liveagxchange:
-            headers.append('Asking Price')
-            headers.append('seller_user_email')
-            headers.append('sale method')
-            headers.append('status')
-        else:
-            headers.append('Starting Bid Amount')
-
-        writer.writerow(headers)
-
-        # Sort contracts based on state and dates
-        def sort_key(c):
-            # Universal sorting for all contracts
-            is_sold = c.state in ['sold', 'delivered', 'delivery_ready']
-            if is_sold:
-                # Sold contracts: sort by sold_date (oldest first)
-                sold_date = c.sold_date or c.create_date.date()
-                return (1, sold_date.toordinal(), c.lot_number or '')
-            else:
-                # Active contracts: sort by create_date (newest first)
-                return (0, -(c.sale_order or 0), c.lot_number or '')
-
-        sorted_contracts = self.sorted(key=sort_key)
-        
-        
-        # Assign sale order numbers for LiveAgXchange contracts
-        liveagxchange_contracts = [c for c in sorted_contracts if c.auction_id and c.auction_id.sale_type.name == 'LiveAgXchange']
-        if liveagxchange_contracts:
-            for i, contract in enumerate(liveagxchange_contracts, 1):
-                contract.sale_order = i
-
-        for contract in sorted_contracts:
-            is_liveagxchange = contract.auction_id and contract.auction_id.sale_type.name == 'LiveAgXchange'
-            lot_number = ''
-            if contract.lot_number:
-                cleaned = ''.join(char for char in contract.lot_number if char.isdigit() or char == '.')
-                if '.' in cleaned:
-                    parts = cleaned.split('.')
-                    lot_number = f"{parts[0]}.{''.join(parts[1:])}"
-                else:
-                    lot_number = cleaned
-
-            title = ''
-            if is_liveagxchange:
-                title = f"{contract.head1} {contract.kind1.name} {f'{contract.weight1}#' if contract.weight1 else '' }"
-                if contract.kind2 and contract.weight2:
-                    title += f" &{f' {contract.head2}' if contract.head2 else '' } {contract.kind2.name} {f'{contract.weight2}#' if contract.weight2 else ''}"
-            else:
-                title = self._compute_title(contract)
-
-            asking_price = contract.asking_price or ''
-            if asking_price and isinstance(asking_price, (int, float)):
-                asking_price = f"{asking_price:.0f}" if asking_price.is_integer() else f"{asking_price:.2f}"
-
-            slide_description = contract.short_slide_description or ''
-            sorted_icons = contract.program_icon_ids.sorted(key=lambda x: x.priority)
-            icon_urls = [f'{icon.image_url}' for icon in sorted_icons if icon.image_url]
-            icon_string = ','.join(icon_urls) if icon_urls else ''
-
-            delivery_range = f"{contract.delivery_date_range}" if contract.delivery_date_range else ''
-            description = ''
-            description_parts = []
-            if contract.seller_id:
-                description_parts.append(f"<strong>Seller: </strong>{contract.seller_id.name}")
-            if contract.origin_full_description:
-                description_parts.append(f"<strong>Origin: </strong>{contract.origin_full_description}")
-            if delivery_range:
-                description_parts.append(f"<strong>Delivery: </strong>{delivery_range}")
-            primary_rep = contract.primary_rep
-            if primary_rep:
-                description_parts.append(f"<strong>Rep: </strong>{primary_rep.rep_name}, {self.format_phone(primary_rep.phone) if primary_rep.phone else ''}")
-            description_parts.append("")
-            if contract.breed_type:
-                description_parts.append(f"<strong>Breed Type: </strong>{contract.breed_type}")
-            if slide_description:
-                description_parts.append(f"<strong>Slide: </strong>{slide_description}")
-            description = "<br>".join(description_parts)
-            if sorted_icons:
-                icon_html = '<div style="display: flex; gap: 10px; margin-top: 10px;">'
-                for icon in sorted_icons:
-                    if icon.image_url:
-                        icon_html += f'<img src="{icon.image_url}" alt="{icon.name}" style="height: 40px;">'
-                icon_html += '</div>'
-                description_parts.append(icon_html)
-                description = "<br>".join(description_parts)
-
-
-            implanted = ""
-            if contract.implanted_type:
-                if contract.implanted_month and contract.implanted_year:
-                    month_name = datetime.strptime(str(contract.implanted_month), '%m').strftime('%b')
-                    implanted = f"{contract.implanted_type.name} - {month_name} {contract.implanted_year}"
-                else:
-                    implanted = contract.implanted_type.name
-
-            primary_rep = f"{contract.primary_rep.rep_name} - {self.format_phone(contract.primary_rep.phone) if contract.primary_rep.phone else ''}"
-            reps = ""
-            for i, rep in enumerate(contract.rep_ids):
-                if rep.rep_id.rep_name:
-                    formatted_phone = self.format_phone(rep.rep_id.phone)
-                    reps += f"{rep.rep_id.rep_name} - {formatted_phone}"
-                    if i < len(contract.rep_ids) - 1:
-                        reps += ", "
-                        
-
-            row = [
-                contract.id or '',
-                lot_number or '',
-                contract.sale_order or '',
-                title,
-                contract.seller_id.seller_name or '',
-                contract.head1 or '',
-                contract.kind1.name if contract.kind1 else '',
-                contract.weight1 or '',
-                contract.head2 or '',
-                contract.kind2.name if contract.kind2 else '',
-                contract.weight2 or '',
-                contract.price_back or '',
-                description,
-                contract.location_description or '',
-                f"'{contract.delivery_date_range}" if contract.delivery_date_range else '',
-                slide_description,
-                primary_rep or '',
-                contract.origin_full_description or '',
-                contract.breed_type or '',
-                contract.bangs_vaccinated.name if contract.bangs_vaccinated else '',
-                contract.frame_size.name if contract.frame_size else '',
-                contract.flesh_type.name if contract.flesh_type else '',
-                contract.weight_variance.name if contract.weight_variance else '',
-                contract.horns.name if contract.horns else '',
-                implanted,
-                contract.feeding_program or '',
-                contract.weighing_cond_w_freight or '',
-                contract.full_vaccination_desc or '',
-                contract.full_comments or '',
-                contract.option_description or '',
-                reps,
-                contract.nearest_town or '',
-                contract.state_of_nearest_town.code or '',
-                icon_string,
-                contract.video_link or '',
-            ]
-            if is_liveagxchange:
-                row.append(asking_price)
-                row.append('xchange@live-ag.com')
-                row.append('buynow_makeoffer')
-                row.append('active')
-            else:
-                row.append(asking_price or '')
-                
-            writer.writerow(row)
-
-        auction = self[0].auction_id
-        timestamp = fields.Datetime.now().strftime('%b-%d-%y_%H:%M')
-        if auction and auction.sale_type.name == 'Video Sale':
-            date_str = auction.sale_date_begin.strftime('%B %d')
-            filename = f'LAVA_Auctic_{date_str}.csv'
-        elif auction and auction.sale_type.name == 'Private Treaty':
-            filename = f'PT_Auctic_{timestamp}.csv'
-        elif auction and auction.sale_type.name == 'LiveAgXchange':
-            filename = f'LAX_Auctic_{timestamp}.csv'
-        else:
-            filename = f'Auctic_Contracts_{timestamp}.csv'
-
-        attachment_vals = {
-            'name': filename,
-            'datas': base64.b64encode(output.getvalue().encode()).decode(),
-            'type': 'binary',
-        }
-        attachment = self.env['ir.attachment'].create(attachment_vals)
+        return self.env['consignment.contract.export']._export(self, 'auctic_v2')
 
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'self',
-        }
-        
     #! Catalog Export
     def action_export_catalog_csv(self):
         """Export selected contracts to CSV file"""
-        if not self:
-            raise ValidationError(_("Please select at least one contract to export."))
-
-        output = StringIO()
-        writer = csv.writer(output)
-        output.write('\ufeff')
-
-        headers = [
-            'Code',
-            'Contract ID',
-            'Seller',
-            'Head 1',
-            'Kind 1',
-            'Weight 1',
-            'Head 2',
-            'Kind 2',
-            'Weight 2',
-            'Price Back',
-            'Delivery Date Range',
-            'Location Description',
-            'Weighing Conditions',
-            'Breed Type',
-            'Short Slide Description',
-            'Origin',
-            'Frame Size',
-            'Flesh Type',
-            'Est Weight Variance',
-            'Horns',
-            'Feeding Program',
-            'VAC Program',
-            'Bangs Vaccinated',
-            'Vaccination Description',
-            'Implanted',
-            'Comments',
-            'Rep 1',
-            'Rep 2',
-            'Rep 3',
-            'Programs',
-            'Icon 1',
-            'Icon 2',
-            'Icon 3',
-            'Icon 4',
-            'Icon 5',
-            'Icon 6',
-            'Icon 7',
-            'Icon 8',
-            'Icon 9',
-            'Icon 10',
-            'Option Lot'
-        ]
-        writer.writerow(headers)
+        return self.env['consignment.contract.export']._export(self, 'catalog')
 
-        sorted_contracts = self.sorted(
-            key=lambda c: (c.sale_order or float('inf'), c.lot_number or '')
-        )
-
-        for contract in sorted_contracts:
-            location_description = self.get_location_description(contract)
-            implanted = ""
-            if contract.implanted_type:
-                if contract.implanted_month and contract.implanted_year:
-                    month_name = datetime.strptime(str(contract.implanted_month), '%m').strftime('%b')
-                    implanted = f"{contract.implanted_type.name} - {month_name} {contract.implanted_year}"
-                else:
-                    implanted = contract.implanted_type.name
-                    
-            reps = []
-            for i, rep in enumerate(contract.rep_ids):
-                if rep.rep_id.name:
-                    formatted_phone = self.format_phone(rep.rep_id.phone)
-                    reps.append(f"{rep.rep_id.rep_name} - {formatted_phone}")
-
-            program_names = ""
-            for program in contract.program_icon_ids:
-                program_names += f"{program.name}"
-                if program.name != contract.program_icon_ids[-1].name:
-                    program_names += ", "
-
-            sorted_icons = contract.program_icon_ids.sorted(key=lambda x: x.priority)
-            icon_urls = [icon.image_url for icon in sorted_icons[:10]]
-            icon_urls.extend([''] * (10 - len(icon_urls)))
-            
-            row = [
-                contract.lot_number or '',
-                f'CN {contract.id:05d}',
-                contract.seller_id.name or '',
-                contract.head1 or '',
-                contract.kind1.name if contract.kind1 else '',
-                contract.weight1 or '',
-                contract.head2 or '',
-                contract.kind2.name if contract.kind2 else '',
-                contract.weight2 or '',
-                contract.price_back or '',
-                contract.delivery_date_range if contract.delivery_date_range else '',
-                location_description or '',
-                contract.weighing_cond_w_freight or '',
-                (contract.breed_type or '').replace('\n', ' ').replace('\r', ' ').strip(),
-                contract.short_slide_description or '',
-                contract.origin_full_description or '',
-                contract.frame_size.name if contract.frame_size else '',
-                contract.flesh_type.name if contract.flesh_type else '',
-                contract.weight_variance.name if contract.weight_variance else '',
-                contract.horns.name if contract.horns else '',
-                contract.feeding_program or '',
-                contract.vac_program.name if contract.vac_program else '',
-                contract.bangs_vaccinated.name if contract.bangs_vaccinated else '',
-                contract.full_vaccination_desc or '',
-                implanted,
-                contract.full_comments or '',
-                reps[0] if reps else '',
-                reps[1] if len(reps) > 1 else '',
-                reps[2] if len(reps) > 2 else '',
-                program_names,
-                icon_urls[0],  # Icon 1
-                icon_urls[1],  # Icon 2
-                icon_urls[2],  # Icon 3
-                icon_urls[3],  # Icon 4
-                icon_urls[4],  # Icon 5
-                icon_urls[5],  # Icon 6
-                icon_urls[6],  # Icon 7
-                icon_urls[7],  # Icon 8
-                icon_urls[8],  # Icon 9
-                icon_urls[9],  # Icon 10
-                contract.option_description or '',
-            ]
-            writer.writerow(row)
-
-        auction = self[0].auction_id
-        timestamp = fields.Datetime.now().strftime('%b-%d-%y_%H:%M')
-        if auction and auction.sale_type.name == 'Video Sale':
-            date_str = auction.sale_date_begin.strftime('%B %d')
-            filename = f'LAVA_Catalog_{date_str}.csv'
-        elif auction and auction.sale_type.name == 'Private Treaty':
-            filename = f'PT_Catalog_{timestamp}.csv'
-        elif auction and auction.sale_type.name == 'LiveAgXchange':
-            filename = f'LAX_Catalog_{timestamp}.csv'
-        else:
-            filename = f'Catalog_Contracts_{timestamp}.csv'
-
-        attachment_vals = {
-            'name': filename,
-            'datas': base64.b64encode(output.getvalue().encode('utf-8-sig')).decode(),
-            'type': 'binary',
-        }
-        attachment = self.env['ir.attachment'].create(attachment_vals)
-
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'self',
-        }
     def format_delivery_date_range(self, start_date, end_date):
         """Format delivery date range according to TV format rules"""
         if not start_date:
@@ -2891,163 +2344,7 @@ class ConsignmentContract(models.Model):
     #! GFX Export
     def action_export_gfx_csv(self):
         """Export selected contracts to CSV file"""
-        if not self:
-            raise ValidationError(_("Please select at least one contract to export."))
-
-        output = StringIO()
-        writer = csv.writer(output)
-        output.write('\ufeff')
-
-        headers = [
-            'Lot',
-            'Consignor',
-            'HeadKind',
-            'Location',
-            'Delivery',
-            'Origin',
-            'Slide',
-            'Rep',
-            'BreedType',
-            'Notes',
-            'Changes',
-            'IconFiles',
-            'gfxChanged',
-        ]
-        writer.writerow(headers)
-        
-        sorted_contracts = self.sorted(
-            key=lambda c: (c.sale_order or float('inf'), c.lot_number or '')
-        )
-
-        for row_num, contract in enumerate(sorted_contracts, start=1):
-            sorted_icons = contract.program_icon_ids.sorted(key=lambda x: x.priority)
-            icon_filenames = [f'{icon.filename}' for icon in sorted_icons if icon.filename]
-            icon_string = '|'.join(icon_filenames) if icon_filenames else ''
-            
-            total_changes = 0
-
-            headKind = ""
-            if contract.head1 and contract.kind1 and contract.weight1:
-                head1_changed = bool(contract.catalog_changes_ids.filtered(
-                    lambda c: c.field_name == 'head1' and c.state == 'approved'))
-                kind1_changed = bool(contract.catalog_changes_ids.filtered(
-                    lambda c: c.field_name == 'kind1' and c.state == 'approved'))
-                weight1_changed = bool(contract.catalog_changes_ids.filtered(
-                    lambda c: c.field_name == 'weight1' and c.state == 'approved'))
-                price_back_changed = bool(contract.catalog_changes_ids.filtered(
-                    lambda c: c.field_name == 'price_back' and c.state == 'approved'))
-
-                total_changes += sum([head1_changed, kind1_changed, weight1_changed, price_back_changed])
-
-                head1_str = f"**{contract.head1}**" if head1_changed else str(contract.head1)
-                kind1_str = f"**{contract.kind1.name}**" if kind1_changed else contract.kind1.name
-                weight1_str = f"**{contract.weight1}#**" if weight1_changed else f"{contract.weight1}#"
-                
-                headKind = f"{head1_str} {kind1_str} {weight1_str}"
-                
-                if contract.head2 and contract.kind2 and contract.weight2:
-                    head2_changed = bool(contract.catalog_changes_ids.filtered(
-                        lambda c: c.field_name == 'head2' and c.state == 'approved'))
-                    kind2_changed = bool(contract.catalog_changes_ids.filtered(
-                        lambda c: c.field_name == 'kind2' and c.state == 'approved'))
-                    weight2_changed = bool(contract.catalog_changes_ids.filtered(
-                        lambda c: c.field_name == 'weight2' and c.state == 'approved'))
-
-                    total_changes += sum([head2_changed, kind2_changed, weight2_changed])
-
-                    head2_str = f"**{contract.head2}**" if head2_changed else str(contract.head2)
-                    kind2_str = f"**{contract.kind2.name}**" if kind2_changed else contract.kind2.name
-                    weight2_str = f"**{contract.weight2}#**" if weight2_changed else f"{contract.weight2}#"
-                    
-                    headKind += f"<br>{head2_str} {kind2_str} {weight2_str}"
-                    
-                    if contract.price_back:
-                        price_back_str = f"**${contract.price_back} back**" if price_back_changed else f"${contract.price_back} back"
-                        headKind += f" - {price_back_str}"
-                elif contract.price_back:
-                    price_back_str = f"**${contract.price_back} back**" if price_back_changed else f"${contract.price_back} back"
-                    headKind += f" - {price_back_str}"
-            
-            delivery_start_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name == 'delivery_date_start' and c.state == 'approved'))
-            delivery_end_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name == 'delivery_date_end' and c.state == 'approved'))
-            
-            if delivery_start_changed or delivery_end_changed:
-                total_changes += 1
-            
-            delivery_range = self.format_delivery_date_range(contract.delivery_date_start, contract.delivery_date_end)
-            if delivery_start_changed or delivery_end_changed:
-                delivery_range = f"**{delivery_range}**"
-            
-            location_description = self.get_short_location_description(contract)
-            location_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name in ['nearest_town', 'state_of_nearest_town', 'distance_to_nearest_town', 'direction_to_nearest_town', 'nearest_city', 'state_of_nearest_city', 'distance_to_nearest_city', 'direction_to_nearest_city'] 
-                and c.state == 'approved'))
-            origin_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name == 'origin' and c.state == 'approved'))
-            
-            slide_description = contract.short_slide_description or ''
-            
-            slide_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name in ['slide_type', 'slide_over', 'slide_under', 'slide_both'] 
-                and c.state == 'approved'))
-            
-            if slide_changed:
-                slide_description = f"**{contract.short_slide_description}**"
-            
-            breed_type_changed = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.field_name == 'breed_type' and c.state == 'approved'))
-            
-            total_changes += sum([location_changed, origin_changed, slide_changed, breed_type_changed])
-            
-            location = f"**{location_description}**" if location_changed else location_description
-            origin = f"**{contract.origin_full_description}**" if origin_changed else contract.origin_full_description or ''
-            slide = f"**{slide_description}**" if slide_changed else slide_description
-            breed_type = f"**{contract.breed_type}**" if breed_type_changed else contract.breed_type
-            option_text, option_text_markdown = self._compute_option_text(contract)
-            
-            row_data = [
-                contract.lot_number or '', #Lot Number
-                contract.seller_id.name or '', #Seller
-                headKind, #Head Kind
-                location, #Location
-                delivery_range, #Delivery Range
-                origin, #Origin
-                slide, #Slide
-                contract.rep_ids[0].rep_id.name if contract.rep_ids else '', #Rep
-                breed_type, #Breed Type
-                option_text_markdown, # notes
-                option_text, # changes
-                icon_string,
-                "2" if total_changes > 1 else "1" if total_changes == 1 else "", # gfxChanged 
-            ]
-            writer.writerow(row_data)
-            
-        auction = self[0].auction_id
-        timestamp = fields.Datetime.now().strftime('%b-%d-%y_%H:%M')
-        if auction and auction.sale_type.name == 'Video Sale':
-            date_str = auction.sale_date_begin.strftime('%B %d')
-            filename = f'LAVA_GFX_{date_str}.csv'
-        elif auction and auction.sale_type.name == 'Private Treaty':
-            filename = f'PT_GFX_{timestamp}.csv'
-        elif auction and auction.sale_type.name == 'LiveAgXchange':
-            filename = f'LAX_GFX_{timestamp}.csv'
-        else:
-            filename = f'GFX_Contracts_{timestamp}.csv'
-            
-        attachment_vals = {
-            'name': filename,
-            'datas': base64.b64encode(output.getvalue().encode('utf-8-sig')).decode(),
-            'type': 'binary',
-        }
-        attachment = self.env['ir.attachment'].create(attachment_vals)
-
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'self',
-        }
+        return self.env['consignment.contract.export']._export(self, 'gfx')
 
     @api.onchange('seller_id')
     def _onchange_seller_id_addendum(self):
@@ -3254,13 +2551,37 @@ class ConsignmentContract(models.Model):
     catalog_deadline_passed = fields.Boolean(compute='_compute_catalog_deadline_passed', store=False)
     catalog_change = fields.Boolean(compute='_compute_catalog_change', store=False, help='True if contract has any catalog changes')
 
+    def _get_catalog_change_index(self, states=('pending', 'approved')):
+        """
+        Latest catalog change per contract and field, loaded with one query.
+
+        Returns {contract_id: {field_name: catalog.change}} for the catalog
+        changes (not internal change logs) of self in the given states, keyed by
+        the id of the saved contract. Contracts without any are absent.
+        """
+        contract_ids = [contract_id for contract_id in self._origin.ids if contract_id]
+        if not contract_ids:
+            return {}
+        changes = self.env['catalog.change'].search_fetch(
+            [
+                ('contract_id', 'in', contract_ids),
+                ('catalog_change', '=', True),
+                ('state', 'in', list(states)),
+            ],
+            ['contract_id', 'field_name', 'state'],
+            order='create_date desc, id desc',
+        )
+        index = {}
+        for change in changes:
+            index.setdefault(change.contract_id.id, {}).setdefault(change.field_name, change)
+        return index
+
     @api.depends('catalog_changes_ids', 'catalog_changes_ids.state')
     def _compute_catalog_change(self):
         """Compute if contract has any catalog changes"""
+        index = self._get_catalog_change_index(('pending', 'approved'))
         for contract in self:
-            contract.catalog_change = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.state in ['pending', 'approved']
-            ))
+            contract.catalog_change = bool(index.get(contract._origin.id))
 
     def has_field_catalog_change(self, field_names):
         """Check if specific field(s) have catalog changes
@@ -3278,6 +2599,19 @@ class ConsignmentContract(models.Model):
             lambda c: c.field_name in field_names and c.state in ['pending', 'approved']
         ))
 
+    def _get_pending_changes(self):
+        """Pending catalog changes and change requests of the contracts."""
+        return self.env['catalog.change'].search([('contract_id', 'in', self.ids), ('state', '=', 'pending')])
+
+    def action_approve_catalog_changes(self):
+        """Approve the pending changes of the selected contracts, one write per contract."""
+        return self._get_pending_changes().action_approve()
+
+    def action_reject_catalog_changes(self):
+        """Reject the pending changes of the selected contracts."""
+        self._get_pending_changes()._reject()
+        return True
+
     @api.depends('auction_id', 'auction_id.catalog_deadline', 'auction_id.is_public')
     def _compute_catalog_deadline_passed(self):
         for contract in self:
@@ -3290,15 +2624,18 @@ class ConsignmentContract(models.Model):
 
     @api.depends('catalog_changes_ids', 'catalog_changes_ids.state')
     def _compute_has_catalog_changes(self):
+        index = self._get_catalog_change_index(('draft', 'pending', 'approved'))
         for contract in self:
-            contract.has_catalog_changes = bool(contract.catalog_changes_ids.filtered(
-                lambda c: c.state in ['draft', 'pending', 'approved']
-            ))
+            contract.has_catalog_changes = bool(index.get(contract._origin.id))
 
 
     def write(self, vals):
+        if self.env.context.get('from_catalog_change'):
+            return super().write(vals)
+
         user_partner = self.env.user.partner_id
         is_admin = 'Admin' in user_partner.contact_type_ids.mapped('name')
+        change_vals_list = []
 
         def _create_change_log(catalog_change=True, vals=None, record=None):
             to_remove = []
@@ -3306,36 +2643,34 @@ class ConsignmentContract(models.Model):
                 if field_name in record._fields and field_name not in IGNORED_FIELDS:
                     old_value = record[field_name]
                     if old_value != new_value:
-                        change = self.env['catalog.change'].create({
+                        change_vals = {
                             'contract_id': record.id,
                             'field_name': field_name,
                             'old_value': str(old_value),
                             'new_value': str(new_value),
                             'state': 'approved' if is_admin else 'pending',
                             'catalog_change': catalog_change,
-                        })
+                        }
                         if is_admin:
-                            change.write({
+                            change_vals.update({
                                 'approved_by': self.env.user.id,
                                 'approved_date': fields.Datetime.now()
                             })
                         else:
                             to_remove.append(field_name)
+                        change_vals_list.append(change_vals)
             
             return to_remove
 
+        # Old values of the whole recordset come from one prefetch, and every
+        # change row is created in a single batch before the one write below
+        self._prefetch_tracked_fields([name for name in vals if name not in IGNORED_FIELDS] + ['state'])
         for record in self:
             to_remove = []
             if record.catalog_deadline_passed:
-                if self.env.context.get('from_catalog_change'):
-                    return super().write(vals)
-                    
                 to_remove = _create_change_log(catalog_change=True, vals=vals, record=record)
                 
             if not record.catalog_deadline_passed and record.state in ['approved', 'ready_for_sale','changed']:
-                if self.env.context.get('from_catalog_change'):
-                    return super().write(vals)
-                    
                 to_remove = _create_change_log(catalog_change=False, vals=vals, record=record)
                 
                 
@@ -3343,8 +2678,11 @@ class ConsignmentContract(models.Model):
                 vals.pop(field, None)
             
             if not vals:
-                return True
-                
+                break
+
+        self._log_changes('catalog.change', change_vals_list)
+        if not vals:
+            return True
         return super().write(vals)
 
     @api.constrains('slide_type')
@@ -0,0 +1,845 @@
+# Copyright © 2026 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from odoo import api, fields, models, Command, _
+from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL, split_every
+from datetime import datetime, timedelta
+from functools import cached_property
+import csv
+import io
+import logging
+import tempfile
+import threading
+
+_logger = logging.getLogger(__name__)
+
+# Contracts loaded, written and evicted from the cache together
+EXPORT_BATCH_SIZE = 500
+# Selections larger than this are exported by the cron instead of the request
+BACKGROUND_THRESHOLD_PARAM = 'liveag_consignment.export_background_threshold'
+DEFAULT_BACKGROUND_THRESHOLD = 1000
+# Stop picking up new exports after this long and let the cron trigger itself again
+CRON_TIME_BUDGET = timedelta(minutes=10)
+# A running export whose worker died is picked up again after this lease; renewed after every batch
+CLAIM_LEASE = timedelta(minutes=15)
+# Claims after which an export that keeps killing its worker is marked failed
+MAX_ATTEMPTS = 3
+
+# Contract fields read by the columns; non-stored ones are computed per batch
+EXPORT_CONTRACT_FIELDS = [
+    'lot_number', 'sale_order', 'state', 'sold_date', 'create_date', 'auction_id',
+    'seller_id', 'head1', 'kind1', 'weight1', 'head2', 'kind2', 'weight2', 'price_back',
+    'asking_price', 'breed_type', 'origin', 'frame_size', 'flesh_type', 'horns',
+    'weight_variance', 'vac_program', 'bangs_vaccinated', 'feeding_program',
+    'full_comments', 'full_vaccination_desc', 'implanted_type', 'implanted_month',
+    'implanted_year', 'nearest_town', 'state_of_nearest_town', 'distance_to_nearest_town',
+    'direction_to_nearest_town', 'nearest_city', 'state_of_nearest_city',
+    'distance_to_nearest_city', 'direction_to_nearest_city', 'current_fob',
+    'delivery_date_start', 'delivery_date_end', 'primary_rep', 'video_link',
+]
+
+STATE_SELECTION = [
+    ('queued', 'Queued'),
+    ('running', 'Running'),
+    ('done', 'Done'),
+    ('failed', 'Failed'),
+]
+
+# Location fields that flag the GFX location as changed
+GFX_LOCATION_FIELDS = [
+    'nearest_town', 'state_of_nearest_town', 'distance_to_nearest_town', 'direction_to_nearest_town',
+    'nearest_city', 'state_of_nearest_city', 'distance_to_nearest_city', 'direction_to_nearest_city',
+]
+GFX_SLIDE_FIELDS = ['slide_type', 'slide_over', 'slide_under', 'slide_both']
+
+
+def _fetch_stored(records, field_names):
+    records.fetch([name for name in field_names if records._fields[name].store])
+
+
+def _is_liveagxchange(contract):
+    return bool(contract.auction_id and contract.auction_id.sale_type.name == 'LiveAgXchange')
+
+
+class ExportRow:
+    """A contract being exported; values used by several columns are computed once."""
+
+    def __init__(self, contract, catalog_changes=None):
+        self.contract = contract
+        # {field_name: catalog.change}, from consignment.contract._get_catalog_change_index
+        self.catalog_changes = catalog_changes or {}
+
+    @cached_property
+    def is_liveagxchange(self):
+        return _is_liveagxchange(self.contract)
+
+    @cached_property
+    def lot_number(self):
+        lot_number = ''
+        if self.contract.lot_number:
+            cleaned = ''.join(char for char in self.contract.lot_number if char.isdigit() or char == '.')
+            if '.' in cleaned:
+                parts = cleaned.split('.')
+                lot_number = f"{parts[0]}.{''.join(parts[1:])}"
+            else:
+                lot_number = cleaned
+        return lot_number
+
+    @cached_property
+    def title(self):
+        contract = self.contract
+        if self.is_liveagxchange:
+            title = f"{contract.head1} {contract.kind1.name} {f'{contract.weight1}#' if contract.weight1 else '' }"
+            if contract.kind2 and contract.weight2:
+                title += f" &{f' {contract.head2}' if contract.head2 else '' } {contract.kind2.name} {f'{contract.weight2}#' if contract.weight2 else ''}"
+            return title
+        return contract._compute_title(contract)
+
+    @cached_property
+    def asking_price(self):
+        asking_price = self.contract.asking_price or ''
+        if asking_price and isinstance(asking_price, (int, float)):
+            asking_price = f"{asking_price:.0f}" if asking_price.is_integer() else f"{asking_price:.2f}"
+        return asking_price
+
+    @cached_property
+    def slide(self):
+        return self.contract.short_slide_description or ''
+
+    @cached_property
+    def sorted_icons(self):
+        return self.contract.program_icon_ids.sorted(key=lambda x: x.priority)
+
+    @cached_property
+    def implanted(self):
+        contract = self.contract
+        implanted = ""
+        if contract.implanted_type:
+            if contract.implanted_month and contract.implanted_year:
+                month_name = datetime.strptime(str(contract.implanted_month), '%m').strftime('%b')
+                implanted = f"{contract.implanted_type.name} - {month_name} {contract.implanted_year}"
+            else:
+                implanted = contract.implanted_type.name
+        return implanted
+
+    @cached_property
+    def approved_changes(self):
+        """Names of the fields with an approved catalog change."""
+        return {field_name for field_name, change in self.catalog_changes.items() if change.state == 'approved'}
+
+    @cached_property
+    def gfx(self):
+        return _gfx_values(self)
+
+
+def _description_html(row, delivery_range):
+    contract = row.contract
+    description_parts = []
+    if contract.seller_id:
+        description_parts.append(f"<strong>Seller: </strong>{contract.seller_id.name}")
+    if contract.origin_full_description:
+        description_parts.append(f"<strong>Origin: </strong>{contract.origin_full_description}")
+    if delivery_range:
+        description_parts.append(f"<strong>Delivery: </strong>{delivery_range}")
+    primary_rep = contract.primary_rep
+    if primary_rep:
+        description_parts.append(f"<strong>Rep: </strong>{primary_rep.rep_name}, {contract.format_phone(primary_rep.phone) if primary_rep.phone else ''}")
+    description_parts.append("")
+    if contract.breed_type:
+        description_parts.append(f"<strong>Breed Type: </strong>{contract.breed_type}")
+    if row.slide:
+        description_parts.append(f"<strong>Slide: </strong>{row.slide}")
+    if row.sorted_icons:
+        icon_html = '<div style="display: flex; gap: 10px; margin-top: 10px;">'
+        for icon in row.sorted_icons:
+            if icon.image_url:
+                icon_html += f'<img src="{icon.image_url}" alt="{icon.name}" style="height: 40px;">'
+        icon_html += '</div>'
+        description_parts.append(icon_html)
+    return "<br>".join(description_parts)
+
+
+def _quoted_delivery(row):
+    # Excel formula, so spreadsheets keep the range as text
+    return f'="{row.contract.delivery_date_range}"' if row.contract.delivery_date_range else ''
+
+
+def _reps_text(row, separator):
+    contract = row.contract
+    reps = ""
+    for i, rep in enumerate(contract.rep_ids):
+        if rep.rep_id.rep_name:
+            reps += f"{rep.rep_id.rep_name}{separator}{contract.format_phone(rep.rep_id.phone)}"
+            if i < len(contract.rep_ids) - 1:
+                reps += ", "
+    return reps
+
+
+def _catalog_reps(row):
+    contract = row.contract
+    return [
+        f"{rep.rep_id.rep_name} - {contract.format_phone(rep.rep_id.phone)}"
+        for rep in contract.rep_ids if rep.rep_id.name
+    ]
+
+
+def _catalog_programs(row):
+    programs = row.contract.program_icon_ids
+    program_names = ""
+    for program in programs:
+        program_names += f"{program.name}"
+        if program.name != programs[-1].name:
+            program_names += ", "
+    return program_names
+
+
+def _catalog_icon(index):
+    def value(row):
+        icon_urls = [icon.image_url for icon in row.sorted_icons[:10]]
+        return icon_urls[index] if index < len(icon_urls) else ''
+    return value
+
+
+def _gfx_values(row):
+    """GFX columns, with approved catalog changes wrapped in **...**."""
+    contract = row.contract
+    changed = row.approved_changes
+    total_changes = 0
+
+    headKind = ""
+    if contract.head1 and contract.kind1 and contract.weight1:
+        head1_changed = 'head1' in changed
+        kind1_changed = 'kind1' in changed
+        weight1_changed = 'weight1' in changed
+        price_back_changed = 'price_back' in changed
+        total_changes += sum([head1_changed, kind1_changed, weight1_changed, price_back_changed])
+
+        head1_str = f"**{contract.head1}**" if head1_changed else str(contract.head1)
+        kind1_str = f"**{contract.kind1.name}**" if kind1_changed else contract.kind1.name
+        weight1_str = f"**{contract.weight1}#**" if weight1_changed else f"{contract.weight1}#"
+        headKind = f"{head1_str} {kind1_str} {weight1_str}"
+
+        if contract.head2 and contract.kind2 and contract.weight2:
+            head2_changed = 'head2' in changed
+            kind2_changed = 'kind2' in changed
+            weight2_changed = 'weight2' in changed
+            total_changes += sum([head2_changed, kind2_changed, weight2_changed])
+
+            head2_str = f"**{contract.head2}**" if head2_changed else str(contract.head2)
+            kind2_str = f"**{contract.kind2.name}**" if kind2_changed else contract.kind2.name
+            weight2_str = f"**{contract.weight2}#**" if weight2_changed else f"{contract.weight2}#"
+            headKind += f"<br>{head2_str} {kind2_str} {weight2_str}"
+
+        if contract.price_back:
+            price_back_str = f"**${contract.price_back} back**" if price_back_changed else f"${contract.price_back} back"
+            headKind += f" - {price_back_str}"
+
+    delivery_changed = 'delivery_date_start' in changed or 'delivery_date_end' in changed
+    if delivery_changed:
+        total_changes += 1
+    delivery_range = contract.format_delivery_date_range(contract.delivery_date_start, contract.delivery_date_end)
+    if delivery_changed:
+        delivery_range = f"**{delivery_range}**"
+
+    location_description = contract.get_short_location_description()
+    location_changed = bool(changed.intersection(GFX_LOCATION_FIELDS))
+    origin_changed = 'origin' in changed
+    slide_description = row.slide
+    slide_changed = bool(changed.intersection(GFX_SLIDE_FIELDS))
+    if slide_changed:
+        slide_description = f"**{contract.short_slide_description}**"
+    breed_type_changed = 'breed_type' in changed
+    total_changes += sum([location_changed, origin_changed, slide_changed, breed_type_changed])
+
+    option_text, option_text_markdown = contract._compute_option_text(contract)
+    return {
+        'head_kind': headKind,
+        'location': f"**{location_description}**" if location_changed else location_description,
+        'delivery': delivery_range,
+        'origin': f"**{contract.origin_full_description}**" if origin_changed else contract.origin_full_description or '',
+        'slide': f"**{slide_description}**" if slide_changed else slide_description,
+        'breed_type': f"**{contract.breed_type}**" if breed_type_changed else contract.breed_type,
+        'notes': option_text_markdown,
+        'changes': option_text,
+        'changed': "2" if total_changes > 1 else "1" if total_changes == 1 else "",
+    }
+
+
+# Column registry: key -> value of the cell for an ExportRow
+EXPORT_COLUMNS = {
+    'contract_code': lambda r: f'CN {r.contract.id:05d}',
+    'contract_id': lambda r: r.contract.id or '',
+    'lot_number': lambda r: r.contract.lot_number or '',
+    'lot_number_clean': lambda r: r.lot_number or '',
+    'sale_order': lambda r: r.contract.sale_order or '',
+    'title': lambda r: r.title,
+    'seller': lambda r: r.contract.seller_id.name or '',
+    'seller_name': lambda r: r.contract.seller_id.seller_name or '',
+    'head1': lambda r: r.contract.head1 or '',
+    'kind1': lambda r: r.contract.kind1.name if r.contract.kind1 else '',
+    'weight1': lambda r: r.contract.weight1 or '',
+    'head2': lambda r: r.contract.head2 or '',
+    'kind2': lambda r: r.contract.kind2.name if r.contract.kind2 else '',
+    'weight2': lambda r: r.contract.weight2 or '',
+    'price_back': lambda r: r.contract.price_back or '',
+    'asking_price': lambda r: r.asking_price,
+    'description': lambda r: _description_html(r, r.contract.delivery_date_range or ''),
+    'description_quoted_delivery': lambda r: _description_html(r, _quoted_delivery(r)),
+    'delivery': lambda r: r.contract.delivery_date_range or '',
+    'delivery_quoted': _quoted_delivery,
+    'delivery_text': lambda r: f"'{r.contract.delivery_date_range}" if r.contract.delivery_date_range else '',
+    'location': lambda r: r.contract.location_description or '',
+    'location_full': lambda r: r.contract.get_location_description() or '',
+    'location_short': lambda r: r.contract.get_short_location_description() or '',
+    'nearest_town': lambda r: r.contract.nearest_town or '',
+    'nearest_town_state': lambda r: r.contract.state_of_nearest_town.code or '',
+    'origin': lambda r: r.contract.origin_full_description or '',
+    'slide': lambda r: r.slide,
+    'breed_type': lambda r: r.contract.breed_type or '',
+    'breed_type_flat': lambda r: (r.contract.breed_type or '').replace('\n', ' ').replace('\r', ' ').strip(),
+    'implanted': lambda r: r.implanted,
+    'weighing_conditions': lambda r: r.contract.weighing_cond_w_freight or '',
+    'comments': lambda r: r.contract.full_comments or '',
+    'vaccinations': lambda r: r.contract.full_vaccination_desc or '',
+    'frame_size': lambda r: r.contract.frame_size.name if r.contract.frame_size else '',
+    'flesh_type': lambda r: r.contract.flesh_type.name if r.contract.flesh_type else '',
+    'horns': lambda r: r.contract.horns.name if r.contract.horns else '',
+    'weight_variance': lambda r: r.contract.weight_variance.name if r.contract.weight_variance else '',
+    'feeding_program': lambda r: r.contract.feeding_program or '',
+    'vac_program': lambda r: r.contract.vac_program.name if r.contract.vac_program else '',
+    'bangs_vaccinated': lambda r: r.contract.bangs_vaccinated.name if r.contract.bangs_vaccinated else '',
+    'option': lambda r: r.contract.option_description or '',
+    'video': lambda r: r.contract.video_link or '',
+    'primary_rep': lambda r: f"{r.contract.primary_rep.rep_name} - {r.contract.format_phone(r.contract.primary_rep.phone) if r.contract.primary_rep.phone else ''}",
+    'reps': lambda r: _reps_text(r, ' '),
+    'reps_dashed': lambda r: _reps_text(r, ' - '),
+    'rep_1': lambda r: (_catalog_reps(r) + [''])[0],
+    'rep_2': lambda r: (_catalog_reps(r)[1:] + [''])[0],
+    'rep_3': lambda r: (_catalog_reps(r)[2:] + [''])[0],
+    'first_rep': lambda r: r.contract.rep_ids[0].rep_id.name if r.contract.rep_ids else '',
+    'programs': _catalog_programs,
+    'icons': lambda r: '|'.join(f'{icon.image_url},{icon.name}' for icon in r.sorted_icons if icon.image_url),
+    'icon_urls': lambda r: ','.join(f'{icon.image_url}' for icon in r.sorted_icons if icon.image_url),
+    'icon_files': lambda r: '|'.join(f'{icon.filename}' for icon in r.sorted_icons if icon.filename),
+    **{f'icon_{index + 1}': _catalog_icon(index) for index in range(10)},
+    'gfx_head_kind': lambda r: r.gfx['head_kind'],
+    'gfx_location': lambda r: r.gfx['location'],
+    'gfx_delivery': lambda r: r.gfx['delivery'],
+    'gfx_origin': lambda r: r.gfx['origin'],
+    'gfx_slide': lambda r: r.gfx['slide'],
+    'gfx_breed_type': lambda r: r.gfx['breed_type'],
+    'gfx_notes': lambda r: r.gfx['notes'],
+    'gfx_changes': lambda r: r.gfx['changes'],
+    'gfx_changed': lambda r: r.gfx['changed'],
+    'xchange_seller_email': lambda r: 'xchange@live-ag.com',
+    'xchange_sale_method': lambda r: 'buynow_makeoffer',
+    'xchange_status': lambda r: 'active',
+}
+
+# Trailing columns of the Auctic files: LiveAgXchange listings or auction lots
+XCHANGE_COLUMNS = [
+    ('Asking Price', 'asking_price'),
+    ('seller_user_email', 'xchange_seller_email'),
+    ('sale method', 'xchange_sale_method'),
+    ('status', 'xchange_status'),
+]
+AUCTION_COLUMNS = [
+    ('Starting Bid Amount', 'asking_price'),
+]
+
+
+def _auctic_sort_key(c):
+    # Sold contracts by sold_date (oldest first), active ones newest first
+    if c.state in ['sold', 'delivered', 'delivery_ready']:
+        sold_date = c.sold_date or c.create_date.date()
+        return (1, sold_date.toordinal(), c.lot_number or '')
+    return (0, -(c.create_date.date()).toordinal(), c.lot_number or '')
+
+
+def _auctic_v2_sort_key(c):
+    if c.state in ['sold', 'delivered', 'delivery_ready']:
+        sold_date = c.sold_date or c.create_date.date()
+        return (1, sold_date.toordinal(), c.lot_number or '')
+    return (0, -(c.sale_order or 0), c.lot_number or '')
+
+
+def _catalog_sort_key(c):
+    return (c.sale_order or float('inf'), c.lot_number or '')
+
+
+# Export formats: (header, column key) lists plus file options.
+# xchange: number LiveAgXchange contracts and add the XCHANGE/AUCTION trailing columns.
+# catalog_change_states: load the catalog change index of each batch for these states.
+# bom: write a BOM on top of utf-8-sig's own, as the catalog tooling has always received.
+EXPORT_FORMATS = {
+    'auctic': {
+        'file_label': 'Auctic',
+        'sort_key': _auctic_sort_key,
+        'xchange': True,
+        'encoding': 'utf-8',
+        'bom': False,
+        'prefetch': ['rep_ids'],
+        'columns': [
+            ('Contract ID', 'contract_code'),
+            ('Lot Number', 'lot_number_clean'),
+            ('Sale Order', 'sale_order'),
+            ('Title', 'title'),
+            ('Description', 'description_quoted_delivery'),
+            ('Seller', 'seller'),
+            ('Price Back', 'price_back'),
+            ('Location', 'location_short'),
+            ('City', 'nearest_town'),
+            ('State', 'nearest_town_state'),
+            ('Delivery', 'delivery_quoted'),
+            ('Origin', 'origin'),
+            ('Slide', 'slide'),
+            ('Reps', 'reps'),
+            ('Breed Type', 'breed_type'),
+            ('Implanted', 'implanted'),
+            ('Weighing Conditions', 'weighing_conditions'),
+            ('Comments', 'comments'),
+            ('Vaccinations', 'vaccinations'),
+            ('Frame Size', 'frame_size'),
+            ('Flesh Type', 'flesh_type'),
+            ('Horns', 'horns'),
+            ('Weight Variance', 'weight_variance'),
+            ('Feeding Program', 'feeding_program'),
+            ('Icons', 'icons'),
+            ('Video', 'video'),
+        ],
+    },
+    'auctic_v2': {
+        'file_label': 'Auctic',
+        'sort_key': _auctic_v2_sort_key,
+        'xchange': True,
+        'encoding': 'utf-8',
+        'bom': False,
+        'prefetch': ['rep_ids', 'option_contract_ids'],
+        'columns': [
+            ('Contract ID', 'contract_id'),
+            ('Lot Number', 'lot_number_clean'),
+            ('Sale Order', 'sale_order'),
+            ('Title', 'title'),
+            ('Seller', 'seller_name'),
+            ('Head1', 'head1'),
+            ('Kind1', 'kind1'),
+            ('Weight1', 'weight1'),
+            ('Head2', 'head2'),
+            ('Kind2', 'kind2'),
+            ('Weight2', 'weight2'),
+            ('Price Back', 'price_back'),
+            ('Description', 'description'),
+            ('Location', 'location'),
+            ('Delivery', 'delivery_text'),
+            ('Slide', 'slide'),
+            ('Rep', 'primary_rep'),
+            ('Origin', 'origin'),
+            ('Breed Type', 'breed_type'),
+            ('Bangs Vacc', 'bangs_vaccinated'),
+            ('Frame Size', 'frame_size'),
+            ('Flesh', 'flesh_type'),
+            ('Wt. Variance', 'weight_variance'),
+            ('Horns', 'horns'),
+            ('Implanted', 'implanted'),
+            ('Feeding Type', 'feeding_program'),
+            ('Weigh Cond.', 'weighing_conditions'),
+            ('Vaccinations', 'vaccinations'),
+            ('Comments', 'comments'),
+            ('Option', 'option'),
+            ('Represented By', 'reps_dashed'),
+            ('City', 'nearest_town'),
+            ('State', 'nearest_town_state'),
+            ('Icons', 'icon_urls'),
+            ('Video', 'video'),
+        ],
+    },
+    'catalog': {
+        'file_label': 'Catalog',
+        'sort_key': _catalog_sort_key,
+        'xchange': False,
+        'encoding': 'utf-8-sig',
+        'bom': True,
+        'prefetch': ['rep_ids', 'option_contract_ids'],
+        'columns': [
+            ('Code', 'lot_number'),
+            ('Contract ID', 'contract_code'),
+            ('Seller', 'seller'),
+            ('Head 1', 'head1'),
+            ('Kind 1', 'kind1'),
+            ('Weight 1', 'weight1'),
+            ('Head 2', 'head2'),
+            ('Kind 2', 'kind2'),
+            ('Weight 2', 'weight2'),
+            ('Price Back', 'price_back'),
+            ('Delivery Date Range', 'delivery'),
+            ('Location Description', 'location_full'),
+            ('Weighing Conditions', 'weighing_conditions'),
+            ('Breed Type', 'breed_type_flat'),
+            ('Short Slide Description', 'slide'),
+            ('Origin', 'origin'),
+            ('Frame Size', 'frame_size'),
+            ('Flesh Type', 'flesh_type'),
+            ('Est Weight Variance', 'weight_variance'),
+            ('Horns', 'horns'),
+            ('Feeding Program', 'feeding_program'),
+            ('VAC Program', 'vac_program'),
+            ('Bangs Vaccinated', 'bangs_vaccinated'),
+            ('Vaccination Description', 'vaccinations'),
+            ('Implanted', 'implanted'),
+            ('Comments', 'comments'),
+            ('Rep 1', 'rep_1'),
+            ('Rep 2', 'rep_2'),
+            ('Rep 3', 'rep_3'),
+            ('Programs', 'programs'),
+            *[(f'Icon {index}', f'icon_{index}') for index in range(1, 11)],
+            ('Option Lot', 'option'),
+        ],
+    },
+    'gfx': {
+        'file_label': 'GFX',
+        'sort_key': _catalog_sort_key,
+        'xchange': False,
+        'encoding': 'utf-8-sig',
+        'bom': True,
+        'prefetch': ['rep_ids', 'option_contract_ids'],
+        'catalog_change_states': ('approved',),
+        'columns': [
+            ('Lot', 'lot_number'),
+            ('Consignor', 'seller'),
+            ('HeadKind', 'gfx_head_kind'),
+            ('Location', 'gfx_location'),
+            ('Delivery', 'gfx_delivery'),
+            ('Origin', 'gfx_origin'),
+            ('Slide', 'gfx_slide'),
+            ('Rep', 'first_rep'),
+            ('BreedType', 'gfx_breed_type'),
+            ('Notes', 'gfx_notes'),
+            ('Changes', 'gfx_changes'),
+            ('IconFiles', 'icon_files'),
+            ('gfxChanged', 'gfx_changed'),
+        ],
+    },
+}
+
+EXPORT_FORMAT_SELECTION = [
+    ('auctic', 'Auctic'),
+    ('auctic_v2', 'Auctic v2'),
+    ('catalog', 'Catalog'),
+    ('gfx', 'GFX'),
+]
+
+
+class ConsignmentContractExport(models.Model):
+    _name = 'consignment.contract.export'
+    _description = 'Consignment Contract Export'
+    _order = 'create_date desc'
+
+    # ============================== FIELDS ==================================
+    name = fields.Char(
+        string='File Name',
+        required=True,
+        readonly=True,
+    )
+    export_format = fields.Selection(
+        selection=EXPORT_FORMAT_SELECTION,
+        string='Format',
+        required=True,
+        readonly=True,
+    )
+    state = fields.Selection(
+        selection=STATE_SELECTION,
+        string='State',
+        required=True,
+        default='queued',
+        index=True,
+        readonly=True,
+        copy=False,
+    )
+    contract_ids = fields.Many2many(
+        comodel_name='consignment.contract',
+        string='Contracts',
+        readonly=True,
+    )
+    total_count = fields.Integer(
+        string='Contracts',
+        readonly=True,
+    )
+    processed_count = fields.Integer(
+        string='Exported',
+        readonly=True,
+        copy=False,
+    )
+    attempt_count = fields.Integer(
+        string='Attempts',
+        readonly=True,
+        copy=False,
+    )
+    lease_expires_at = fields.Datetime(
+        string='Lease Expires At',
+        readonly=True,
+        copy=False,
+        help='When a running export is considered abandoned and picked up again.',
+    )
+    progress = fields.Float(
+        string='Progress',
+        compute='_compute_progress',
+    )
+    attachment_id = fields.Many2one(
+        comodel_name='ir.attachment',
+        string='File',
+        readonly=True,
+        copy=False,
+        ondelete='set null',
+    )
+    error_message = fields.Text(
+        string='Error Message',
+        readonly=True,
+        copy=False,
+    )
+    requested_by_id = fields.Many2one(
+        comodel_name='res.users',
+        string='Requested By',
+        readonly=True,
+        default=lambda self: self.env.user,
+        help='User the export runs as.',
+    )
+
+    @api.depends('processed_count', 'total_count')
+    def _compute_progress(self):
+        for export in self:
+            export.progress = 100.0 * export.processed_count / export.total_count if export.total_count else 0.0
+
+    # ============================== ENGINE ==================================
+    @api.model
+    def _get_filename(self, contracts, export_format):
+        """File name from the sale type of the first selected contract's auction."""
+        label = EXPORT_FORMATS[export_format]['file_label']
+        auction = contracts[0].auction_id
+        timestamp = fields.Datetime.now().strftime('%b-%d-%y_%H:%M')
+        if auction and auction.sale_type.name == 'Video Sale':
+            date_str = auction.sale_date_begin.strftime('%B %d')
+            return f'LAVA_{label}_{date_str}.csv'
+        if auction and auction.sale_type.name == 'Private Treaty':
+            return f'PT_{label}_{timestamp}.csv'
+        if auction and auction.sale_type.name == 'LiveAgXchange':
+            return f'LAX_{label}_{timestamp}.csv'
+        return f'{label}_Contracts_{timestamp}.csv'
+
+    @api.model
+    def _write_rows(self, contracts, export_format, stream, on_batch=None):
+        """
+        Write the CSV of contracts in export_format to the text stream.
+
+        Contracts are sorted on a few columns first, then read, written and
+        evicted from the cache EXPORT_BATCH_SIZE at a time, so memory stays flat
+        for large catalogs. on_batch(count) is called after each batch with the
+        number of contracts written so far.
+        """
+        spec = EXPORT_FORMATS[export_format]
+        contracts.fetch(['state', 'sold_date', 'create_date', 'lot_number', 'sale_order', 'auction_id'])
+        contracts = contracts.sorted(key=spec['sort_key'])
+        columns = spec['columns']
+        tail_columns = []
+        if spec['xchange']:
+            xchange_contracts = contracts.filtered(_is_liveagxchange)
+            for number, contract in enumerate(xchange_contracts, 1):
+                contract.sale_order = number
+            xchange_contracts.flush_recordset(['sale_order'])
+            tail_columns = XCHANGE_COLUMNS if xchange_contracts else AUCTION_COLUMNS
+
+        if spec['bom']:
+            stream.write('\ufeff')
+        writer = csv.writer(stream)
+        writer.writerow([header for header, _key in columns + tail_columns])
+        count = 0
+        for ids in split_every(EXPORT_BATCH_SIZE, contracts.ids):
+            batch = contracts.browse(ids)
+            _fetch_stored(batch, EXPORT_CONTRACT_FIELDS)
+            for relation in spec['prefetch']:
+                batch.mapped(relation)
+            _fetch_stored(batch.rep_ids.rep_id, ['name', 'phone', 'rep_name'])
+            catalog_changes = {}
+            if spec.get('catalog_change_states'):
+                catalog_changes = batch._get_catalog_change_index(spec['catalog_change_states'])
+            for contract in batch:
+                row = ExportRow(contract, catalog_changes.get(contract.id))
+                cells = [EXPORT_COLUMNS[key](row) for _header, key in columns]
+                if spec['xchange']:
+                    trailing = XCHANGE_COLUMNS if row.is_liveagxchange else AUCTION_COLUMNS
+                    cells += [EXPORT_COLUMNS[key](row) for _header, key in trailing]
+                writer.writerow(cells)
+            count += len(ids)
+            self.env.invalidate_all()
+            if on_batch:
+                on_batch(count)
+
+    @api.model
+    def _render_csv(self, contracts, export_format, on_batch=None):
+        """CSV bytes of contracts in export_format, spooled through a temporary file."""
+        spec = EXPORT_FORMATS[export_format]
+        with tempfile.TemporaryFile() as raw:
+            stream = io.TextIOWrapper(raw, encoding=spec['encoding'], newline='')
+            self._write_rows(contracts, export_format, stream, on_batch=on_batch)
+            stream.flush()
+            stream.detach()
+            raw.seek(0)
+            return raw.read()
+
+    @api.model
+    def _export(self, contracts, export_format):
+        """
+        Export contracts and return the action for the result: a download for
+        small selections, the export job form for selections above the
+        liveag_consignment.export_background_threshold parameter, which are
+        written by the export cron.
+        """
+        if not contracts:
+            raise ValidationError(_("Please select at least one contract to export."))
+        filename = self._get_filename(contracts, export_format)
+        value = self.env['ir.config_parameter'].sudo().get_param(BACKGROUND_THRESHOLD_PARAM)
+        threshold = int(value) if value and value.isdigit() else DEFAULT_BACKGROUND_THRESHOLD
+        testing = getattr(threading.current_thread(), 'testing', False)
+        if len(contracts) <= threshold or testing:
+            attachment = self.env['ir.attachment'].create({
+                'name': filename,
+                'raw': self._render_csv(contracts, export_format),
+                'type': 'binary',
+            })
+            return _download_action(attachment)
+
+        export = self.create({
+            'name': filename,
+            'export_format': export_format,
+            'contract_ids': [Command.set(contracts.ids)],
+            'total_count': len(contracts),
+        })
+        self.env.ref('liveag_consignment.ir_cron_contract_export_queue')._trigger()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Contract Export'),
+            'res_model': self._name,
+            'res_id': export.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    # ============================== ACTIONS =================================
+    def action_download(self):
+        self.ensure_one()
+        if not self.attachment_id:
+            raise UserError(_('The export file is not ready yet.'))
+        return _download_action(self.attachment_id)
+
+    def action_retry(self):
+        # Users cannot write jobs; requeue the ones they are allowed to see
+        self.check_access('read')
+        self.sudo().filtered(lambda e: e.state == 'failed').write({
+            'state': 'queued',
+            'processed_count': 0,
+            'attempt_count': 0,
+            'error_message': False,
+        })
+        self.env.ref('liveag_consignment.ir_cron_contract_export_queue')._trigger()
+        return True
+
+    # ============================== QUEUE ===================================
+    @api.model
+    def _claim_export(self):
+        """
+        Mark the oldest queued export as running and return it; SKIP LOCKED keeps
+        concurrent crons apart. Running exports whose lease expired (their worker
+        died) are claimed again, until MAX_ATTEMPTS claims have been made: those
+        are marked failed instead.
+        """
+        now = fields.Datetime.now()
+        self.env.cr.execute(SQL(
+            """
+            UPDATE consignment_contract_export
+               SET state = 'failed', lease_expires_at = NULL,
+                   error_message = %(message)s
+             WHERE state = 'running' AND lease_expires_at <= %(now)s
+               AND COALESCE(attempt_count, 0) >= %(max_attempts)s
+            """,
+            now=now, max_attempts=MAX_ATTEMPTS,
+            message=_('The export was interrupted %s times and has been stopped.') % MAX_ATTEMPTS,
+        ))
+        self.env.cr.execute(SQL(
+            """
+            UPDATE consignment_contract_export
+               SET state = 'running', processed_count = 0,
+                   attempt_count = COALESCE(attempt_count, 0) + 1,
+                   lease_expires_at = %(lease)s
+             WHERE id = (
+                SELECT id FROM consignment_contract_export
+                 WHERE state = 'queued'
+                    OR (state = 'running' AND lease_expires_at <= %(now)s)
+                 ORDER BY id
+                 LIMIT 1
+                   FOR UPDATE SKIP LOCKED
+             )
+            RETURNING id
+            """,
+            now=now, lease=now + CLAIM_LEASE,
+        ))
+        row = self.env.cr.fetchone()
+        export = self.browse(row[0] if row else [])
+        self.invalidate_model(['state', 'processed_count', 'attempt_count', 'lease_expires_at', 'error_message'])
+        return export
+
+    def _run(self):
+        """Write the file of a claimed export, committing progress after every batch."""
+        self.ensure_one()
+        testing = getattr(threading.current_thread(), 'testing', False)
+
+        def on_batch(count):
+            self.write({'processed_count': count, 'lease_expires_at': fields.Datetime.now() + CLAIM_LEASE})
+            if not testing:
+                self.env.cr.commit()
+
+        try:
+            contracts = self.contract_ids.with_user(self.requested_by_id or self.env.user)
+            data = self._render_csv(contracts, self.export_format, on_batch=on_batch)
+        except Exception as e:
+            _logger.exception('Contract export %s failed', self.id)
+            if not testing:
+                self.env.cr.rollback()
+            self.write({'state': 'failed', 'error_message': str(e)[:2000], 'lease_expires_at': False})
+            return
+        attachment = self.env['ir.attachment'].create({
+            'name': self.name,
+            'raw': data,
+            'type': 'binary',
+            'res_model': self._name,
+            'res_id': self.id,
+        })
+        self.write({
+            'state': 'done',
+            'attachment_id': attachment.id,
+            'processed_count': self.total_count,
+            'lease_expires_at': False,
+        })
+
+    @api.model
+    def _cron_process_exports(self):
+        """Run queued exports one after another until none is left or the time budget is spent."""
+        testing = getattr(threading.current_thread(), 'testing', False)
+        deadline = fields.Datetime.now() + CRON_TIME_BUDGET
+        while fields.Datetime.now() < deadline:
+            export = self._claim_export()
+            if not export:
+                return
+            if not testing:
+                self.env.cr.commit()
+            export._run()
+            if not testing:
+                self.env.cr.commit()
+        self.env.ref('liveag_consignment.ir_cron_contract_export_queue')._trigger()
+
+
+def _download_action(attachment):
+    return {
+        'type': 'ir.actions.act_url',
+        'url': f'/web/content/{attachment.id}?download=true',
+        'target': 'self',
+    }
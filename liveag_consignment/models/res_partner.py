@@ -284,6 +284,38 @@ class ResPartner(models.Model):
 
     # --- Computes ------------------------------------------------------------
 
+    def _rep_stat_domain(self, partner, kind, date_from=None):
+        """Domain on res.rep for the sold/delivered statistics of partner and its rep hierarchy.
+
+        Sold heads count on contracts in a sold state (by sold date), delivered heads on
+        delivered deliveries (by delivery date). Both read the stored columns of res.rep.
+        """
+        domain = [('rep_id', 'child_of', partner.id)]
+        if kind == 'sold':
+            domain += [
+                ('contract_id', '!=', False),
+                ('contract_state', 'in', SOLD_STATES),
+            ]
+            if date_from:
+                domain.append(('sold_date', '>=', date_from))
+        else:
+            domain += [
+                ('delivery_id', '!=', False),
+                ('delivery_state', '=', 'delivered'),
+            ]
+            if date_from:
+                domain.append(('delivery_date', '>=', date_from))
+        return domain
+
+    def _rep_head_total(self, partner, kind, date_from=None):
+        if not partner or not isinstance(partner.id, int):
+            return 0.0
+        field_name = 'rep_sold_head_count' if kind == 'sold' else 'rep_delivered_head_count'
+        [(total,)] = self.env['res.rep']._read_group(
+            self._rep_stat_domain(partner, kind, date_from), aggregates=[f'{field_name}:sum'],
+        )
+        return total or 0.0
+
     def _get_sale_type_ytd_groups(self, partner):
         first_day_of_year = fields.Date.today().replace(month=1, day=1)
         groups = defaultdict(lambda: {'sold': 0.0, 'delivered': 0.0})
@@ -291,26 +323,16 @@ class ResPartner(models.Model):
         if not partner or not isinstance(partner.id, int):
             return groups
 
-        partner_ids = self.env['res.partner'].search([('id', 'child_of', partner.id)]).ids
-
-        ytd_contracts = self._contracts_for_totals(partner, date_from=first_day_of_year)
-        for contract in ytd_contracts:
-            sale_type_name = contract.sale_type.display_name if getattr(contract, 'sale_type', False) else 'No Type'
-            reps = contract.rep_ids.filtered(lambda r: r.active and r.rep_id.id in partner_ids)
-            if not reps:
-                continue
-            groups[sale_type_name]['sold'] += sum(reps.mapped('rep_sold_head_count'))
-
-        delivered_reps = self.env['res.rep'].search([
-            ('active', '=', True),
-            '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-            ('delivery_id', '!=', False),
-            ('delivery_id.state', '=', 'delivered'),
-            ('delivery_id.delivery_date', '>=', first_day_of_year),
-        ])
-        for rep in delivered_reps:
-            sale_type_name = rep.contract_id.sale_type.display_name if getattr(rep.contract_id, 'sale_type', False) else 'No Type'
-            groups[sale_type_name]['delivered'] += rep.rep_delivered_head_count
+        Rep = self.env['res.rep']
+        for kind, field_name in (('sold', 'rep_sold_head_count'), ('delivered', 'rep_delivered_head_count')):
+            rows = Rep._read_group(
+                self._rep_stat_domain(partner, kind, first_day_of_year),
+                groupby=['sale_type_id'],
+                aggregates=[f'{field_name}:sum'],
+            )
+            for sale_type, total in rows:
+                sale_type_name = sale_type.display_name if sale_type else 'No Type'
+                groups[sale_type_name][kind] += total or 0.0
 
         return groups
 
@@ -378,23 +400,15 @@ class ResPartner(models.Model):
         self.ensure_one()
         if not partner or not isinstance(partner.id, int):
             return self.env['consignment.contract']
-        rep_records = self.env['res.rep'].search([
-            '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-            ('contract_id', '!=', False),
-            ('active', '=', True),
-        ])
-        contracts = rep_records.mapped('contract_id')
-        if not contracts:
-            return self.env['consignment.contract']
-
-        contracts = contracts.filtered(lambda c: (c.state or '') in ['sold', 'delivery_ready', 'delivered'])
-
+        domain = [
+            ('rep_ids', 'any', [('rep_id', 'child_of', partner.id)]),
+            ('state', 'in', SOLD_STATES),
+        ]
         if date_from:
-            contracts = contracts.filtered(lambda c: c.sold_date and c.sold_date >= date_from)
+            domain.append(('sold_date', '>=', date_from))
         if date_to:
-            contracts = contracts.filtered(lambda c: c.sold_date and c.sold_date <= date_to)
-
-        return contracts
+            domain.append(('sold_date', '<=', date_to))
+        return self.env['consignment.contract'].search(domain)
 
     def get_upcoming_deliveries_json(self):
         """Return upcoming deliveries for this partner as JSON data."""
@@ -423,63 +437,23 @@ class ResPartner(models.Model):
     def get_ytd_head_sold(self):
         first_day_of_year = fields.Date.today().replace(month=1, day=1)
         for partner in self:
-            if not isinstance(partner.id, int):
-                partner.ytd_head_sold = 0.0
-                continue
-            rep_records = self.env['res.rep'].search([
-                '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-                ('contract_id', '!=', False),
-                ('contract_id.state', 'in', ['sold', 'delivery_ready', 'delivered']),
-            ])
-            if first_day_of_year:
-                rep_records = rep_records.filtered(
-                    lambda r: r.contract_id.sold_date 
-                    and r.contract_id.sold_date >= first_day_of_year
-                )
-            partner.ytd_head_sold = sum(rep_records.mapped('rep_sold_head_count'))
+            partner.ytd_head_sold = self._rep_head_total(partner, 'sold', first_day_of_year)
 
     @api.depends('deliveries_as_rep')
     def get_ytd_head_delivered(self):
         first_day_of_year = fields.Date.today().replace(month=1, day=1)
         for partner in self:
-            if not isinstance(partner.id, int):
-                partner.ytd_head_delivered = 0.0
-                continue
-            rep_records = self.env['res.rep'].search([
-                '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-                ('delivery_id', '!=', False),
-                ('delivery_id.state', '=', 'delivered'),
-            ])
-            if first_day_of_year:
-                rep_records = rep_records.filtered(
-                    lambda r: r.delivery_id.delivery_date 
-                    and r.delivery_id.delivery_date >= first_day_of_year
-                )
-            partner.ytd_head_delivered = sum(rep_records.mapped('rep_delivered_head_count'))
+            partner.ytd_head_delivered = self._rep_head_total(partner, 'delivered', first_day_of_year)
 
     @api.depends('contracts_as_rep')  
     def get_ltd_head_sold(self):
         for partner in self:
-            if not isinstance(partner.id, int):
-                partner.ltd_head_sold = 0.0
-                continue
-            rep_records = self.env['res.rep'].search([
-                '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-                ('contract_id', '!=', False),
-                ('contract_id.state', 'in', ['sold', 'delivery_ready', 'delivered']),
-            ])
-            
-            partner.ltd_head_sold = sum(rep_records.mapped('rep_sold_head_count'))
+            partner.ltd_head_sold = self._rep_head_total(partner, 'sold')
 
     @api.depends('deliveries_as_rep')
     def get_ltd_head_delivered(self):
         for partner in self:
-            rep_records = self.env['res.rep'].search([
-                '|', ('rep_id', '=', partner.id), ('rep_id', 'child_of', partner.id),
-                ('delivery_id', '!=', False),
-                ('delivery_id.state', '=', 'delivered'),
-            ])
-            partner.ltd_head_delivered = sum(rep_records.mapped('rep_delivered_head_count'))
+            partner.ltd_head_delivered = self._rep_head_total(partner, 'delivered')
 
 
     @api.depends('name', 'parent_name', 'buyer_name_display_preference')
@@ -17,7 +17,7 @@ class RepCommision(models.Model):
     
     rep_id = fields.Many2one(
         comodel_name='res.partner',
-        string="Rep.", required=True)
+        string="Rep.", required=True, index=True)
     
     percentage_commission = fields.Float('% Commission')
     
@@ -32,35 +32,83 @@ class RepCommision(models.Model):
         comodel_name='consignment.delivery',
         string='Delivery',
         related='contract_id.delivery_id',
+        store=True,
+        index=True,
+    )
+
+    # Stored copies of the contract/delivery columns the rep statistics are
+    # grouped and filtered on (see res.partner YTD/LTD computes)
+    contract_state = fields.Selection(
+        related='contract_id.state',
+        string='Contract Status',
+        store=True,
+    )
+
+    sold_date = fields.Date(
+        related='contract_id.sold_date',
+        string='Date Sold',
+        store=True,
+    )
+
+    sale_type_id = fields.Many2one(
+        related='contract_id.sale_type',
+        string='Sale Type',
+        store=True,
+    )
+
+    delivery_state = fields.Selection(
+        related='delivery_id.state',
+        string='Delivery Status',
+        store=True,
+    )
+
+    delivery_date = fields.Date(
+        related='delivery_id.delivery_date',
+        string='Delivery Date',
+        store=True,
     )
 
     rep_sold_head_count = fields.Float(
         string='Sold Head Count',
         compute='_compute_rep_head_count',
-        store=False,
+        store=True,
         help='Calculated head count for this rep based on commission percentage and contract head count'
     )
 
     rep_delivered_head_count = fields.Float(
         string='Delivered Head Count',
-        compute='_compute_rep_head_count',
-        store=False,
+        compute='_compute_rep_delivered_head_count',
+        store=True,
         help='Calculated head count for this rep based on commission percentage and delivery head count'
     )
 
     active = fields.Boolean('active',default=True)
     
-    @api.depends('percentage_commission', 'delivery_id.head_count', 'contract_id.head1', 'contract_id.head2')
+    @api.depends(
+        'active', 'percentage_commission', 'consigning_rep',
+        'contract_id.head1', 'contract_id.head2',
+        'contract_id.rep_ids.active',
+        'contract_id.rep_ids.percentage_commission',
+        'contract_id.rep_ids.consigning_rep',
+    )
     def _compute_rep_head_count(self):
-        """Calculate the head count for this rep based on commission percentage"""
+        """Calculate the sold head count for this rep based on commission percentage"""
         for record in self:
-            # Handle sold head count (contract)
             if record.contract_id:
                 record.rep_sold_head_count = self._distribute_head_count_for_contract(record.contract_id, record)
             else:
                 record.rep_sold_head_count = 0.0
-                
-            # Handle delivered head count (delivery)
+
+    @api.depends(
+        'active', 'percentage_commission', 'consigning_rep',
+        'delivery_id.head_count',
+        'delivery_id.contract_ids.rep_ids.active',
+        'delivery_id.contract_ids.rep_ids.percentage_commission',
+        'delivery_id.contract_ids.rep_ids.consigning_rep',
+    )
+    def _compute_rep_delivered_head_count(self):
+        """Calculate the delivered head count for this rep based on commission percentage"""
+        for record in self:
             if record.delivery_id:
                 record.rep_delivered_head_count = self._distribute_head_count_for_delivery(record.delivery_id, record)
             else:
@@ -71,8 +119,8 @@ class RepCommision(models.Model):
         if not contract or not current_rep.percentage_commission:
             return 0.0
             
-        # Get all reps for this contract
-        all_reps = self.search([('contract_id', '=', contract.id), ('active', '=', True)])
+        # Get all reps for this contract (from cache, also works on unsaved contracts)
+        all_reps = contract.rep_ids.filtered('active')
         total_heads = (contract.head1 or 0) + (contract.head2 or 0)
         
         return self._calculate_distributed_head_count(all_reps, current_rep, total_heads)
@@ -83,35 +131,52 @@ class RepCommision(models.Model):
             return 0.0
             
         # Get all reps for this delivery (through contract)
-        all_reps = self.search([('delivery_id', '=', delivery.id), ('active', '=', True)])
+        all_reps = delivery.contract_ids.rep_ids.filtered('active')
         total_heads = delivery.head_count or 0
         
         return self._calculate_distributed_head_count(all_reps, current_rep, total_heads)
 
     def _calculate_distributed_head_count(self, all_reps, current_rep, total_heads):
         """Calculate distributed head count ensuring whole numbers and consigning rep gets remainder"""
-        if not total_heads or not all_reps:
-            return 0.0
+        lines = [
+            {
+                'id': rep.id,
+                'percentage_commission': rep.percentage_commission,
+                'consigning_rep': rep.consigning_rep,
+            }
+            for rep in all_reps
+        ]
+        return self._distribute_head_counts(lines, total_heads).get(current_rep.id, 0.0)
+
+    @api.model
+    def _distribute_head_counts(self, lines, total_heads):
+        """
+        Split total_heads over rep lines in whole numbers, the consigning rep gets the remainder.
+
+        lines are dicts with id, percentage_commission and consigning_rep (as returned by
+        search_read), so callers can distribute many contracts without loading records.
+        Returns {line_id: head_count}.
+        """
+        if not total_heads or not lines:
+            return {}
             
         # Calculate raw distributions
         distributions = []
-        total_percentage = 0
         consigning_rep = None
         
-        for rep in all_reps:
-            if rep.percentage_commission:
-                raw_count = (rep.percentage_commission / 100.0) * total_heads
+        for line in lines:
+            if line['percentage_commission']:
+                raw_count = (line['percentage_commission'] / 100.0) * total_heads
                 distributions.append({
-                    'rep': rep,
+                    'rep': line['id'],
                     'raw_count': raw_count,
                     'floor_count': int(raw_count)
                 })
-                total_percentage += rep.percentage_commission
-                if rep.consigning_rep:
-                    consigning_rep = rep
+                if line['consigning_rep']:
+                    consigning_rep = line['id']
         
         if not distributions:
-            return 0.0
+            return {}
             
         # Calculate floor sum and remainder
         floor_sum = sum(d['floor_count'] for d in distributions)
@@ -129,17 +194,15 @@ class RepCommision(models.Model):
         # Distribute the remainder
         final_distributions = {}
         for d in distributions:
-            rep = d['rep']
             final_count = d['floor_count']
             
             # Give remainder to consigning rep
-            if rep == consigning_rep and remainder > 0:
+            if d['rep'] == consigning_rep and remainder > 0:
                 final_count += remainder
                 
-            final_distributions[rep.id] = final_count
+            final_distributions[d['rep']] = final_count
         
-        # Return the count for the current rep
-        return final_distributions.get(current_rep.id, 0.0)
+        return final_distributions
 
     @api.constrains('consigning_rep', 'contract_id')
     def _check_consigning_rep(self):
@@ -4,7 +4,14 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 from odoo.exceptions import UserError
-import logging
+
+# Contract fields read by the final report builders, loaded in one query
+FINAL_REPORT_CONTRACT_FIELDS = [
+    'lot_number', 'sold_date', 'state', 'buyer_id', 'buyer_number', 'seller_id', 'lien_holder_id',
+    'head1', 'head2', 'kind1', 'kind2', 'weight1', 'weight2', 'sold_price', 'price_back',
+    'state_of_nearest_town', 'delivery_date_range', 'delivery_date_start', 'delivery_date_end',
+    'buyer_part_payment', 'seller_part_payment',
+]
 
 AUCTION_STATE = [
     ('pending', "Pending"),
@@ -46,6 +53,15 @@ class SaleAuction(models.Model):
     percentage_scratched = fields.Float(string="Scratched", compute="_compute_percentages", store=False)
     percentage_no_sale = fields.Float(string="No Sale", compute="_compute_percentages", store=False)
 
+    report_email_count = fields.Integer(string="Report Emails", compute="_compute_report_email_progress")
+    report_email_sent_count = fields.Integer(string="Report Emails Sent", compute="_compute_report_email_progress")
+    report_email_pending_count = fields.Integer(string="Report Emails Pending", compute="_compute_report_email_progress")
+    report_email_failed_count = fields.Integer(string="Report Emails Failed", compute="_compute_report_email_progress")
+    report_email_progress = fields.Float(
+        string="Report Email Progress",
+        compute="_compute_report_email_progress",
+        help="Share of queued report emails that have been processed (sent, failed or without email).")
+
     sale_type = fields.Many2one(
         comodel_name='sale.type',
         string="Sale Type")
@@ -135,6 +151,23 @@ class SaleAuction(models.Model):
             for contract in valid_contracts:
                 auction.head_offered += (contract.head1 or 0) + (contract.head2 or 0)
 
+    def _compute_report_email_progress(self):
+        counts = {
+            (auction.id, state): count
+            for auction, state, count in self.env['auction.report.email']._read_group(
+                [('auction_id', 'in', self.ids)], ['auction_id', 'state'], ['__count'])
+        }
+        for auction in self:
+            by_state = {state: counts.get((auction.id, state), 0)
+                        for state in ('draft', 'queued', 'sending', 'sent', 'failed', 'no_email')}
+            pending = by_state['queued'] + by_state['sending']
+            done = by_state['sent'] + by_state['failed'] + by_state['no_email']
+            auction.report_email_count = sum(by_state.values())
+            auction.report_email_sent_count = by_state['sent']
+            auction.report_email_pending_count = pending
+            auction.report_email_failed_count = by_state['failed']
+            auction.report_email_progress = (done / (done + pending)) * 100 if done + pending else 0
+
     @api.depends('contracts_ids', 'contracts_ids.state', 'contracts_ids.head1', 'contracts_ids.head2')
     def _compute_head_sold(self):
         for auction in self:
@@ -150,179 +183,161 @@ class SaleAuction(models.Model):
         if self.filtered_contracts_ids:
             return self.filtered_contracts_ids.action_export_auctic_csv()
         
-    def _get_buyers_final_data(self, buyer_id=None):
-        """Organize sold contracts by buyer for the buyer's final report."""
+    # ============================== FINAL REPORT DATA ==============================
+    def _get_report_date_bounds(self):
+        """Optional (date_from, date_to) sale date filter of the report context."""
+        return (
+            fields.Date.to_date(self.env.context.get('date_from')) if self.env.context.get('date_from') else None,
+            fields.Date.to_date(self.env.context.get('date_to')) if self.env.context.get('date_to') else None,
+        )
+
+    def _get_final_report_index(self, date_from=None, date_to=None):
+        """
+        Group the sold contracts of the auction for the final reports in one pass.
+
+        Loads every sold contract, its addenda and its reps up front, then walks
+        the contracts once and returns a dict with:
+        - contracts: the sold contracts within the optional sale date bounds
+        - buyers: {buyer: {buyer_number: [contract, ...]}}
+        - sellers: {seller: {lien_holder: [(contract, seller_vals), ...]}}, where
+          a contract with addenda contributes one entry per addendum
+        - reps: {rep partner: [contract, ...]} for active reps
+        Contract lists are in lot order. Shared by the final report builders,
+        the print wizards and the report email senders.
+        """
         self.ensure_one()
-        date_from = self.env.context.get('date_from')
-        date_to = self.env.context.get('date_to')
-        # Get all sold contracts, filtered by buyer if specified
-        sold_contracts = self.sold_contracts_ids
-        if buyer_id:
-            sold_contracts = sold_contracts.filtered(lambda c: c.buyer_id.id == buyer_id)
-        
-        # Filter by date if specified
+        contracts = self.sold_contracts_ids
+        Contract = self.env['consignment.contract']
+        contracts.fetch([name for name in FINAL_REPORT_CONTRACT_FIELDS if Contract._fields[name].store])
+        contracts.addendum_ids.fetch(['seller_id', 'lien_holder_id', 'head_count', 'part_payment'])
+        contracts.rep_ids.fetch(['rep_id'])
         if date_from:
-            # Convert string date to datetime.date if it's a string
-            if isinstance(date_from, str):
-                date_from = fields.Date.from_string(date_from)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date >= date_from)
-
+            contracts = contracts.filtered(lambda c: c.sold_date and c.sold_date >= date_from)
         if date_to:
-            if isinstance(date_to, str):
-                date_to = fields.Date.from_string(date_to)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date <= date_to)
+            contracts = contracts.filtered(lambda c: c.sold_date and c.sold_date <= date_to)
+
+        buyers = {}
+        sellers = {}
+        reps = {}
+        # Reps are listed in sale order of their first contract
+        for contract in contracts:
+            for rep_line in contract.rep_ids:
+                reps.setdefault(rep_line.rep_id, [])
+
+        for contract in contracts.sorted(lambda c: (c.buyer_id.name or '', c.lot_number or 0)):
+            if contract.buyer_id and contract.buyer_number:
+                buyers.setdefault(contract.buyer_id, {}).setdefault(contract.buyer_number, []).append(contract)
+
+        for contract in contracts.sorted(lambda c: c.lot_number or 0):
+            for seller_vals in self._get_contract_seller_entries(contract):
+                sellers.setdefault(seller_vals['seller_id'], {}).setdefault(
+                    seller_vals['lien_holder_id'], []).append((contract, seller_vals))
+            for rep_partner in contract.rep_ids.rep_id:
+                reps[rep_partner].append(contract)
+
+        return {'contracts': contracts, 'buyers': buyers, 'sellers': sellers, 'reps': reps}
+
+    def _get_contract_seller_entries(self, contract):
+        """Seller lines of a contract: one per addendum, or the contract's own seller."""
+        if contract.addendum_ids:
+            return [{
+                'seller_id': addendum.seller_id,
+                'lien_holder_id': addendum.lien_holder_id,
+                'head1': int(addendum.head_count) if addendum.head_count else 0,
+                'head2': 0,
+                'part_payment': float(addendum.part_payment or 0.0)
+            } for addendum in contract.addendum_ids]
+        return [{
+            'seller_id': contract.seller_id,
+            'lien_holder_id': contract.lien_holder_id,
+            'head1': int(contract.head1) if contract.head1 else 0,
+            'head2': int(contract.head2) if contract.head2 else 0,
+            'part_payment': float(contract.seller_part_payment or 0.0)
+        }]
 
-        sold_contracts = sold_contracts.sorted(lambda c: (c.buyer_id.name or '', c.lot_number or 0))
-        
+    def _get_final_contract_data(self, contract, head1, head2, part_payment):
+        """Lot line of the buyer and seller final reports."""
+        return {
+            'lot_number': str(contract.lot_number or ''),
+            'state': contract.state_of_nearest_town.code,
+            'head1': head1,
+            'kind1': str(contract.kind1.name if contract.kind1 else ''),
+            'weight1': float(contract.weight1 or 0.0),
+            'price1': float(contract.sold_price or 0.0),
+            'head2': head2,
+            'kind2': str(contract.kind2.name if contract.kind2 else ''),
+            'weight2': float(contract.weight2 or 0.0),
+            'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
+            'delivery_date_range': contract.delivery_date_range or '',
+            'delivery_date_start': contract.delivery_date_start,
+            'delivery_date_end': contract.delivery_date_end,
+            'part_payment': part_payment
+        }
+
+    def _get_rep_contract_data(self, contract, state_labels):
+        """Lot line of the rep recap."""
+        return {
+            'lot_number': contract.lot_number,
+            'seller': contract.seller_id.name,
+            'state': state_labels.get(contract.state),
+            'buyer': contract.buyer_id.name,
+            'head1': contract.head1 or 0,
+            'price': contract.sold_price,
+            'head2': contract.head2 or 0,
+            'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
+            'delivery_date_range': contract.delivery_date_range,
+            'delivery_date_start': contract.delivery_date_start,
+            'delivery_date_end': contract.delivery_date_end,
+        }
+
+    def _get_buyers_final_data(self, buyer_id=None):
+        """Organize sold contracts by buyer for the buyer's final report."""
+        self.ensure_one()
+        index = self._get_final_report_index(*self._get_report_date_bounds())
         buyers_data = []
-        
-        for buyer in sold_contracts.mapped('buyer_id'):
-            contracts = sold_contracts.filtered(lambda c: c.buyer_id == buyer)
-            buyer_numbers = contracts.mapped('buyer_number')
-            for buyer_number in buyer_numbers:
-                contract_by_buyer_number = contracts.filtered(lambda c: c.buyer_number == buyer_number)
-                contracts_data = []
-                for contract in contract_by_buyer_number:
-                    contracts_data.append({
-                        'lot_number': str(contract.lot_number or ''),
-                        'state': contract.state_of_nearest_town.code,
-                        'head1': int(contract.head1 or 0),
-                        'kind1': str(contract.kind1.name if contract.kind1 else ''),
-                        'weight1': float(contract.weight1 or 0.0),
-                        'price1': float(contract.sold_price or 0.0),
-                        'head2': int(contract.head2 or 0),
-                        'kind2': str(contract.kind2.name if contract.kind2 else ''),
-                        'weight2': float(contract.weight2 or 0.0),
-                        'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
-                        'delivery_date_range': contract.delivery_date_range or '',
-                        'delivery_date_start': contract.delivery_date_start,
-                        'delivery_date_end': contract.delivery_date_end,
-                        'part_payment': float(contract.buyer_part_payment or 0.0)
-                    })
-                
-                total_head = sum((c.get('head1', 0) or 0) + (c.get('head2', 0) or 0) for c in contracts_data)
-                total_part_payment = sum(c.get('part_payment', 0.0) or 0.0 for c in contracts_data)
-                
+        for buyer, numbers in index['buyers'].items():
+            if buyer_id and buyer.id != buyer_id:
+                continue
+            for buyer_number, contracts in numbers.items():
+                contracts_data = [
+                    self._get_final_contract_data(
+                        contract,
+                        int(contract.head1 or 0),
+                        int(contract.head2 or 0),
+                        float(contract.buyer_part_payment or 0.0),
+                    )
+                    for contract in contracts
+                ]
                 buyers_data.append({
                     'buyer': buyer,
                     'buyer_number': buyer_number,
                     'contracts': contracts_data,
-                    'total_head': total_head,
-                    'total_part_payment': total_part_payment
+                    'total_head': sum(c['head1'] + c['head2'] for c in contracts_data),
+                    'total_part_payment': sum(c['part_payment'] for c in contracts_data)
                 })
-        
         return sorted(buyers_data, key=lambda x: x['buyer'].name or '')
 
     def _get_sellers_recap_data(self, seller_id=None):
         """Organize sold contracts by seller and lien holder for the seller's final report."""
         self.ensure_one()
-        date_from = self.env.context.get('date_from')
-        date_to = self.env.context.get('date_to')
-        
-        # Get all sold contracts
-        sold_contracts = self.sold_contracts_ids
-        
-        # Filter by date if specified
-        if date_from:
-            if isinstance(date_from, str):
-                date_from = fields.Date.from_string(date_from)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date >= date_from)
-
-        if date_to:
-            if isinstance(date_to, str):
-                date_to = fields.Date.from_string(date_to)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date <= date_to)
-
+        index = self._get_final_report_index(*self._get_report_date_bounds())
         sellers_data = []
-        sold_contracts = sold_contracts.sorted(lambda c: (c.lot_number or 0))
-        
-        # Helper function to get seller data from contract or addendum
-        def get_contract_seller_data(contract, addendum=None):
-            if addendum:
-                return {
-                    'seller_id': addendum.seller_id,
-                    'lien_holder_id': addendum.lien_holder_id,
-                    'head1': int(addendum.head_count) if addendum.head_count else 0,
-                    'head2': 0,
-                    'part_payment': float(addendum.part_payment or 0.0)
-                }
-            return {
-                'seller_id': contract.seller_id,
-                'lien_holder_id': contract.lien_holder_id,
-                'head1': int(contract.head1) if contract.head1 else 0,
-                'head2': int(contract.head2) if contract.head2 else 0,
-                'part_payment': float(contract.seller_part_payment or 0.0)
-            }
-
-        # Build a list of all seller entries (from contracts and addendums)
-        seller_entries = []
-        for contract in sold_contracts:
-            if contract.addendum_ids:
-                # Add an entry for each addendum
-                for addendum in contract.addendum_ids:
-                    seller_data = get_contract_seller_data(contract, addendum)
-                    seller_entries.append((contract, seller_data))
-            else:
-                # Add an entry for the contract
-                seller_data = get_contract_seller_data(contract)
-                seller_entries.append((contract, seller_data))
-
-        # Filter by seller_id if specified
-        if seller_id:
-            seller_entries = [
-                entry for entry in seller_entries 
-                if entry[1]['seller_id'].id == seller_id
-            ]
-
-        # Group by seller and lien holder
-        seller_groups = {}
-        for contract, seller_data in seller_entries:
-            seller = seller_data['seller_id']
-            lien_holder = seller_data['lien_holder_id']
-            
-            if seller not in seller_groups:
-                seller_groups[seller] = {}
-            if lien_holder not in seller_groups[seller]:
-                seller_groups[seller][lien_holder] = []
-            
-            contract_data = {
-                'lot_number': str(contract.lot_number or ''),
-                'state': contract.state_of_nearest_town.code,
-                'head1': seller_data['head1'],
-                'kind1': str(contract.kind1.name if contract.kind1 else ''),
-                'weight1': float(contract.weight1 or 0.0),
-                'price1': float(contract.sold_price or 0.0),
-                'head2': seller_data['head2'],
-                'kind2': str(contract.kind2.name if contract.kind2 else ''),
-                'weight2': float(contract.weight2 or 0.0),
-                'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
-                'delivery_date_range': contract.delivery_date_range or '',
-                'delivery_date_start': contract.delivery_date_start,
-                'delivery_date_end': contract.delivery_date_end,
-                'part_payment': seller_data['part_payment']
-            }
-            seller_groups[seller][lien_holder].append(contract_data)
-
-        # Build final sellers_data structure
-        for seller, lien_holder_groups in seller_groups.items():
+        for seller, lien_holder_groups in index['sellers'].items():
+            if seller_id and seller.id != seller_id:
+                continue
             lien_holder_data = []
-            seller_total_head = 0
-            seller_total_part_payment = 0.0
-            
-            for lien_holder, contracts in lien_holder_groups.items():
-                total_head = sum((c['head1'] or 0) + (c['head2'] or 0) for c in contracts)
-                total_part_payment = sum(c['part_payment'] or 0.0 for c in contracts)
-                
-                seller_total_head += total_head
-                seller_total_part_payment += total_part_payment
-                
+            for lien_holder, entries in lien_holder_groups.items():
+                contracts = [
+                    self._get_final_contract_data(
+                        contract, seller_vals['head1'], seller_vals['head2'], seller_vals['part_payment'])
+                    for contract, seller_vals in entries
+                ]
                 lien_holder_data.append({
                     'lien_holder': lien_holder,
                     'contracts': sorted(contracts, key=lambda x: x['lot_number']),
-                    'total_head': total_head,
-                    'total_part_payment': total_part_payment
+                    'total_head': sum(c['head1'] + c['head2'] for c in contracts),
+                    'total_part_payment': sum(c['part_payment'] for c in contracts)
                 })
-            
             sellers_data.append({
                 'seller': seller,
                 'lien_holder_groups': sorted(
@@ -330,136 +345,46 @@ class SaleAuction(models.Model):
                     # Put None/False lien holders first, then sort by name
                     key=lambda x: (x['lien_holder'] is not None, x['lien_holder'].name if x['lien_holder'] else '')
                 ),
-                'total_head': seller_total_head,
-                'total_part_payment': seller_total_part_payment
+                'total_head': sum(group['total_head'] for group in lien_holder_data),
+                'total_part_payment': sum(group['total_part_payment'] for group in lien_holder_data)
             })
-
         return sorted(sellers_data, key=lambda x: x['seller'].name or '')
-    
-    def get_all_reps_recap_final_data(self):
-        _logger = logging.getLogger(__name__)
-        # Get all unique rep IDs from all contracts
-        rep_ids = self.sold_contracts_ids.mapped('rep_ids.rep_id').ids
-        # Get the rep partner record directly
-        rep_partners = self.env['res.partner'].browse(rep_ids)
+
+    def _get_reps_data(self, index, rep_partners=None):
+        """Rep recap entries from a final report index, optionally limited to rep_partners."""
+        state_labels = dict(self.env['consignment.contract']._fields['state'].selection)
         reps_data = []
-        for rep_partner in rep_partners:
-            _logger.info(f"Processing rep: {rep_partner.name}")
-            
-            # Find all rep records for this rep_id
-            rep_records = self.env['res.rep'].search([
-                ('rep_id', '=', rep_partner.id),
-                ('contract_id', 'in', self.sold_contracts_ids.ids),
-                ('active', '=', True)
-            ])
-            _logger.info(f"Found {len(rep_records)} rep records")
-            
-            # Get the contracts through the rep records
-            sold_contracts = rep_records.mapped('contract_id')
-            
-            sold_contracts = sold_contracts.sorted(lambda c: c.lot_number or 0)
-            _logger.info(f"Found {len(sold_contracts)} contracts for rep")
-            
-            contracts_data = []
-            for contract in sold_contracts:
-                contract_data = {
-                    'lot_number': contract.lot_number,
-                    'seller': contract.seller_id.name,
-                    'state': dict(contract._fields['state'].selection).get(contract.state),
-                    'buyer': contract.buyer_id.name,
-                    'head1': contract.head1 or 0,
-                    'price': contract.sold_price,
-                    'head2': contract.head2 or 0,
-                    'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
-                    'delivery_date_range': contract.delivery_date_range,
-                    'delivery_date_start': contract.delivery_date_start,
-                    'delivery_date_end': contract.delivery_date_end,
-                }
-                _logger.info(f"Added contract data: {contract_data}")
-                contracts_data.append(contract_data)
-            
-            # Calculate total head count
-            total_head = sum(c['head1'] + c['head2'] for c in contracts_data)
-            
-            # Always return a list with a single rep's data
+        for rep_partner, contracts in index['reps'].items():
+            if rep_partners is not None and rep_partner not in rep_partners:
+                continue
+            contracts_data = [self._get_rep_contract_data(contract, state_labels) for contract in contracts]
             reps_data.append({
                 'rep': rep_partner,
                 'contracts': contracts_data,
-                'total_head': total_head,
+                'total_head': sum(c['head1'] + c['head2'] for c in contracts_data),
             })
-        
         return reps_data
 
+    def get_all_reps_recap_final_data(self):
+        """Rep recap of every rep of the auction's sold contracts."""
+        self.ensure_one()
+        return self._get_reps_data(self._get_final_report_index())
 
     def _get_rep_recap_data(self, rep_id=None):
         """Organize sold contracts by rep for the rep's final report."""
         self.ensure_one()
-        _logger = logging.getLogger(__name__)
-        date_from = self.env.context.get('date_from')
-        date_to = self.env.context.get('date_to')
-
         if not rep_id:
             return self.get_all_reps_recap_final_data()
-            # return []
-        
-        # Get the rep partner record directly
+
         rep_partner = self.env['res.partner'].browse(rep_id)
         if not rep_partner.exists():
             return []
-        
-        _logger.info(f"Processing rep: {rep_partner.name}")
-        
-        # Find all rep records for this rep_id
-        rep_records = self.env['res.rep'].search([
-            ('rep_id', '=', rep_id),
-            ('contract_id', 'in', self.sold_contracts_ids.ids),
-            ('active', '=', True)
-        ])
-        _logger.info(f"Found {len(rep_records)} rep records")
-        
-        # Get the contracts through the rep records
-        sold_contracts = rep_records.mapped('contract_id')
-        
-        # Filter by date if specified
-        if date_from:
-            if isinstance(date_from, str):
-                date_from = fields.Date.from_string(date_from)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date >= date_from)
-
-        if date_to:
-            if isinstance(date_to, str):
-                date_to = fields.Date.from_string(date_to)
-            sold_contracts = sold_contracts.filtered(lambda c: c.sold_date and c.sold_date <= date_to)
-
-        sold_contracts = sold_contracts.sorted(lambda c: c.lot_number or 0)
-        _logger.info(f"Found {len(sold_contracts)} contracts for rep")
-        
-        contracts_data = []
-        for contract in sold_contracts:
-            contract_data = {
-                'lot_number': contract.lot_number,
-                'seller': contract.seller_id.name,
-                'state': dict(contract._fields['state'].selection).get(contract.state),
-                'buyer': contract.buyer_id.name,
-                'head1': contract.head1 or 0,
-                'price': contract.sold_price,
-                'head2': contract.head2 or 0,
-                'price2': float((contract.sold_price - contract.price_back) if contract.price_back else 0.0),
-                'delivery_date_range': contract.delivery_date_range,
-                'delivery_date_start': contract.delivery_date_start,
-                'delivery_date_end': contract.delivery_date_end,
-            }
-            _logger.info(f"Added contract data: {contract_data}")
-            contracts_data.append(contract_data)
-        
-        # Calculate total head count
-        total_head = sum(c['head1'] + c['head2'] for c in contracts_data)
-        
+        index = self._get_final_report_index(*self._get_report_date_bounds())
         # Always return a list with a single rep's data
-        return [{
+        return self._get_reps_data(index, rep_partner) or [{
             'rep': rep_partner,
-            'contracts': contracts_data,
-            'total_head': total_head,
+            'contracts': [],
+            'total_head': 0,
         }]
 
     def action_export_buyers_final(self):
@@ -628,6 +553,7 @@ class SaleAuction(models.Model):
         Email = self.env['auction.report.email']
         partners = self._get_partners_for_report_type(report_type)
 
+        email_ids_to_send = []
         for partner in partners:
             email = Email.search([
                 ('auction_id', '=', self.id),
@@ -652,9 +578,10 @@ class SaleAuction(models.Model):
             email_to = (email.email_to or '').strip() or (partner.email or '').strip()
             if not email_to:
                 email.write({'state': 'no_email', 'error_message': _('Missing partner email')})
-                email.env.cr.commit()
                 continue
-            email.action_send_single()
+            email_ids_to_send.append(email.id)
+
+        Email.send_in_background(email_ids_to_send)
 
         action = self.env.ref('liveag_consignment.action_auction_report_email').read()[0]
         action['domain'] = [('auction_id', '=', self.id)]
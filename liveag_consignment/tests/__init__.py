@@ -0,0 +1,4 @@
+# Copyright © 2026 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from . import test_auction_report_email
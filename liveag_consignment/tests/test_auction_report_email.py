@@ -0,0 +1,122 @@
+# Copyright © 2026 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import common
+
+from odoo.addons.liveag_consignment.models.auction_report_email import DEFAULT_MAX_ATTEMPTS
+from odoo.addons.liveag_consignment.tools.smtp_sink import SMTPSink
+
+
+class AuctionReportEmailQueueTestCase(common.TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.sink = SMTPSink().start()
+        cls.addClassCleanup(cls.sink.stop)
+        cls.env['ir.mail_server'].create({
+            'name': 'SMTP Sink',
+            'smtp_host': cls.sink.host,
+            'smtp_port': cls.sink.port,
+            'smtp_encryption': 'none',
+            'sequence': 0,
+        })
+        cls.auction = cls.env['sale.auction'].create({'name': 'Queue Test Auction'})
+        cls.buyers = cls.env['res.partner'].create([
+            {'name': f'Queue Buyer {index}', 'email': f'queue.buyer{index}@example.com'}
+            for index in range(3)
+        ])
+        cls.emails = cls.env['auction.report.email'].create([{
+            'auction_id': cls.auction.id,
+            'partner_id': buyer.id,
+            'report_type': 'buyer_report',
+            'email_to': buyer.email,
+        } for buyer in cls.buyers])
+        # Cached report PDFs, so the queue does not depend on wkhtmltopdf
+        for email in cls.emails:
+            email._store_report_pdf(b'%PDF-1.4 queue test', email._get_render_job()[2])
+
+    def setUp(self):
+        super().setUp()
+        self.sink.clear()
+        self.sink.fail_next(0)
+        # Odoo skips SMTP in test mode; let the mails reach the sink
+        patcher = patch.object(type(self.env['ir.mail_server']), '_is_test_mode', lambda self: False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_queue(self):
+        self.env['auction.report.email']._cron_process_queue()
+        self.env.invalidate_all()
+
+    def test_queue_sends_every_email(self):
+        self.env['auction.report.email'].send_in_background(self.emails.ids)
+        self.assertEqual(set(self.emails.mapped('state')), {'queued'})
+        self._run_queue()
+        self.assertEqual(set(self.emails.mapped('state')), {'sent'})
+        self.assertEqual(self.emails.mapped('attempt_count'), [1, 1, 1])
+        self.assertEqual(
+            sorted(envelope['to'][0] for envelope in self.sink.envelopes),
+            sorted(self.buyers.mapped('email')),
+        )
+        self.assertEqual(self.auction.report_email_sent_count, 3)
+        self.assertEqual(self.auction.report_email_pending_count, 0)
+        self.assertEqual(self.auction.report_email_progress, 100)
+
+    def test_queue_retries_temporary_failure(self):
+        email = self.emails[0]
+        self.env['auction.report.email'].send_in_background(email.ids)
+        self.sink.fail_next()
+        self._run_queue()
+        self.assertEqual(email.state, 'queued')
+        self.assertEqual(email.attempt_count, 1)
+        self.assertTrue(email.error_message)
+        self.assertGreater(email.next_attempt_at, fields.Datetime.now())
+        self.assertFalse(self.sink.messages)
+        # Not due yet: the backoff keeps it in the queue
+        self._run_queue()
+        self.assertEqual(email.attempt_count, 1)
+
+        email.next_attempt_at = fields.Datetime.now() - timedelta(seconds=1)
+        self._run_queue()
+        self.assertEqual(email.state, 'sent')
+        self.assertEqual(email.attempt_count, 2)
+        self.assertEqual(len(self.sink.messages), 1)
+
+    def test_queue_gives_up_after_max_attempts(self):
+        email = self.emails[0]
+        self.env['auction.report.email'].send_in_background(email.ids)
+        self.sink.fail_next(DEFAULT_MAX_ATTEMPTS)
+        for _attempt in range(DEFAULT_MAX_ATTEMPTS):
+            email.next_attempt_at = fields.Datetime.now() - timedelta(seconds=1)
+            self._run_queue()
+        self.assertEqual(email.state, 'failed')
+        self.assertEqual(email.attempt_count, DEFAULT_MAX_ATTEMPTS)
+        self.assertFalse(self.sink.messages)
+
+    def test_expired_claim_is_reclaimed_then_failed(self):
+        email, crashing = self.emails[0], self.emails[1]
+        past = fields.Datetime.now() - timedelta(seconds=1)
+        # Worker died mid-send: lease expired with attempts left, and with none left
+        email.write({'state': 'sending', 'attempt_count': 1, 'next_attempt_at': past})
+        crashing.write({'state': 'sending', 'attempt_count': DEFAULT_MAX_ATTEMPTS, 'next_attempt_at': past})
+        self._run_queue()
+        self.assertEqual(email.state, 'sent')
+        self.assertEqual(email.attempt_count, 2)
+        self.assertEqual(crashing.state, 'failed')
+        self.assertEqual(len(self.sink.messages), 1)
+
+    def test_send_in_background_skips_emails_in_flight(self):
+        sending, sent = self.emails[0], self.emails[1]
+        lease = fields.Datetime.now() + timedelta(minutes=10)
+        sending.write({'state': 'sending', 'attempt_count': 1, 'next_attempt_at': lease})
+        sent.write({'state': 'sent'})
+        self.env['auction.report.email'].send_in_background(self.emails.ids)
+        self.assertEqual(sending.state, 'sending')
+        self.assertEqual(sending.next_attempt_at, lease)
+        self.assertEqual(sent.state, 'sent')
+        self.assertEqual(self.emails[2].state, 'queued')
@@ -0,0 +1,160 @@
+# Copyright © 2026 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+"""
+Local SMTP stand-in for tests and development.
+
+Accepts plain SMTP on localhost and keeps every message in memory instead of
+delivering it. Point an outgoing mail server (no encryption, no auth) at it to
+exercise the auction report email queue without a real relay:
+
+    sink = SMTPSink().start()
+    ...  # ir.mail_server with smtp_host=sink.host, smtp_port=sink.port
+    sink.messages  # [email.message.EmailMessage, ...]
+    sink.stop()
+
+fail_next(n) makes the next n messages fail with a temporary 451 error to
+test retries. It can also run standalone: python smtp_sink.py --port 2525
+"""
+
+import email
+import email.policy
+import logging
+import socketserver
+import threading
+
+_logger = logging.getLogger(__name__)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        sink = self.server.sink
+        envelope = {'from': None, 'to': []}
+        self._reply('220 localhost SMTP sink ready')
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            command, _sep, arg = raw.decode('utf-8', 'replace').strip().partition(' ')
+            command = command.upper()
+            if command == 'EHLO':
+                self._reply('250-localhost')
+                self._reply('250 8BITMIME')
+            elif command == 'HELO':
+                self._reply('250 localhost')
+            elif command == 'MAIL':
+                envelope = {'from': arg.partition(':')[2].strip(' <>'), 'to': []}
+                self._reply('250 OK')
+            elif command == 'RCPT':
+                envelope['to'].append(arg.partition(':')[2].strip(' <>'))
+                self._reply('250 OK')
+            elif command == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(line[1:] if line.startswith(b'..') else line)
+                if sink._take_failure():
+                    self._reply('451 Temporary failure (SMTP sink)')
+                else:
+                    sink._store(envelope, b''.join(lines))
+                    self._reply('250 OK: queued')
+                envelope = {'from': None, 'to': []}
+            elif command == 'RSET':
+                envelope = {'from': None, 'to': []}
+                self._reply('250 OK')
+            elif command == 'NOOP':
+                self._reply('250 OK')
+            elif command == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+
+class _ThreadingSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """In-memory SMTP server on localhost; see the module docstring."""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.host = host
+        self.port = port
+        self.messages = []
+        self.envelopes = []
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        self._server = _ThreadingSMTPServer((self.host, self.port), _SMTPHandler)
+        self._server.sink = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='smtp_sink', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def fail_next(self, count=1):
+        """Answer the next count messages with a temporary 451 error."""
+        with self._lock:
+            self._failures = count
+
+    def clear(self):
+        with self._lock:
+            self.messages.clear()
+            self.envelopes.clear()
+
+    def _take_failure(self):
+        with self._lock:
+            if self._failures > 0:
+                self._failures -= 1
+                return True
+            return False
+
+    def _store(self, envelope, data):
+        message = email.message_from_bytes(data, policy=email.policy.default)
+        with self._lock:
+            self.messages.append(message)
+            self.envelopes.append(envelope)
+        _logger.info('SMTP sink received %r for %s', message['Subject'], ', '.join(envelope['to']))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Local SMTP stand-in that prints received messages.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2525)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with SMTPSink(args.host, args.port) as sink:
+        print(f'SMTP sink listening on {sink.host}:{sink.port}')
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -76,9 +76,7 @@ class BuyerEmailSendWizard(models.TransientModel):
                 })
             email_ids_to_send.append(email.id)
 
-        # Ensure queue records are visible to the background thread
-        self.env.cr.commit()
-        # Run sending in background
+        # Queue the emails; the report email cron sends them once this transaction commits
         if email_ids_to_send:
             self.env['auction.report.email'].send_in_background(email_ids_to_send)
 
@@ -78,8 +78,7 @@ class SellerEmailSendWizard(models.TransientModel):
                 })
             email_ids_to_send.append(email.id)
 
-        # Ensure queue records are committed before background start
-        self.env.cr.commit()
+        # Queue the emails; the report email cron sends them once this transaction commits
         if email_ids_to_send:
             self.env['auction.report.email'].send_in_background(email_ids_to_send)
 
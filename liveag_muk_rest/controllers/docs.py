@@ -8,9 +8,7 @@ from odoo.tools import config, misc
 from odoo.modules.module import get_resource_from_path
 from odoo.http import Controller, Response, request, route
 
-from odoo.addons.liveag_muk_rest.core.http import get_controllers
 from odoo.addons.liveag_muk_rest.tools import common
-from odoo.addons.liveag_muk_rest.tools import docs
 
 
 class DocsController(Controller):
@@ -38,15 +36,13 @@ class DocsController(Controller):
                 request.redirect('/web/login?error=access', 303)
             )
 
-    def _get_api_docs(self):
-        rest_docs = docs.generate_docs(
-            self._get_base_url(), get_controllers()
+    def _get_api_docs_document(self):
+        return request.env['muk_rest.endpoint'].sudo()._get_docs_document(
+            self._get_base_url()
         )
-        paths, components = request.env['liveag_muk_rest.endpoint'].get_docs()
-        if paths:
-            rest_docs['paths'].update(paths)
-            rest_docs['components']['schemas'].update(components)
-        return rest_docs
+
+    def _get_api_docs(self):
+        return json.loads(self._get_api_docs_document()[0])
     
     #----------------------------------------------------------
     # Routes
@@ -80,7 +76,19 @@ class DocsController(Controller):
     )
     def docs_json(self, **kw):
         self._ensure_docs_access()
-        return request.make_json_response(self._get_api_docs())
+        body, gzipped, version = self._get_api_docs_document()
+        headers = [
+            ('ETag', '"{}"'.format(version)),
+            ('Cache-Control', 'private, no-cache'),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if request.httprequest.if_none_match.contains(version):
+            return Response(status=304, headers=headers)
+        headers.append(('Content-Type', 'application/json'))
+        if 'gzip' in request.httprequest.accept_encodings:
+            headers.append(('Content-Encoding', 'gzip'))
+            body = gzipped
+        return Response(body, headers=headers)
 
     @route(
         route='/rest/docs/oauth2/redirect',
@@ -107,9 +115,8 @@ class DocsController(Controller):
     def docs_client(self, language='python', options=None, **kw):
         self._ensure_docs_access()
         server_url = self._get_base_url()
-        rest_docs = json.dumps(self._get_api_docs())
         attachment = request.env['ir.attachment'].sudo().create({
-            'name': 'rest_api_docs.json', 'raw': rest_docs.encode(),
+            'name': 'rest_api_docs.json', 'raw': self._get_api_docs_document()[0],
         })
         try:
             attachment.generate_access_token()
@@ -121,6 +121,26 @@ class AccessRule(models.Model):
                     rule, sort_keys=True, indent=4
                 )
 
+    # ----------------------------------------------------------
+    # ORM
+    # ----------------------------------------------------------
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
 
 class AccessRuleExpression(models.Model):
     
@@ -202,3 +222,23 @@ class AccessRuleExpression(models.Model):
                 record.expression = None
             else:
                 record.expression = record.expression
+
+    # ----------------------------------------------------------
+    # ORM
+    # ----------------------------------------------------------
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
@@ -1,4 +1,7 @@
+import gzip
+import json
 import base64
+import hashlib
 import logging
 import dateutil
 import textwrap
@@ -10,11 +13,13 @@ from odoo import tools, models, api, fields, _
 from odoo.exceptions import ValidationError
 from odoo.tools import DEFAULT_SERVER_DATE_FORMAT
 from odoo.tools import DEFAULT_SERVER_DATETIME_FORMAT
-from odoo.tools.safe_eval import safe_eval, test_python_expr
+from odoo.tools.safe_eval import test_python_expr
 from odoo.tools.safe_eval import datetime, time, dateutil
 
+from odoo.addons.liveag_muk_rest.core.http import get_controllers
 from odoo.addons.liveag_muk_rest.tools import common, docs
 from odoo.addons.liveag_muk_rest.tools.safe_eval import responses, exceptions
+from odoo.addons.liveag_muk_rest.tools.safe_eval import compile_expr, eval_compiled
 
 
 class Endpoint(models.Model):
@@ -113,6 +118,23 @@ class Endpoint(models.Model):
         default=True,
         help="If checked the result is wrapped with meta information.",
     )
+
+    count_mode = fields.Selection(
+        selection=[
+            ('exact', "Exact"),
+            ('window', "Windowed"),
+            ('none', "None"),
+        ],
+        string="Count",
+        required=True,
+        default='exact',
+        help=textwrap.dedent("""\
+            Defines how the count of a wrapped domain response is computed.
+            - Exact: counts all matching records.
+            - Windowed: counts at most up to the next page, enough to know if there is more.
+            - None: no count is returned.
+        """)
+    )
     
     action_id = fields.Many2one(
         comodel_name='ir.actions.server', 
@@ -319,20 +341,42 @@ class Endpoint(models.Model):
             ),
         }
         
+    @tools.ormcache('self.id', 'self.write_date')
+    def _get_compiled_domain(self):
+        return compile_expr(self.domain or '[]', filename=f'muk_rest.endpoint({self.id}).domain')
+
+    @tools.ormcache('self.id', 'self.write_date')
+    def _get_compiled_code(self):
+        return compile_expr(self.code, mode='exec', filename=f'muk_rest.endpoint({self.id}).code')
+
+    def _count_domain(self, model, domain, result, limit, offset):
+        if self.count_mode == 'none':
+            return None
+        offset = offset or 0
+        if not limit or len(result) < limit:
+            # The page is the tail of the result set
+            if result or not offset:
+                return offset + len(result)
+        if self.count_mode == 'window' and limit:
+            return model.search_count(domain, limit=offset + limit + 1)
+        return model.search_count(domain)
+
     def _evaluate_domain(self, request, user):
         model_with_user = self.env[self.model_id.model].with_user(user)
         model = model_with_user.sudo() if self.eval_sudo else model_with_user   
         fields = self.domain_field_ids.mapped('name') or None
-        domain = safe_eval(self.domain or '[]', {
+        domain = eval_compiled(self._get_compiled_domain(), {
             'datetime': datetime, 'uid': user.id,
         })
         limit = request.params.get('limit', None)
         offset = request.params.get('offset', None)
+        limit = limit and int(limit) or None
+        offset = offset and int(offset) or None
         result = model.search_read(
             domain,
             fields=fields,
-            limit=limit and int(limit) or None,
-            offset=offset and int(offset) or None,
+            limit=limit,
+            offset=offset,
         )
         if self.wrap_response:
             return request.make_json_response({
@@ -340,10 +384,10 @@ class Endpoint(models.Model):
                 'model': model._name,
                 'domain': domain,
                 'fields': fields,
-                'limit': limit and int(limit) or None,
-                'offset': offset and int(offset) or None,
+                'limit': limit,
+                'offset': offset,
                 'result': result,
-                'count': model.search_count(domain),
+                'count': self._count_domain(model, domain, result, limit, offset),
             })
         return request.make_json_response(result)
 
@@ -369,7 +413,7 @@ class Endpoint(models.Model):
         model_with_user = self.env[self.model_id.model].with_user(user)
         model = model_with_user.sudo() if self.eval_sudo else model_with_user
         eval_context = self._get_eval_context(request, model)
-        safe_eval(self.code.strip(), eval_context, mode="exec", nocopy=True)   
+        eval_compiled(self._get_compiled_code(), eval_context)
         if eval_context.get('result', False):
             return request.make_json_response({
                 'endpoint': self.route, 
@@ -381,6 +425,26 @@ class Endpoint(models.Model):
             return eval_context['response']
         return request.make_json_response(True)
 
+    # ----------------------------------------------------------
+    # ORM
+    # ----------------------------------------------------------
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
     # ----------------------------------------------------------
     # Actions
     # ----------------------------------------------------------
@@ -444,6 +508,21 @@ class Endpoint(models.Model):
             custom_component.update(common.parse_value(endpoint.docs_components, {}))
         return custom_paths, custom_component
 
+    @api.model
+    @tools.ormcache('base_url')
+    def _get_docs_document(self, base_url):
+        """ 
+        The OpenAPI document as (body, gzipped body, version hash), built once per
+        registry and base URL. Changing an endpoint clears the cache.
+        """
+        rest_docs = docs.generate_docs(base_url, get_controllers())
+        paths, components = self.get_docs()
+        if paths:
+            rest_docs['paths'].update(paths)
+            rest_docs['components']['schemas'].update(components)
+        body = json.dumps(rest_docs).encode()
+        return body, gzip.compress(body), hashlib.sha1(body).hexdigest()
+
     def evaluate(self, request, user):
         self.ensure_one()
         if hasattr(self, '_evaluate_{}'.format(self.state)):
@@ -3,12 +3,11 @@ import werkzeug
 import contextlib
 
 from odoo import api, models, tools, SUPERUSER_ID
-from odoo.tools import ustr, mute_logger
-from odoo.http import request
-from odoo.sql_db import db_connect
+from odoo.tools import ustr
+from odoo.http import request, Response
 
 from odoo.addons.liveag_muk_rest.core import http
-from odoo.addons.liveag_muk_rest.tools import common, encoder
+from odoo.addons.liveag_muk_rest.tools import common, encoder, logging
 
 
 class IrHttp(models.AbstractModel):
@@ -56,48 +55,58 @@ class IrHttp(models.AbstractModel):
     # Logging
     #----------------------------------------------------------
 
+    @classmethod
+    def _rest_logging_values(cls, response, capture):
+        status = getattr(response, 'status_code', None)
+        values = {
+            'user_id': request.session.uid,
+            'url': request.httprequest.base_url,
+            'ip_address': request.httprequest.remote_addr,
+            'method': request.httprequest.method,
+            'status': status,
+        }
+        if capture == logging.CAPTURE_NONE:
+            return values
+        headers = '\r\n'.join([
+            '{}: {}'.format(
+                key, 'authorization' in key.lower() and '***' or value
+            )
+            for key, value in request.httprequest.headers.to_wsgi_list()
+        ])
+        response_headers = ustr(getattr(response, 'headers', ''))
+        if capture == logging.CAPTURE_HEADERS:
+            values.update({'request': headers, 'response': response_headers})
+            return values
+        values['request'] = '{}\r\n\r\n\r\n{}'.format(
+            headers, encoder.encode_request(request)
+        )
+        if isinstance(response, Response):
+            # Rendering is deferred to the writer, only the raw body is kept
+            data = None if response.is_streamed else response.get_data()
+            values['response'] = (response_headers, response.mimetype, data)
+        else:
+            values['response'] = '{}\r\n{}'.format(
+                response_headers, encoder.encode_response(response)
+            )
+        return values
+
     @classmethod
     def _rest_logging(cls, endpoint, response):
         if (
-            tools.config.get('rest_logging', True) and 
-            not endpoint.routing.get('disable_logging', False)
-        ): 
-            with contextlib.suppress(Exception), mute_logger('odoo.sql_db'), db_connect(
-                request.session.db
-            ).cursor() as cr:
-                env = api.Environment(cr, SUPERUSER_ID, {})
-
-                def create_log(env, response):
-                    env['muk_rest.logging'].create({
-                        'user_id': request.session.uid,
-                        'url': request.httprequest.base_url,
-                        'ip_address': request.httprequest.remote_addr,
-                        'method': request.httprequest.method,
-                        'request': '{}\r\n\r\n\r\n{}'.format(
-                            '\r\n'.join([
-                                '{}: {}'.format(
-                                    key, 'authorization' in key.lower() and '***' or value
-                                )
-                                for key, value in request.httprequest.headers.to_wsgi_list()
-                            ]),
-                            encoder.encode_request(request)
-                        ),
-                        'status': getattr(response, 'status_code', None),
-                        'response': '{}\r\n{}'.format(
-                            ustr(getattr(response, 'headers', '')),
-                            encoder.encode_response(response)
-                        ),
-                    })
-                
-                if endpoint.routing.get('rest_custom', False):
-                    endpoint = env['muk_rest.endpoint'].search(
-                        [('endpoint', '=', request.params.get('endpoint'))], 
-                        limit=1
-                    )
-                    if not endpoint or endpoint.logging:
-                        create_log(env, response)
-                else:
-                    create_log(env, response)
+            not tools.config.get('rest_logging', True) or 
+            endpoint.routing.get('disable_logging', False) or
+            not logging.logging_sampled(getattr(response, 'status_code', None))
+        ):
+            return
+        with contextlib.suppress(Exception):
+            custom_endpoint = None
+            if endpoint.routing.get('rest_custom', False):
+                custom_endpoint = request.params.get('endpoint')
+            values = cls._rest_logging_values(response, logging.logging_capture())
+            if logging.logging_async():
+                logging.get_sink().push(request.session.db, values, custom_endpoint)
+            else:
+                logging.write_entries(request.session.db, [(values, custom_endpoint)])
 
     # ----------------------------------------------------------
     # Dispatch
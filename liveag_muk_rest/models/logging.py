@@ -1,4 +1,8 @@
+import zlib
+import base64
+
 from odoo import api, tools, fields, models
+from odoo.tools import SQL
 
 
 class RESTLogging(models.Model):
@@ -15,6 +19,7 @@ class RESTLogging(models.Model):
     user_id = fields.Many2one(
         comodel_name='res.users',
         string='User',
+        index=True,
     )
 
     ip_address = fields.Char(
@@ -22,7 +27,8 @@ class RESTLogging(models.Model):
     )
 
     url = fields.Char(
-        string="URL"
+        string="URL",
+        index=True,
     )
 
     method = fields.Char(
@@ -34,13 +40,80 @@ class RESTLogging(models.Model):
     )
 
     status = fields.Char(
-        string="Status"
+        string="Status",
+        index=True,
     )
     
     response = fields.Text(
         string="Response"
     )
 
+    request_compressed = fields.Binary(
+        string="Compressed Request",
+        attachment=False,
+    )
+
+    response_compressed = fields.Binary(
+        string="Compressed Response",
+        attachment=False,
+    )
+
+    request_text = fields.Text(
+        compute='_compute_request_text',
+        string="Request Content",
+    )
+
+    response_text = fields.Text(
+        compute='_compute_request_text',
+        string="Response Content",
+    )
+
+    _create_date_idx = models.Index('(create_date)')
+
+    # ----------------------------------------------------------
+    # Helper
+    # ----------------------------------------------------------
+
+    @api.model
+    def _compress_text(self, text):
+        return base64.b64encode(zlib.compress(text.encode(), 6))
+
+    @api.model
+    def _decompress_text(self, data):
+        return zlib.decompress(base64.b64decode(data)).decode(errors='replace')
+
+    # ----------------------------------------------------------
+    # Compute
+    # ----------------------------------------------------------
+
+    @api.depends('request', 'response', 'request_compressed', 'response_compressed')
+    def _compute_request_text(self):
+        for record in self:
+            record.request_text = (
+                self._decompress_text(record.request_compressed)
+                if record.request_compressed else record.request
+            )
+            record.response_text = (
+                self._decompress_text(record.response_compressed)
+                if record.response_compressed else record.response
+            )
+
+    # ----------------------------------------------------------
+    # ORM
+    # ----------------------------------------------------------
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        threshold = int(tools.config.get('rest_logging_compress_min', 2048))
+        if threshold:
+            for vals in vals_list:
+                for field in ('request', 'response'):
+                    text = vals.get(field)
+                    if text and len(text) > threshold:
+                        vals[f'{field}_compressed'] = self._compress_text(text)
+                        vals[field] = False
+        return super().create(vals_list)
+
     # ----------------------------------------------------------
     # Autovacuum
     # ----------------------------------------------------------
@@ -49,5 +122,22 @@ class RESTLogging(models.Model):
     def _autovacuum_logs(self):
         limit_days = int(tools.config.get('rest_logging_autovacuum', 30))
         limit_date = fields.Datetime.subtract(fields.Datetime.now(), days=limit_days)
-        self.search([('create_date', '<', limit_date)]).unlink()
-        
\ No newline at end of file
+        chunk_size = int(tools.config.get('rest_logging_vacuum_chunk', 10000))
+        # Delete in short committed chunks through the create_date index so
+        # the table is never locked for long and nothing is loaded into the ORM
+        while True:
+            self.env.cr.execute(SQL(
+                """
+                DELETE FROM muk_rest_logging WHERE id IN (
+                    SELECT id FROM muk_rest_logging
+                    WHERE create_date < %s
+                    LIMIT %s
+                )
+                """,
+                limit_date, chunk_size,
+            ))
+            deleted = self.env.cr.rowcount
+            self.env.cr.commit()
+            if deleted < chunk_size:
+                break
+        self.invalidate_model()
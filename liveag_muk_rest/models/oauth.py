@@ -2,11 +2,66 @@ import re
 import datetime
 import textwrap
 
-from odoo import models, fields, _
+from odoo import models, fields, tools, _
 from odoo.addons.liveag_muk_rest.tools.common import parse_value
 from odoo.addons.liveag_muk_rest.tools.http import build_route
 
 
+class CompiledRules:
+    """
+    Access rules of one OAuth client in evaluation order. Route patterns
+    and '#' expressions are precompiled, and the rules that apply to a
+    route are looked up once per route.
+    """
+
+    ROUTE_CACHE_SIZE = 1024
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.routes = frozenset(route for route, _pattern, _expressions in rules)
+        self._route_rules = {}
+
+    def rules_for_route(self, route):
+        applying = self._route_rules.get(route)
+        if applying is None:
+            if len(self._route_rules) >= self.ROUTE_CACHE_SIZE:
+                self._route_rules.clear()
+            applying = tuple(
+                expressions for _route, pattern, expressions in self.rules
+                if pattern.match(route)
+            )
+            self._route_rules[route] = applying
+        return applying
+
+    def check(self, route, params):
+        for expressions in self.rules_for_route(route):
+            if all(self._check_expression(expr, params) for expr in expressions):
+                return True
+        return False
+
+    @staticmethod
+    def _check_expression(expression, params):
+        operation, param, value = expression
+        if operation == '*':
+            return param in params
+        if operation == '!':
+            return param not in params
+        if param not in params:
+            return True
+        param_value = str(params[param])
+        if operation == '=':
+            return value == param_value
+        if operation == '!=':
+            return value != param_value
+        if operation == '%':
+            return value in param_value
+        if operation == '!%':
+            return value not in param_value
+        if operation == '#':
+            return bool(value.match(param_value))
+        return True
+
+
 class OAuth(models.Model):
     
     _name = 'muk_rest.oauth'
@@ -111,46 +166,29 @@ class OAuth(models.Model):
                 return True
         return False
 
+    @tools.ormcache('self.id')
+    def _get_compiled_rules(self):
+        """ Applied access rules of the client, compiled once and cached until a rule changes. """
+        rules = []
+        for rule in self.sudo().rule_ids.filtered('applied'):
+            expressions = []
+            for expr in parse_value(rule.rule, []):
+                operation, param = expr[0], str(expr[1])
+                value = str(expr[2]) if len(expr) > 2 else None
+                if operation == '#':
+                    value = re.compile(value)
+                expressions.append((operation, param, value))
+            rules.append((rule.route, re.compile(rule.route), tuple(expressions)))
+        return CompiledRules(rules)
+
+    def _get_rule_routes(self):
+        return self._get_compiled_rules().routes
+
     def _check_security(self, routing, params):
         main_route = routing['routes'][0] if routing.get('routes') else None
         if main_route == build_route('/custom/<path:endpoint>')[0]:
             main_route = routing.get('custom_route', False)
-        
-        def get_applying_rules(route, rules):
-            applying_rules = set()
-            for rule in rules.filtered('applied'):
-                if re.match(rule.route, route):
-                    applying_rules.add(rule.id)
-            return rules.browse(applying_rules)
-        
-        def check_rule(rule, params, cop, eop):
-            if not rule.rule:
-                return True
-            for expr in parse_value(rule.rule, []):
-                if expr[0] in cop and cop[expr[0]](str(expr[1]), params):
-                    return False
-                elif expr[0] in eop and expr[1] in params and \
-                        eop[expr[0]](str(params[expr[1]]), str(expr[2])):
-                    return False
-            return True
-            
-        rules = get_applying_rules(main_route, self.rule_ids) 
-        if rules:
-            check_operators = {
-                '*': lambda expr, params: expr not in params,
-                '!': lambda expr, params: expr in params,
-            }
-            eval_operators = {
-                '=': lambda val, expr: expr != val,
-                '!=': lambda val, expr: expr == val,
-                '%': lambda val, expr: expr not in val,
-                '!%': lambda val, expr: expr in val,
-                '#': lambda val, expr: not bool(re.match(expr, val)),
-            }
-            for rule in rules:
-                if check_rule(rule, params, check_operators, eval_operators):
-                    return True
-        return False
+        return self._get_compiled_rules().check(main_route, params)
 
     # ----------------------------------------------------------
     # Read
@@ -89,6 +89,18 @@ class CustomTestCase(RestfulCase):
         self.assertTrue(response)
         self.assertTrue(response.json())
         
+    @skip_check_authentication()
+    def test_domain_count_window(self):
+        client = self.authenticate()
+        self.domain_endpoint.write({'count_mode': 'window'})
+        self.env.flush_all()
+        response = client.get(self.url_prepare(self.domain_endpoint.route), data={'limit': 1})
+        self.assertTrue(response)
+        self.assertEqual(response.json()['count'], 2)
+        response = client.get(self.url_prepare(self.domain_endpoint.route), data={'offset': 5})
+        self.assertTrue(response)
+        self.assertEqual(response.json()['count'], 2)
+        
     @skip_check_authentication()
     def test_domain_demo(self):
         client = self.authenticate("demo", "demo")
@@ -2,5 +2,6 @@ from . import common
 from . import docs
 from . import encoder
 from . import http
+from . import logging
 from . import safe_eval
 from . import security
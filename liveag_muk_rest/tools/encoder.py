@@ -71,14 +71,18 @@ def encode_request(request):
     ))
     
             
+def encode_response_data(mimetype, data):
+    if mimetype == 'application/json':
+        return json.dumps(
+            json.loads(data), indent=4, 
+            cls=LogEncoder, default=lambda o: str(o)
+        )
+    return limit_text_size(ustr_sql(data))
+
+
 def encode_response(response):
     if isinstance(response, Response):
-        if response.mimetype == 'application/json':
-            return json.dumps(
-                json.loads(response.data), indent=4, 
-                cls=LogEncoder, default=lambda o: str(o)
-            )
-        return limit_text_size(ustr_sql(response.data))
+        return encode_response_data(response.mimetype, response.data)
     if isinstance(response, Exception):
         json.dumps(parse_exception(response), indent=4, default=lambda o: str(o))
     return limit_text_size(ustr_sql(response))
@@ -0,0 +1,194 @@
+import time
+import queue
+import random
+import atexit
+import logging
+import threading
+
+from collections import defaultdict
+
+from odoo import api, tools, SUPERUSER_ID
+from odoo.tools import mute_logger
+from odoo.sql_db import db_connect
+
+from odoo.addons.liveag_muk_rest.tools import encoder
+
+_logger = logging.getLogger(__name__)
+
+CAPTURE_FULL = 'full'
+CAPTURE_HEADERS = 'headers'
+CAPTURE_NONE = 'none'
+
+
+# ----------------------------------------------------------
+# Settings
+# ----------------------------------------------------------
+
+def logging_capture():
+    capture = tools.config.get('rest_logging_capture', CAPTURE_FULL)
+    if capture not in (CAPTURE_FULL, CAPTURE_HEADERS, CAPTURE_NONE):
+        return CAPTURE_FULL
+    return capture
+
+
+def logging_sampled(status):
+    """ Errors are always logged, successful calls according to the sample rate. """
+    if status and int(status) >= 400:
+        return True
+    rate = float(tools.config.get('rest_logging_sample_rate', 1.0))
+    return rate >= 1 or random.random() < rate
+
+
+def logging_async():
+    # Test requests share the test cursor, a background writer would block on it
+    return (
+        tools.config.get('rest_logging_async', True) and 
+        not getattr(threading.current_thread(), 'testing', False)
+    )
+
+
+# ----------------------------------------------------------
+# Entries
+# ----------------------------------------------------------
+
+def finalize_entry(values):
+    """ Renders the deferred response body of an entry into its final text. """
+    response = values.get('response')
+    if isinstance(response, tuple):
+        headers, mimetype, data = response
+        body = ''
+        if data is not None:
+            try:
+                body = encoder.encode_response_data(mimetype, data)
+            except Exception:
+                body = encoder.limit_text_size(encoder.ustr_sql(data))
+        values = dict(values, response='{}\r\n{}'.format(headers, body))
+    return values
+
+
+def write_entries(dbname, entries):
+    """ 
+    Inserts (values, custom_endpoint) entries with a single create call. Entries 
+    of custom endpoints which have logging disabled are skipped.
+    """
+    with mute_logger('odoo.sql_db'), db_connect(dbname).cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        custom_endpoints = {endpoint for _values, endpoint in entries if endpoint}
+        disabled = set()
+        if custom_endpoints:
+            disabled = set(env['muk_rest.endpoint'].search([
+                ('endpoint', 'in', list(custom_endpoints)),
+                ('logging', '=', False),
+            ]).mapped('endpoint'))
+        vals_list = [
+            finalize_entry(values) for values, endpoint in entries
+            if not endpoint or endpoint not in disabled
+        ]
+        if vals_list:
+            env['muk_rest.logging'].create(vals_list)
+
+
+# ----------------------------------------------------------
+# Sink
+# ----------------------------------------------------------
+
+class LogSink:
+    """
+    Write-behind buffer for REST logs. Entries are queued in memory and a
+    background thread bulk inserts them per database, either once the batch
+    size is reached or after the flush interval. When the queue is full new
+    entries are dropped and counted instead of blocking the request.
+    """
+
+    def __init__(self, queue_size=10000, batch_size=500, flush_seconds=2.0):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def push(self, dbname, values, custom_endpoint=None):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((dbname, values, custom_endpoint))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self):
+        """ Writes everything currently queued, used on shutdown. """
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        self._write(batch)
+
+    def _ensure_started(self):
+        # Started lazily so every prefork worker gets its own thread
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if not (self._thread and self._thread.is_alive()):
+                self._thread = threading.Thread(
+                    target=self._run, name='muk_rest.logging', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_seconds)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            _logger.warning("REST log queue full, dropped %s entries", dropped)
+        entries_by_db = defaultdict(list)
+        for dbname, values, custom_endpoint in batch:
+            entries_by_db[dbname].append((values, custom_endpoint))
+        for dbname, entries in entries_by_db.items():
+            try:
+                write_entries(dbname, entries)
+            except Exception:
+                _logger.exception("Failed to write %s REST log entries", len(entries))
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_sink():
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = LogSink(
+                    queue_size=int(tools.config.get('rest_logging_queue_size', 10000)),
+                    batch_size=int(tools.config.get('rest_logging_batch_size', 500)),
+                    flush_seconds=float(tools.config.get('rest_logging_flush_seconds', 2.0)),
+                )
+                atexit.register(_sink.flush)
+    return _sink
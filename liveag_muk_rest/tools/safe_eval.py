@@ -1,7 +1,12 @@
 import werkzeug
 
-from odoo.tools.safe_eval import wrap_module
+from psycopg2 import OperationalError
+
+from odoo.tools.safe_eval import (
+    wrap_module, test_expr, check_values, unsafe_eval, _SAFE_OPCODES, _BUILTINS
+)
 from odoo import exceptions
+from odoo.exceptions import RedirectWarning, UserError
 
 
 responses = wrap_module(werkzeug.exceptions, [
@@ -46,3 +51,28 @@ exceptions = wrap_module(exceptions, [
     'AccessError',
     'ValidationError',
 ])
+
+
+def compile_expr(expr, mode='eval', filename=None):
+    """
+    Validates expr like safe_eval does and returns the code object, so that
+    it can be cached and run several times with eval_compiled.
+    """
+    return test_expr(expr.strip(), _SAFE_OPCODES, mode=mode, filename=filename)
+
+
+def eval_compiled(code, globals_dict):
+    """
+    Runs a code object returned by compile_expr with the same restricted
+    builtins and context checks as safe_eval.
+    """
+    check_values(globals_dict)
+    globals_dict['__builtins__'] = dict(_BUILTINS)
+    try:
+        return unsafe_eval(code, globals_dict, None)
+    except (UserError, RedirectWarning, werkzeug.exceptions.HTTPException, OperationalError, ZeroDivisionError):
+        raise
+    except Exception as exc:
+        raise ValueError('{}: "{}" while evaluating\n{}'.format(
+            type(exc), exc, code.co_filename
+        ))
@@ -86,7 +86,8 @@ class OAuth1RequestValidator(RequestValidator):
         return token and consteq(token.oauth_id.consumer_key, client_key)
 
     def _retrieve_rule_routes(self, rules):
-        return rules.filtered('applied').mapped('route')
+        # Served from the compiled (cached) rule set of the client
+        return list(rules.oauth_id[:1]._get_rule_routes())
 
     # ----------------------------------------------------------
     # Validate
@@ -47,7 +47,8 @@ class OAuth2RequestValidator(RequestValidator):
         return obj and consteq(obj.oauth_id.client_id, client_key)
     
     def _retrieve_rule_routes(self, rules):
-        return rules.filtered('applied').mapped('route')
+        # Served from the compiled (cached) rule set of the client
+        return list(rules.oauth_id[:1]._get_rule_routes())
 
     # ----------------------------------------------------------
     # Validate